@@ -18,6 +18,7 @@ from prometey_customtkinter import *
 from prometey_cantera import *
 from prometey_tabl import *
 from prometey_graph_programm import *
+from prometey_mesh import build_mesh, to_stations
 
 file1 = None
 file2 = None
@@ -501,6 +502,7 @@ class Window_2(ctk.CTk):
         self.X, self.Y = save_coord_x_y(self.start_row_index, self.end_row_index,
                                         file1)  # Сохранение координат в массивы
         self.X, self.Y = filtred_array(self.X, self.Y)  # Фильтрация совпадающих значений
+        self.X, self.Y = build_mesh(self.X, self.Y, stations=(Q_L_RAMP_LENGTH,))  # Адаптивная сетка (MESH_MODE = "adaptive")
         self.T_st_g = [user.T_usl] * len(self.Y)  # Первичное заполнение массива температурой стенки условной
         self.c_p_T_st = [user.c_p_T_st] * len(
             self.Y)  # Первичное заполнение массива удельной теплоёмкости при температуре стенки условной
@@ -519,6 +521,9 @@ class Window_2(ctk.CTk):
                                  font=self.mono_font)
         textbox.pack(padx=10, pady=10)
 
+        # Число узлов расчётной сетки (при MESH_MODE = "adaptive" оно зависит от контура)
+        steps = np.diff(self.X) * 1000
+        textbox.insert("end", f"Узлов сетки: {len(self.number)}, шаг {min(steps):.2f}–{max(steps):.2f} мм\n")
         # Заголовки таблицы
         headers = ['№', 'X, мм', 'D, мм', 'D отн', 'F, мм²', 'F отн', 'Δx, мм', 'Δx_s, мм', 'ΔS, мм²']
         header_line = "{:<6}{:<10}{:<10}{:<10}{:<12}{:<10}{:<10}{:<12}{:<12}".format(*headers)
@@ -772,7 +777,7 @@ class Window_4(ctk.CTk):
                                                                                  user.result_dedal['p'],
                                                                                  user.result_dedal['k'], 1)
         self.q_l = find_q_l(user.eps_g, user.result_dedal['T'], user.result_ikar['phi_pr'], user.D_otn, user.number,
-                            user.Y)
+                            user.Y, user.X)
         self.q_sum = find_q_sum(self.q_kon, self.q_l)
         self.q_kon_proshl = (max(self.q_kon))
         self.q_kon, self.q_l, self.q_sum, self.X, self.betta, self.T_st_otn, self.lambd, self.S_1 = tabl_3(self.q_kon,
@@ -879,43 +884,7 @@ class Window_5(ctk.CTk):
         self.label1 = create_label(self.frame2, "Таблица 4", 20, 430)
 
     def raschet_temperatury(self):
-        if int(user.variant) == 1:
-            T_ohl, C_p_ohl, C_p_raznitsa, m_ohl_array = find_temp_slosh_tema(user.m_ohl_1, user.m_ohl_2,
-                                                                             user.index_peret_1, user.index_peret_2,
-                                                                             user.delta_S,
-                                                                             user.q_sum, user.number, user.p_ohl, user.a,
-                                                                             user.T_nach, user.cooler, user.T_aray,
-                                                                             user.p_aray, user.C_aray)
-        elif int(user.variant) == 2:
-            m_ohl_array = [user.m_ohl] * len(user.X)
-            T_ohl, C_p_ohl, C_p_raznitsa = find_temp(user.number, user.delta_S, user.p_ohl, user.q_sum, user.m_ohl, user.a,
-                                                     user.T_nach, user.cooler, user.T_aray,
-                                                     user.p_aray, user.C_aray)
-        elif int(user.variant) == 3:
-            m_ohl_array = [user.m_ohl] * len(user.X)
-            T_ohl, C_p_ohl, C_p_raznitsa = find_temp_slozh_2(user.ind_peret, user.delta_S, user.q_sum, user.a, user.number,
-                                                             user.p_ohl, user.m_ohl, user.T_nach,
-                                                             user.cooler, user.T_aray, user.p_aray, user.C_aray)
-        elif int(user.variant) == 5:
-            T_ohl, C_p_ohl, C_p_raznitsa, m_ohl_array = find_temp_slozh_5(user.m_ohl_1, user.m_ohl_2,
-                                                                             user.index_peret_1, user.index_peret_2,
-                                                                             user.delta_S,
-                                                                             user.q_sum, user.number, user.p_ohl,
-                                                                             user.a,
-                                                                             user.T_nach, user.cooler, user.T_aray,
-                                                                             user.p_aray, user.C_aray)
-        elif int(user.variant) == 6:
-            T_ohl, C_p_ohl, C_p_raznitsa, m_ohl_array=find_temp_slozh_6(user.m_ohl_1,user.m_ohl_2,user.ind_peret,user.delta_S,
-                                                                        user.q_sum,user.number,user.p_ohl,user.a,user.T_nach_1,
-                                                                        user.T_nach_2,user.T_aray,user.p_aray,user.C_aray,
-                                                                        user.T_aray_2,user.p_aray_2,user.C_aray_2)
-
-        else:
-            m_ohl_array = [user.m_ohl] * len(user.X)
-            T_ohl, C_p_ohl, C_p_raznitsa = find_temp_slozh_1(user.ind_peret, user.delta_S, user.q_sum, user.a, user.number,
-                                                             user.p_ohl, user.m_ohl, user.T_nach,
-                                                             user.cooler, user.T_aray, user.p_aray, user.C_aray)
-        return T_ohl, C_p_ohl, C_p_raznitsa, m_ohl_array
+        return find_temp_variant(int(user.variant), user, user.a)
 
     def solution_to_tabl4(self):
         self.T_ohl, self.C_p_ohl, self.C_p_raznitsa, self.m_ohl_array = self.raschet_temperatury()
@@ -1150,7 +1119,7 @@ class Window_7(ctk.CTk):
                                     user.beta_reb,user.p_ohl_v_kontse,  user.variant,  user.ind_peret)
         return delta_p, p_itog,Re,delta_sheroh_otn,Re_gr,epsilon,l
     def solution_to_tabl6(self):
-        gas = ct.Solution('gri30.yaml')  # один раз
+        gas = get_solution()  # Механизм загружается один раз на процесс
         self.c_p_T_st = find_params_ks(gas, user.result_dedal["k_m0"], user.result_ikar["k_m_pr"] / user.result_dedal["k_m0"], user.result_dedal["H_gor"],
                                            user.result_dedal["H_ox"], user.result_dedal["form_gor"], user.result_dedal["form_ox"], user.result_dedal["p"], user.T_st_g)
         self.delta_p, self.p_itog,self.Re,self.delta_sheroh_otn,self.Re_gr,self.epsilon,self.l = self.rashet_poteri()
@@ -1325,41 +1294,7 @@ class Window_8(ctk.CTk):
                                    fg_color="#242424", bg_color="transparent")
         self.frame2.grid(row=0, column=0, sticky='w', padx=1, pady=1)
     def raschet_temperatury(self):
-        if int(user.variant) == 1:
-            T_ohl, C_p_ohl, C_p_raznitsa, m_ohl_array = find_temp_slosh_tema(self.m_ohl_1, self.m_ohl_2,
-                                                                             self.index_peret_1, self.index_peret_2,
-                                                                             self.delta_S,
-                                                                             self.q_sum, self.number, self.p_ohl, user.a,
-                                                                             self.T_nach, self.cooler, self.T_aray,
-                                                                             self.p_aray, self.C_aray)
-        elif int(user.variant) == 5:
-            T_ohl, C_p_ohl, C_p_raznitsa, m_ohl_array = find_temp_slozh_5(self.m_ohl_1, self.m_ohl_2,
-                                                                             self.index_peret_1, self.index_peret_2,
-                                                                             self.delta_S,
-                                                                             self.q_sum, self.number, self.p_ohl, user.a,
-                                                                             self.T_nach, self.cooler, self.T_aray,
-                                                                             self.p_aray, self.C_aray)
-        elif int(user.variant) == 2:
-            m_ohl_array = [user.m_ohl] * len(user.X)
-            T_ohl, C_p_ohl, C_p_raznitsa = find_temp(self.number, self.delta_S, self.p_ohl, self.q_sum, self.m_ohl, user.a,
-                                                     self.T_nach, self.cooler, self.T_aray,
-                                                     self.p_aray, self.C_aray)
-        elif int(user.variant) == 3:
-            m_ohl_array = [user.m_ohl] * len(user.X)
-            T_ohl, C_p_ohl, C_p_raznitsa = find_temp_slozh_2(self.ind_peret, self.delta_S, self.q_sum, user.a, self.number,
-                                                             self.p_ohl, self.m_ohl, self.T_nach,
-                                                             self.cooler, self.T_aray, self.p_aray, self.C_aray)
-        elif int(user.variant) == 6:
-            T_ohl, C_p_ohl, C_p_raznitsa, m_ohl_array=find_temp_slozh_6(self.m_ohl_1,self.m_ohl_2,self.ind_peret,self.delta_S,
-                                                                        self.q_sum,self.number,self.p_ohl,user.a,self.T_nach_1,
-                                                                        self.T_nach_2,self.T_aray,self.p_aray,self.C_aray,
-                                                                        self.T_aray_2,self.p_aray_2,self.C_aray_2)
-        else:
-            m_ohl_array = [user.m_ohl] * len(user.X)
-            T_ohl, C_p_ohl, C_p_raznitsa = find_temp_slozh_1(self.ind_peret, self.delta_S, self.q_sum, user.a, self.number,
-                                                             self.p_ohl, self.m_ohl, self.T_nach,
-                                                             self.cooler, self.T_aray, self.p_aray, self.C_aray)
-        return T_ohl, C_p_ohl, C_p_raznitsa, m_ohl_array
+        return find_temp_variant(int(user.variant), self, user.a)
     def rashet_poteri(self):
         if user.variant == 1:
             delta_p, p_itog,Re,delta_sheroh_otn,Re_gr,epsilon,l = tabl_5(user.c, self.delta_sheroh, self.u_ohl, self.rho_ohl, self.d_g, self.mu_ohl, self.t_N, self.delta_reb, self.h, self.delta_x_s,
@@ -1385,7 +1320,11 @@ class Window_8(ctk.CTk):
                                     self.beta_reb,self.p_ohl_v_kontse,  self.variant,  self.ind_peret)
         return delta_p, p_itog,Re,delta_sheroh_otn,Re_gr,epsilon,l
     def solution_to_itog(self):
-        gas = ct.Solution('gri30.yaml')  # один раз
+        gas = get_solution()  # Механизм загружается один раз на процесс
+        # Лучистый поток и множители find_q_kon зависят только от геометрии и параметров камеры:
+        # они вычисляются один раз, в цикле пересчитывается только зависящее от T_st_g, c_p_T_st и p_ohl
+        self.q_l = find_q_l(self.eps_g, user.result_dedal['T'], user.result_ikar['phi_pr'], self.D_otn, self.number,
+                            self.Y, self.X)
         while self.pogresh >= 2:
             self.q_kon, self.betta, self.T_st_otn, self.lambd, self.S_1 = find_q_kon(self.number, self.Y, self.c_p_T_0g,
                                                                                  self.c_p_T_st, self.T_st_g, self.T_og,
@@ -1393,8 +1332,6 @@ class Window_8(ctk.CTk):
                                                                                  self.d_kp, self.F_otn, user.b,
                                                                                  user.result_dedal['p'],
                                                                                  user.result_dedal['k'], 2)
-            self.q_l = find_q_l(self.eps_g, user.result_dedal['T'], user.result_ikar['phi_pr'], self.D_otn, self.number,
-                            self.Y)
             self.q_sum = find_q_sum(self.q_kon, self.q_l)
             self.q_kon, self.q_l, self.q_sum, user.X, self.betta, self.T_st_otn, self.lambd, self.S_1 = tabl_3(self.q_kon,self.q_l,self.q_sum,self.X,self.betta,self.T_st_otn,self.lambd,self.S_1)  # Вывод таблицы №3
             self.T_ohl, self.C_p_ohl, self.C_p_raznitsa, self.m_ohl_array = self.raschet_temperatury()
@@ -1425,7 +1362,13 @@ class Window_8(ctk.CTk):
             self.pogresh = abs(self.q_kon_proshl - self.q_kon_nast) * 100 / self.q_kon_proshl
             print(f'Погрешность с прошлым расчётом составляет: {self.pogresh:.2f} %')
             self.q_kon_proshl = (max(self.q_kon))
+        self.print_stations()
         self.print_all_images()
+    def print_stations(self):
+        """Вывод результатов в заданных сечениях (MESH_STATIONS)."""
+        stations, (T_st_g, T_ohl, q_sum) = to_stations(self.X, None, self.T_st_g, self.T_ohl, self.q_sum)
+        for x, T_g, T_o, q in zip(stations, T_st_g, T_ohl, q_sum):
+            print(f'X = {x * 1000:.1f} мм: T_ст.г = {T_g:.1f} К, T_охл = {T_o:.1f} К, q_сум = {q:.3f} МВт/м²')
     def print_all_images(self):
         print_nozzle_window(self.X, self.Y, self.frame2,2,10)
         print_cooling_fins_array(user.X, user.n_r_array, user.Y, self.frame2,2,1550)
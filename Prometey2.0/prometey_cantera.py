@@ -6,18 +6,448 @@
 - Расчёта химического равновесия в КС и сопле,
 - Вычисления параметров горючих/окислителей.
 
+Здесь реализованы:
+- Общий источник объектов `Solution` (`get_solution`): каждый поток загружает механизм один раз
+  и затем использует свой объект повторно (объекты Cantera не рассчитаны на одновременное
+  использование из нескольких потоков), перед выдачей состояние сбрасывается к исходному,
+- Таблица равновесных свойств продуктов сгорания по температуре (`EquilibriumTable`): строится
+  один раз для смеси (горючее, окислитель, α, p_k) со сгущением узлов там, где свойства меняются
+  быстро, после чего `find_params_ks` получает c_p в узлах стенки интерполяцией вместо расчёта
+  равновесия в каждом узле на каждой итерации,
+- Расчёт равновесия в наборе температур (`equilibrium_sweep`): повторяющиеся температуры
+  рассчитываются один раз, остальные — по возрастанию, каждое равновесие начинается с состава
+  при предыдущей температуре; результаты возвращаются в исходном порядке узлов,
+- Параллельный расчёт равновесия (`equilibrium_parallel`): набор состояний (T, p, смесь) делится
+  на части, которые считаются в пуле процессов (включается `EQUILIBRIUM_WORKERS` > 1);
+  каждый процесс один раз загружает механизм,
+- Постоянный кэш параметров камеры сгорания (`disk_cached`): результаты `find_params_tog`
+  и `find_params_proverka` хранятся в базе SQLite в каталоге кэша пользователя по хэшу исходных
+  данных и файла механизма, при превышении `CANTERA_CACHE_SIZE` удаляются давно неиспользуемые.
 """
 
 import cantera as ct
 import ast
+import atexit
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import functools
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import numpy as np
+
+MECHANISM = 'gri30.yaml'  # Механизм продуктов сгорания ('gri30_highT.yaml' — для высоких температур)
+
+CANTERA_CACHE = True  # Постоянный кэш find_params_tog и find_params_proverka: False — всегда расчёт Cantera
+CANTERA_CACHE_PATH = None  # Файл базы кэша; None — prometey/cantera_cache.sqlite в каталоге кэша пользователя
+CANTERA_CACHE_SIZE = 20000  # Наибольшее число записей кэша (сверх него удаляются давно неиспользуемые)
+
+EQUILIBRIUM_MODE = "table"  # c_p стенки в find_params_ks: "table" — интерполяция по таблице смеси, "direct" — равновесие в каждом узле
+EQUILIBRIUM_T_MIN = 250.0  # Нижняя граница таблицы равновесных свойств, К
+EQUILIBRIUM_T_MAX = 4000.0  # Верхняя граница таблицы, К (вне диапазона — расчёт равновесия в точке)
+EQUILIBRIUM_STEP = 50.0  # Начальный шаг таблицы по температуре, К
+EQUILIBRIUM_TOL = 1e-4  # Допустимая относительная погрешность линейной интерполяции свойств между узлами
+EQUILIBRIUM_DT_MIN = 0.5  # Минимальный шаг таблицы при сгущении, К
+EQUILIBRIUM_WORKERS = 1  # Процессов для расчёта равновесия: 1 — в текущем процессе, None — по числу ядер
+EQUILIBRIUM_CHUNK = 32  # Состояний в одной части при параллельном расчёте (меньшие наборы считаются в текущем процессе)
+EQUILIBRIUM_PROPERTIES = ("cp", "mu", "lambda", "Pr")  # Свойства в таблице: c_p, Дж/(кг·К); μ, Па·с; λ, Вт/(м·К); Pr
+
+_local = threading.local()  # Объекты Solution текущего потока: механизм → (Solution, исходное состояние T, P, Y)
+_equilibrium_pool = None  # Пул процессов создаётся один раз и используется при всех последующих расчётах
+_mechanism_hashes = {}  # механизм → SHA-256 содержимого файла
+_cache_lock = threading.Lock()
+def get_solution(mechanism=None):
+    """
+    Объект `Solution` механизма для текущего потока.
+
+    Механизм загружается при первом обращении из потока, после чего объект потока используется
+    повторно. Перед выдачей температура, давление и состав сбрасываются к исходным, поэтому
+    результат не зависит от предыдущих расчётов.
+
+    Args:
+        mechanism (str, optional): Файл механизма; по умолчанию `MECHANISM`.
+
+    Returns:
+        ct.Solution: Объект, принадлежащий текущему потоку.
+    """
+    mechanism = MECHANISM if mechanism is None else mechanism
+    solutions = getattr(_local, 'solutions', None)
+    if solutions is None:
+        solutions = _local.solutions = {}
+    if mechanism not in solutions:
+        gas = ct.Solution(mechanism)
+        solutions[mechanism] = (gas, gas.TPY)
+    gas, state = solutions[mechanism]
+    gas.TPY = state
+    return gas
+_EQUILIBRIUM_GETTERS = {
+    "cp": lambda gas: gas.cp,
+    "mu": lambda gas: gas.viscosity,
+    "lambda": lambda gas: gas.thermal_conductivity,
+    "Pr": lambda gas: gas.cp * gas.viscosity / gas.thermal_conductivity,
+}  # Свойства EQUILIBRIUM_PROPERTIES по текущему состоянию объекта механизма
+def equilibrium_sweep(gas, T, p_k, names=("cp",)):
+    """
+    Равновесные свойства смеси при наборе температур и постоянном давлении.
+
+    Совпадающие температуры рассчитываются один раз; остальные обходятся по возрастанию, поэтому
+    каждое равновесие начинается с близкого состава при предыдущей температуре. Результаты
+    расставляются в порядке `T`.
+
+    Args:
+        gas (ct.Solution): Объект механизма с заданным составом смеси (состав — начальное
+            приближение для наименьшей температуры).
+        T (list of float): Температуры, К.
+        p_k (float): Давление, МПа.
+        names (tuple of str): Свойства из `EQUILIBRIUM_PROPERTIES`.
+
+    Returns:
+        np.ndarray: Значения формы (len(T), len(names)).
+    """
+    unique, inverse = np.unique(np.asarray(T, dtype=float), return_inverse=True)
+    getters = [_EQUILIBRIUM_GETTERS[name] for name in names]
+    values = np.empty((len(unique), len(names)))
+    for i, t in enumerate(unique):
+        gas.TP = t, p_k * 10 ** 6
+        gas.equilibrate('TP')
+        values[i] = [getter(gas) for getter in getters]
+    return values[inverse.ravel()]
+def _mixture_key(mixture):
+    """Смесь (горючее, окислитель, α) в виде, пригодном для сравнения и передачи в процесс."""
+    fuel, oxidizer, alpha = mixture
+    if isinstance(fuel, str):
+        fuel = ast.literal_eval(fuel)
+    if isinstance(oxidizer, str):
+        oxidizer = ast.literal_eval(oxidizer)
+    return tuple(sorted(fuel.items())), tuple(sorted(oxidizer.items())), float(alpha)
+def _init_worker(mechanism):
+    """Загрузка механизма при запуске процесса пула."""
+    get_solution(mechanism)
+def _solve_states(mechanism, states, names):
+    """
+    Равновесие для части состояний: по каждой смеси и давлению — `equilibrium_sweep`.
+
+    Args:
+        mechanism (str): Файл механизма.
+        states (list of tuple): (T, p_k, смесь `_mixture_key`).
+        names (tuple of str): Свойства из `EQUILIBRIUM_PROPERTIES`.
+
+    Returns:
+        np.ndarray: Значения формы (len(states), len(names)).
+    """
+    values = np.empty((len(states), len(names)))
+    groups = {}
+    for i, (T, p_k, mixture) in enumerate(states):
+        groups.setdefault((mixture, p_k), []).append(i)
+    for (mixture, p_k), index in groups.items():
+        gas = get_solution(mechanism)
+        gas.set_equivalence_ratio(1 / mixture[2], dict(mixture[0]), dict(mixture[1]))
+        gas.TP = 300, p_k * 10 ** 6
+        gas.equilibrate('TP')
+        values[index] = equilibrium_sweep(gas, [states[i][0] for i in index], p_k, names)
+    return values
+def equilibrium_workers(max_workers=None):
+    """Число процессов для расчёта равновесия (`EQUILIBRIUM_WORKERS`; None — по числу ядер)."""
+    max_workers = EQUILIBRIUM_WORKERS if max_workers is None else max_workers
+    return (os.cpu_count() or 1) if max_workers is None else max_workers
+def get_equilibrium_pool(max_workers, mechanism):
+    """
+    Возвращает общий пул процессов.
+
+    Пул создаётся один раз из `max_workers` процессов и затем используется без пересоздания
+    (другой размер — после `shutdown_equilibrium_pool`). Каждый процесс загружает механизм
+    при запуске, поэтому повторные расчёты не платят ни за создание пула, ни за загрузку механизма.
+    """
+    global _equilibrium_pool
+    if _equilibrium_pool is None:
+        _equilibrium_pool = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                                initargs=(mechanism,))
+    return _equilibrium_pool
+@atexit.register
+def shutdown_equilibrium_pool():
+    """Останавливает общий пул процессов."""
+    global _equilibrium_pool
+    if _equilibrium_pool is not None:
+        _equilibrium_pool.shutdown(wait=True, cancel_futures=True)
+    _equilibrium_pool = None
+def equilibrium_parallel(states, names=("cp",), max_workers=None, mechanism=None, chunk_size=None):
+    """
+    Равновесные свойства для набора состояний, рассчитанные в пуле процессов.
+
+    Состояния упорядочиваются по смеси, давлению и температуре и делятся на части по
+    `chunk_size`, поэтому внутри части равновесие начинается с близкого состава. Результаты
+    собираются в порядке `states` и не зависят от числа процессов (с точностью до сходимости
+    расчёта равновесия). Если пул процессов недоступен, расчёт выполняется в текущем процессе.
+
+    Args:
+        states (list of tuple): (T, p_k, (горючее, окислитель, α)) — температура, К, давление, МПа,
+            и смесь (составы — словари или их строковая запись).
+        names (tuple of str): Свойства из `EQUILIBRIUM_PROPERTIES`.
+        max_workers (int, optional): Число процессов; по умолчанию `EQUILIBRIUM_WORKERS`.
+        mechanism (str, optional): Файл механизма; по умолчанию `MECHANISM`.
+        chunk_size (int, optional): Состояний в части; по умолчанию `EQUILIBRIUM_CHUNK`.
+
+    Returns:
+        np.ndarray: Значения формы (len(states), len(names)).
+    """
+    mechanism = MECHANISM if mechanism is None else mechanism
+    chunk_size = EQUILIBRIUM_CHUNK if chunk_size is None else chunk_size
+    max_workers = equilibrium_workers(max_workers)
+    keys = {}
+    states = [(float(T), float(p_k), keys.setdefault(id(mixture), _mixture_key(mixture)))
+              for T, p_k, mixture in states]
+    order = sorted(range(len(states)), key=lambda i: (states[i][2], states[i][1], states[i][0]))
+    chunks = [order[i:i + chunk_size] for i in range(0, len(order), chunk_size)]
+    values = np.empty((len(states), len(names)))
+    if max_workers > 1 and len(chunks) > 1:
+        try:
+            pool = get_equilibrium_pool(max_workers, mechanism)
+            futures = [pool.submit(_solve_states, mechanism, [states[i] for i in chunk], names) for chunk in chunks]
+            for chunk, future in zip(chunks, futures):
+                values[chunk] = future.result()
+            return values
+        except (BrokenProcessPool, pickle.PicklingError, OSError) as e:
+            print(f"⚠️ Пул процессов недоступен ({e}), равновесие считается в текущем процессе")
+            shutdown_equilibrium_pool()
+    values[order] = _solve_states(mechanism, [states[i] for i in order], names)
+    return values
+_equilibrium_tables = {}  # (механизм, горючее, окислитель, α, p_k) → EquilibriumTable
+class EquilibriumTable:
+    """
+    Равновесные свойства продуктов сгорания при постоянном давлении как функции температуры.
+
+    Узлы таблицы сначала расставляются с шагом `step`; затем в середине каждого интервала
+    рассчитывается равновесие, и если линейная интерполяция по концам интервала отличается
+    от него больше чем на `tol` (относительно, по любому свойству), интервал делится пополам
+    (не мельче `dt_min`). Рассчитанные середины также становятся узлами, поэтому погрешность
+    интерполяции по итоговой таблице не больше проверенной. Узлы и середины каждого прохода
+    рассчитываются одним набором `equilibrium_parallel` (в пуле процессов, если он включён).
+
+    Args:
+        fuel (dict): Состав горючего.
+        oxidizer (dict): Состав окислителя.
+        alpha (float): Коэффициент избытка окислителя.
+        p_k (float): Давление, МПа.
+        mechanism (str, optional): Файл механизма; по умолчанию `MECHANISM`.
+        T_min, T_max, step, tol, dt_min (float, optional): Параметры таблицы; по умолчанию
+            `EQUILIBRIUM_T_MIN`, `EQUILIBRIUM_T_MAX`, `EQUILIBRIUM_STEP`, `EQUILIBRIUM_TOL`,
+            `EQUILIBRIUM_DT_MIN`.
+    """
+    def __init__(self, fuel, oxidizer, alpha, p_k, mechanism=None, T_min=None, T_max=None, step=None, tol=None,
+                 dt_min=None):
+        self.fuel = fuel
+        self.oxidizer = oxidizer
+        self.alpha = alpha
+        self.p_k = p_k
+        self.mechanism = mechanism
+        T_min = EQUILIBRIUM_T_MIN if T_min is None else T_min
+        T_max = EQUILIBRIUM_T_MAX if T_max is None else T_max
+        step = EQUILIBRIUM_STEP if step is None else step
+        tol = EQUILIBRIUM_TOL if tol is None else tol
+        dt_min = EQUILIBRIUM_DT_MIN if dt_min is None else dt_min
+
+        grid = np.linspace(T_min, T_max, int(np.ceil((T_max - T_min) / step)) + 1)
+        nodes = dict(zip(grid, self._evaluate(grid, EQUILIBRIUM_PROPERTIES)))
+        intervals = list(zip(grid[:-1], grid[1:]))
+        while intervals:  # Один проход — все середины непроверенных интервалов
+            middles = [0.5 * (left + right) for left, right in intervals]
+            refined = []
+            for (left, right), middle, value in zip(intervals, middles, self._evaluate(middles, EQUILIBRIUM_PROPERTIES)):
+                nodes[middle] = value
+                linear = 0.5 * (nodes[left] + nodes[right])
+                if right - left > 2 * dt_min and np.max(np.abs(linear - value) / np.abs(value)) > tol:
+                    refined += [(left, middle), (middle, right)]
+            intervals = refined
+        self.T = np.array(sorted(nodes))
+        self.values = np.array([nodes[T] for T in self.T])  # (n_T, len(EQUILIBRIUM_PROPERTIES))
+        print(f"Таблица равновесных свойств: {len(self.T)} узлов, {T_min:.0f}–{T_max:.0f} К, "
+              f"шаг {np.min(np.diff(self.T)):.2f}–{np.max(np.diff(self.T)):.2f} К")
+    def _evaluate(self, T, names):
+        """Равновесные свойства смеси таблицы при температурах T."""
+        return equilibrium_parallel([(t, self.p_k, (self.fuel, self.oxidizer, self.alpha)) for t in T], names,
+                                    mechanism=self.mechanism)
+    def __call__(self, T, name="cp"):
+        """
+        Свойство при температурах T.
+
+        Args:
+            T (float or list of float): Температуры, К.
+            name (str): Свойство из `EQUILIBRIUM_PROPERTIES`.
+
+        Returns:
+            np.ndarray: Значения; вне диапазона таблицы — расчёт равновесия в точке.
+        """
+        T = np.atleast_1d(np.asarray(T, dtype=float))
+        column = EQUILIBRIUM_PROPERTIES.index(name)
+        result = np.interp(T, self.T, self.values[:, column])
+        outside = (T < self.T[0]) | (T > self.T[-1])
+        if np.any(outside):
+            result[outside] = self._evaluate(T[outside], (name,))[:, 0]
+        return result
+def get_equilibrium_table(fuel, oxidizer, alpha, p_k, mechanism=None):
+    """
+    Таблица равновесных свойств смеси, построенная один раз на процесс.
+
+    Args:
+        fuel (dict or str): Состав горючего.
+        oxidizer (dict or str): Состав окислителя.
+        alpha (float): Коэффициент избытка окислителя.
+        p_k (float): Давление, МПа.
+        mechanism (str, optional): Файл механизма; по умолчанию `MECHANISM`.
+
+    Returns:
+        EquilibriumTable: Таблица свойств.
+    """
+    if isinstance(fuel, str):
+        fuel = ast.literal_eval(fuel)
+    if isinstance(oxidizer, str):
+        oxidizer = ast.literal_eval(oxidizer)
+    mechanism = MECHANISM if mechanism is None else mechanism
+    key = (mechanism, tuple(sorted(fuel.items())), tuple(sorted(oxidizer.items())), float(alpha), float(p_k))
+    if key not in _equilibrium_tables:
+        _equilibrium_tables[key] = EquilibriumTable(fuel, oxidizer, alpha, p_k, mechanism)
+    return _equilibrium_tables[key]
+def cache_path():
+    """
+    Файл базы постоянного кэша.
+
+    `CANTERA_CACHE_PATH`, иначе каталог кэша пользователя: %LOCALAPPDATA% в Windows,
+    $XDG_CACHE_HOME или ~/.cache в остальных системах.
+    """
+    if CANTERA_CACHE_PATH is not None:
+        return CANTERA_CACHE_PATH
+    root = os.environ.get('LOCALAPPDATA') or os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache')
+    return os.path.join(root, 'prometey', 'cantera_cache.sqlite')
+def mechanism_hash(mechanism=None):
+    """SHA-256 файла механизма (поиск как в Cantera: путь или каталоги данных Cantera)."""
+    mechanism = MECHANISM if mechanism is None else mechanism
+    if mechanism not in _mechanism_hashes:
+        for directory in [''] + list(ct.get_data_directories()):
+            path = os.path.join(directory, mechanism)
+            if os.path.isfile(path):
+                with open(path, 'rb') as f:
+                    _mechanism_hashes[mechanism] = hashlib.sha256(f.read()).hexdigest()
+                break
+        else:
+            _mechanism_hashes[mechanism] = f'{mechanism}:{ct.__version__}'  # Файл не найден — по имени и версии Cantera
+    return _mechanism_hashes[mechanism]
+def _canonical(value):
+    """Исходные данные в однозначном виде: составы — упорядоченные пары, числа — float."""
+    if isinstance(value, str) and value.lstrip().startswith('{'):
+        value = ast.literal_eval(value)
+    if isinstance(value, dict):
+        return [[str(key), _canonical(item)] for key, item in sorted(value.items())]
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, (int, float, np.number)) and not isinstance(value, bool):
+        return float(value)
+    return value
+def _connect():
+    """Соединение с базой кэша (таблица создаётся при первом обращении)."""
+    path = cache_path()
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    connection = sqlite3.connect(path, timeout=10)
+    connection.execute('CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT, used REAL)')
+    return connection
+def _cache_get(key):
+    """Значение по ключу (None, если его нет); отмечает время использования."""
+    connection = _connect()
+    try:
+        with _cache_lock, connection:
+            row = connection.execute('SELECT value FROM results WHERE key = ?', (key,)).fetchone()
+            if row is not None:
+                connection.execute('UPDATE results SET used = ? WHERE key = ?', (time.time(), key))
+    finally:
+        connection.close()
+    return None if row is None else json.loads(row[0])
+def _cache_put(key, value):
+    """Сохраняет значение и удаляет давно неиспользуемые записи сверх `CANTERA_CACHE_SIZE`."""
+    connection = _connect()
+    try:
+        with _cache_lock, connection:
+            connection.execute('INSERT OR REPLACE INTO results VALUES (?, ?, ?)', (key, json.dumps(value), time.time()))
+            excess = connection.execute('SELECT COUNT(*) FROM results').fetchone()[0] - CANTERA_CACHE_SIZE
+            if excess > 0:
+                connection.execute('DELETE FROM results WHERE key IN '
+                                   '(SELECT key FROM results ORDER BY used LIMIT ?)', (excess,))
+    finally:
+        connection.close()
+def clear_cantera_cache():
+    """Удаляет все записи постоянного кэша."""
+    connection = _connect()
+    try:
+        with _cache_lock:
+            with connection:
+                connection.execute('DELETE FROM results')
+            connection.execute('VACUUM')
+    finally:
+        connection.close()
+def disk_cached(func):
+    """
+    Хранит результаты расчёта параметров камеры сгорания между запусками программы.
+
+    Ключ — SHA-256 от названия функции, исходных данных в однозначном виде (`_canonical`)
+    и содержимого файла механизма (`mechanism_hash`). Кэш отключается `CANTERA_CACHE = False`
+    или аргументом `use_cache=False`, очищается `clear_cantera_cache()`. Если база недоступна,
+    выполняется обычный расчёт.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, use_cache=True):
+        if not (CANTERA_CACHE and use_cache):
+            return func(*args)
+        key = hashlib.sha256(json.dumps([func.__name__, mechanism_hash(), _canonical(args)]).encode()).hexdigest()
+        try:
+            value = _cache_get(key)
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️ Кэш Cantera недоступен ({e}), выполняется расчёт")
+            return func(*args)
+        if value is not None:
+            return tuple(value) if isinstance(value, list) else value
+        result = func(*args)
+        try:
+            _cache_put(key, list(result) if isinstance(result, tuple) else result)
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️ Не удалось сохранить результат в кэш Cantera ({e})")
+        return result
+    return wrapper
 def find_params_ks(gas,km0,alpha,H_gor,H_ok,fuel,oxidizer,p_k,T_st_g):
+    """
+    Равновесная теплоёмкость продуктов сгорания при температурах стенки.
+
+    При `EQUILIBRIUM_MODE = "table"` значения интерполируются по таблице смеси
+    (`get_equilibrium_table`), которая строится при первом вызове; при "direct" равновесие
+    рассчитывается объектом `gas` для каждой различной температуры (`equilibrium_sweep`), а при
+    нескольких процессах (`EQUILIBRIUM_WORKERS`) — в пуле процессов (`equilibrium_parallel`).
+    Таблица и процессы пула используют механизм, из которого загружен `gas` (`gas.source`).
+
+    Args:
+        gas (ct.Solution): Объект механизма.
+        km0 (float): Стехиометрическое соотношение компонентов.
+        alpha (float): Коэффициент избытка окислителя.
+        H_gor, H_ok (float): Энтальпии горючего и окислителя, кДж/кг.
+        fuel, oxidizer (dict or str): Составы горючего и окислителя.
+        p_k (float): Давление в камере, МПа.
+        T_st_g (list of float): Температуры стенки, К (None пропускаются).
+
+    Returns:
+        list of float: c_p, Дж/(кг·К).
+    """
+    if EQUILIBRIUM_MODE == "table":
+        C_itog = get_equilibrium_table(fuel, oxidizer, alpha, p_k, gas.source)(
+            [T for T in T_st_g if T is not None]).tolist()
+        print('Расчет c_p окончен')
+        return C_itog
     # Преобразуем fuel, если он задан как строка
     if isinstance(fuel, str):
         fuel = ast.literal_eval(fuel)
     # То же для oxidizer
     if isinstance(oxidizer, str):
         oxidizer = ast.literal_eval(oxidizer)
-    C_itog=[]
     km = km0 * alpha
     m_gor = 1 / (1 + km)
     m_ok = km / (1 + km)
@@ -26,14 +456,17 @@ def find_params_ks(gas,km0,alpha,H_gor,H_ok,fuel,oxidizer,p_k,T_st_g):
     gas.set_equivalence_ratio(1 / alpha, fuel, oxidizer)
     gas.TP = 300, p_k * 10 ** 6
     gas.equilibrate('TP')
-    for T in T_st_g:
-        if T is not None:
-            gas.TP = T, p_k * 10 ** 6
-            gas.equilibrate('TP')
-            C_itog.append(gas.cp)
-            print(gas.T,gas.cp)
+    T_st_g = [T for T in T_st_g if T is not None]
+    if equilibrium_workers() > 1:
+        C_itog = equilibrium_parallel([(T, p_k, (fuel, oxidizer, alpha)) for T in T_st_g],
+                                      mechanism=gas.source)[:, 0].tolist()
+    else:
+        C_itog = equilibrium_sweep(gas, T_st_g, p_k)[:, 0].tolist()
+    for T, C in zip(T_st_g, C_itog):
+        print(T, C)
     print('Расчет c_p окончен')
     return C_itog
+@disk_cached
 def find_params_proverka(km0,alpha,H_gor,H_ok,fuel,oxidizer,p_k,T):
     if isinstance(fuel, str):
         fuel = ast.literal_eval(fuel)
@@ -42,8 +475,7 @@ def find_params_proverka(km0,alpha,H_gor,H_ok,fuel,oxidizer,p_k,T):
         oxidizer = ast.literal_eval(oxidizer)
     """--------------------Поиск всех основных параметров в камере сгорания--------------------"""
     k0 = km0
-    # gas = ct.Solution('gri30_highT.yaml')
-    gas = ct.Solution('gri30.yaml')
+    gas = get_solution()
     km = k0 * alpha
     # Расчёт энтальпии смеси
     m_gor = (1 / (1 + km))
@@ -71,6 +503,7 @@ def find_params_proverka(km0,alpha,H_gor,H_ok,fuel,oxidizer,p_k,T):
     H1 = gas.enthalpy_mass
     CPEQ = (H2 - H1) / (0.02 * T_1)
     return CPEQ
+@disk_cached
 def find_params_tog(km0,alpha,H_gor,H_ok,fuel,oxidizer,p_k):
     if isinstance(fuel, str):
         fuel = ast.literal_eval(fuel)
@@ -78,8 +511,7 @@ def find_params_tog(km0,alpha,H_gor,H_ok,fuel,oxidizer,p_k):
     if isinstance(oxidizer, str):
         oxidizer = ast.literal_eval(oxidizer)
     k0 = km0
-    # gas = ct.Solution('gri30_highT.yaml')
-    gas = ct.Solution('gri30.yaml')
+    gas = get_solution()
     km = k0 * alpha
     # Расчёт энтальпии смеси
     m_gor = (1 / (1 + km))
@@ -13,12 +13,42 @@
 """
 import pandas as pd
 from openpyxl import load_workbook
+from collections import OrderedDict
+import copy
+import functools
+import hashlib
 import math
 import numpy as np
 import os
-from scipy.optimize import root_scalar
-from scipy.interpolate import griddata, RBFInterpolator, interp1d
-from scipy.spatial import Delaunay
+from prometey_properties import (COMPLEX_COMPONENTS, PROPERTY_KEYS, register_coolant, get_coolant,
+                                  register_temperature_table, get_temperature_table, read_table_cache, write_table_cache, get_hull,
+                                  validate_table, coverage_report, get_enthalpy_table)
+import prometey_properties
+from prometey_network import CoolantNetwork, Segment, solve_network
+from prometey_kernels import active_backend, march_step, wall_temperature, convective_heat_flux
+COOLANT_FILES = {
+    "Водород": ("data/Properties of components/Hydrogen_Features.xlsx", 7),
+    "АТ": ("data/Properties of components/Nitrogen-tetraoxide-Features.xlsx", 7),
+    "Кислород": ("data/Properties of components/Oxygen-Features.xlsx", 7),
+    "Гелий": ("data/Properties of components/Helium-Features.xlsx", 7),
+    "Аммиак": ("data/Properties of components/Ammonia-Features.xlsx", 7),
+    "Метан": ("data/Properties of components/Methane-Features.xlsx", 7),
+    "НДМГ": ("data/Properties of components/Hydrazine_Features.xlsx", 6),
+    "Аэрозин-50": ("data/Properties of components/Aerosin-50-Features.xlsx", 6),
+    "Вода": ("data/Properties of components/Water_Features.xlsx", 6),
+    "Керосин-Т1": ("data/Properties of components/Kerosene-T-1-Features.xlsx", 6),
+    "Этанол": ("data/Properties of components/Ethanol-Features.xlsx", 6),
+}  # Охладитель → (файл свойств, число столбцов)
+FIND_TEMP_METHOD = "step"  # Расчёт в find_temp: "step" — подбор с шагом 1 К, "newton"/"secant" — баланс энергии, "enthalpy" — по энтальпии
+FIND_TEMP_TOL = 1e-3  # Абсолютная точность приращения температуры на участке для "newton" и "secant", К
+Q_L_RAMP_LENGTH = 0.050  # Длина участка у головки, на котором растёт лучистый тепловой поток, м
+LAMBDA_TOL = 1e-12  # Точность λ при совместном решении уравнения расхода для всех узлов
+LAMBDA_CACHE_SIZE = 16  # Число наборов (геометрия, k), для которых хранятся λ и β
+
+STAGE_CACHE_SIZE = 16  # Число хранимых результатов этапов, не зависящих от итерации пересчёта
+
+_lambda_cache = OrderedDict()  # (хэш F_отн и ветвей, k) → (λ, β), вытеснение давно неиспользуемых
+_stage_cache = OrderedDict()  # (функция, хэш аргументов) → результат этапа, не зависящего от итерации
 def find_target_row(df, target_string):
     """
         Поиск индекса строки в DataFrame, содержащей заданную строку.
@@ -317,187 +347,212 @@ def find_n_r_array(X, Y, n_r_kp_min, beta_reb, delta_st, h, t_n_max):
             n_r_array.append(32 * n_r_kp_min)
 
     return n_r_array
-def equation(lambda_, k, F_otn_i):
+def content_hash(*values, **named):
     """
-    Расчёт значения функции для подбора параметра расширения потока λ (лямбда) по заданному отношению площадей.
+    Хэш содержимого аргументов: массивы и списки чисел — по значениям, остальные — по `repr`.
 
-    Эта функция определяет выражение, корень которого соответствует искомому значению λ в уравнении
-    для изэнтропического истечения газа через сопло:
+    Списки неравной длины, строки, None и прочие нечисловые значения в массивах хэшируются по `repr`.
 
-        λ · [1 - λ² · ((k - 1)/(k + 1))]^(1 / (k - 1)) · [(k + 1)/2]^(1 / (k - 1)) = 1 / F_otn_i
+    Returns:
+        str: Шестнадцатеричный SHA-1.
+    """
+    digest = hashlib.sha1()
+    for value in values + tuple(item for pair in sorted(named.items()) for item in pair):
+        arr = None
+        if isinstance(value, (list, tuple, np.ndarray)):
+            try:
+                arr = np.asarray(value)
+            except ValueError:  # Вложенные списки разной длины
+                pass
+        if arr is not None and arr.dtype.kind in "biuf":
+            arr = np.ascontiguousarray(arr, dtype=float)
+            digest.update(str(arr.shape).encode())
+            digest.update(arr.tobytes())
+        else:
+            # У массивов repr сокращается, поэтому хэшируется полный список значений
+            digest.update(repr(value.tolist() if isinstance(value, np.ndarray) else value).encode())
+        digest.update(b"|")
+    return digest.hexdigest()
+def stage_cached(func):
+    """
+    Хранит результаты этапа, зависящего только от геометрии и параметров камеры.
 
-    Где:
-        - λ — отношение локальной скорости потока к критической (расширение),
-        - k — показатель адиабаты газа (обычно 1.2–1.4),
-        - F_otn_i — относительное отношение площадей F/F_кр в рассматриваемом сечении сопла.
+    Ключ — хэш содержимого аргументов (`content_hash`), поэтому этап пересчитывается только
+    при изменении данных, а не при каждой итерации пересчёта. Возвращается копия результата.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        cache_key = (func.__name__, content_hash(*args, **kwargs))
+        result = _stage_cache.get(cache_key)
+        if result is None:
+            result = _stage_cache[cache_key] = func(*args, **kwargs)
+            if len(_stage_cache) > STAGE_CACHE_SIZE:
+                _stage_cache.popitem(last=False)
+        else:
+            _stage_cache.move_to_end(cache_key)
+        return copy.deepcopy(result)
+    return wrapper
+def clear_stage_cache():
+    """Очищает результаты этапов и λ (например, после изменения исходных данных вручную)."""
+    _stage_cache.clear()
+    _lambda_cache.clear()
+def solve_lambda_batch(F_otn, k, subsonic, max_iter=50):
+    """
+    Решает уравнение расхода q(λ) = 1 / F_отн сразу для всех узлов методом Ньютона.
 
-    Возвращаемое значение — левая часть уравнения минус правая,
-    используется при численном решении (например, методом Брента или Ньютона) для нахождения корня.
+    Уравнение решается в логарифмической форме ln q(λ) + ln F_отн = 0, где
+    q(λ) = λ·(1 - aλ²)^(1/(k-1))·((k+1)/2)^(1/(k-1)), a = (k-1)/(k+1).
+    Начальные приближения — асимптотики ветвей:
+    - у критического сечения ln q ≈ -(k+1)/2·(λ-1)², λ₀ = 1 ∓ √(2·ln F_отн/(k+1)),
+    - на дозвуковой ветви вдали от критики q ≈ λ·((k+1)/2)^(1/(k-1)),
+    - на сверхзвуковой ветви вдали от критики λ → λ_max = √((k+1)/(k-1)).
+    Шаг Ньютона, выходящий за отрезок ветви ([0, 1] или [1, λ_max]), заменяется делением отрезка.
+    При F_отн ≤ 1 возвращается λ = 1, при некорректных данных — 0 (как в `find_q_kon`).
 
-    Особенности:
-    - Возвращает `np.nan`, если выражение под корнем отрицательно или данные некорректны.
-    - Предусмотрена защита от деления на ноль и комплексных чисел (возведение в степень дробной степени).
+    Результат хранится для пары (F_отн и ветви узлов, k): геометрия и k не меняются между
+    итерациями пересчёта, поэтому повторные вызовы не решают уравнение заново.
 
     Args:
-        lambda_ (float): Предполагаемое значение коэффициента расширения потока.
-        k (float): Показатель адиабаты рабочего тела.
-        F_otn_i (float): Относительное отношение площадей F / F_кр для данного сечения.
+        F_otn (array-like of float): Отношения площадей F / F_кр в узлах.
+        k (float): Показатель адиабаты.
+        subsonic (array-like of bool): True — дозвуковая ветвь (до критики), False — сверхзвуковая.
+        max_iter (int): Максимальное число итераций.
 
     Returns:
-        float: Значение функции (левая часть минус правая), либо np.nan при ошибке или недопустимом λ.
+        tuple: (lambd, betta) — массивы λ и β = λ·√((k-1)/(k+1)).
     """
-    try:
-        if lambda_ <= 0 or F_otn_i <= 0 or k <= 1:
-            return np.nan
-
-        term2_base = 1 - (lambda_ ** 2) * ((k - 1) / (k + 1))
-        if term2_base <= 0:
-            return np.nan  # избегаем комплексных значений
-
-        term2 = term2_base ** (1 / (k - 1))
-        term3 = ((k + 1) / 2) ** (1 / (k - 1))
-
-        return float(lambda_ * term2 * term3 - (1 / F_otn_i))
+    F = np.ascontiguousarray(F_otn, dtype=float)
+    subsonic = np.ascontiguousarray(subsonic, dtype=bool)
+    cache_key = (hashlib.sha1(F.tobytes() + subsonic.tobytes()).hexdigest(), float(k))
+    cached = _lambda_cache.get(cache_key)
+    if cached is not None:
+        _lambda_cache.move_to_end(cache_key)
+        return cached[0].copy(), cached[1].copy()
+
+    a = (k - 1) / (k + 1)
+    lambda_max = math.sqrt(1 / a)
+    const = ((k + 1) / 2) ** (1 / (k - 1))
+    valid = np.isfinite(F) & (F > 1)
+    F_v = np.where(valid, F, 2.0)
+    ln_F = np.log(F_v)
+
+    # Начальные приближения по асимптотикам ветвей
+    near = np.sqrt(2 * ln_F / (k + 1))
+    far_sub = 1 / (F_v * const)
+    far_sup = np.sqrt(np.clip((1 - (F_v * lambda_max * const) ** (1 - k)) / a, 1.0, lambda_max ** 2))
+    lam = np.where(subsonic,
+                   np.where(F_v < 2, 1 - near, far_sub),
+                   np.where(F_v < 2, 1 + near, far_sup))
+    lower = np.where(subsonic, 0.0, 1.0)
+    upper = np.where(subsonic, 1.0, lambda_max)
+    lam = np.clip(lam, lower + 1e-15, upper - 1e-15)
+
+    for _ in range(max_iter):
+        base = 1 - a * lam * lam
+        residual = np.log(lam) + np.log(base) / (k - 1) + math.log(const) + ln_F  # Убывает на сверхзвуковой ветви
+        slope = 1 / lam - 2 * lam / ((k + 1) * base)
+        # Сужение отрезка: на дозвуковой ветви ln q растёт с λ, на сверхзвуковой — убывает
+        below = np.where(subsonic, residual < 0, residual > 0)
+        lower = np.where(below, lam, lower)
+        upper = np.where(below, upper, lam)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = residual / slope
+        new = lam - step
+        outside = ~np.isfinite(new) | (new <= lower) | (new >= upper)
+        new = np.where(outside, 0.5 * (lower + upper), new)
+        done = np.abs(new - lam) <= LAMBDA_TOL
+        lam = new
+        if np.all(done | ~valid):
+            break
 
-    except Exception as e:
-        print(f"Ошибка в equation(): {e}, λ={lambda_}, k={k}, F={F_otn_i}")
-        return np.nan
-def solve_lambda(F_i, k, lower=0.01, upper=4.0, xtol=1e-6):
+    lambd = np.where(valid, lam, np.where(np.isfinite(F) & (F > 0), 1.0, 0.0))
+    betta = lambd * math.sqrt(a)
+    lambd.flags.writeable = False
+    betta.flags.writeable = False
+    _lambda_cache[cache_key] = (lambd, betta)
+    if len(_lambda_cache) > LAMBDA_CACHE_SIZE:
+        _lambda_cache.popitem(last=False)
+    return lambd.copy(), betta.copy()
+@stage_cached
+def q_kon_invariants(number, Y, D_otn, d_kp, F_otn, b, p_k, k):
     """
-    Надёжный численный подбор коэффициента расширения потока λ методом Брента.
-
-    Функция решает изэнтропическое уравнение истечения газа из сопла (см. функцию `equation(...)`) для заданного
-    отношения площадей F/F_кр и показателя адиабаты k, возвращая соответствующее значение λ — безразмерного параметра,
-    отражающего степень расширения потока в данном сечении сопла.
+    Множители `find_q_kon`, не зависящие от температуры стенки.
 
-    Реализация использует метод `brentq` из `scipy.optimize.root_scalar`, при этом:
-    - Проверяется допустимость интервала поиска (`bracket`) — знак функции на концах должен быть разным;
-    - Выполняется автоматическое ограничение `upper`, чтобы избежать комплексных значений в уравнении (по λ² < (k + 1)/(k - 1));
-    - Если корень находится точно на границе — возвращается `lower` или `upper`;
-    - При возникновении ошибок возвращается `None`.
+    λ и β по отношению площадей и множитель b·B₀·(1-β²)·p_k^0.85 / (D_отн^1.82·d_кр^0.15·0.75^0.58),
+    где B₀ = 0.4842·A·slab_alpha, зависят только от геометрии и параметров камеры и вычисляются
+    один раз для всех итераций пересчёта.
 
     Args:
-        F_i (float): Отношение площадей F / F_кр в конкретной точке сопла.
-        k (float): Показатель адиабаты газа.
-        lower (float): Левая граница поиска λ (по умолчанию 0.01).
-        upper (float): Правая граница поиска λ (по умолчанию 4.0).
-        xtol (float): Абсолютная точность подбора корня (по умолчанию 1e-6).
+        number, Y, D_otn, d_kp, F_otn, b, p_k, k: Как у `find_q_kon`.
 
     Returns:
-        float or None: Найденное значение λ, соответствующее заданному F_i и k, либо None при сбое или недопустимом интервале.
+        tuple: (lambd, betta, factor) — массивы по точкам.
     """
-    try:
-        lambda_max = math.sqrt((k + 1) / (k - 1))
-        upper = min(upper, lambda_max - 1e-6)
-
-        f_a = equation(lower, k, F_i)
-        f_b = equation(upper, k, F_i)
-
-        # ✅ Обработка корня на границе
-        if abs(f_a) < 1e-8:
-            return lower
-        if abs(f_b) < 1e-8:
-            return upper
-
-        if any([
-            isinstance(f_a, complex), isinstance(f_b, complex),
-            np.isnan(f_a), np.isnan(f_b),
-            f_a * f_b > 0
-        ]):
-            print(f"⚠️ Неправильный интервал: F={F_i}, f(a)={f_a}, f(b)={f_b}")
-            return None
-
-        sol = root_scalar(
-            equation,
-            args=(k, F_i),
-            bracket=[lower, upper],
-            method='brentq',
-            xtol=xtol
-        )
+    number = np.asarray(number, dtype=int)
+    n = len(number)
+    throat = int(np.argmin(Y))  # Индекс критического сечения (первый минимум радиуса)
+    # До критики → дозвук, после критики → сверхзвук
+    lambd, betta = solve_lambda_batch(np.asarray(F_otn, dtype=float)[number], k, number <= throat)
 
-        if not sol.converged:
-            print(f"⚠️ Корень не найден точно для F={F_i}")
-        return sol.root
-
-    except Exception as e:
-        print(f"❌ Ошибка в solve_lambda: {e}")
-        return None
+    slab_alpha = 1.813 * ((2 / (k + 1)) ** (0.85 / (k - 1))) * ((2 * k / (k + 1)) ** 0.425)
+    A = 0.01352
+    B_0 = 0.4842 * A * slab_alpha
+    factor = b * 1e-6 * B_0 * (1 - betta ** 2) * (p_k * 1e6) ** 0.85 / (
+        np.asarray(D_otn, dtype=float)[:n] ** 1.82 * d_kp ** 0.15 * 0.75 ** 0.58)
+    return lambd, betta, factor
 def find_q_kon(number, Y, c_p_T_0g, c_p_T_st, T_st_g, T_og, mu_og, R_og, D_otn, d_kp, F_otn, b, p_k, k, iter):
     """
     Расчёт теплового потока q к стенке канала ЖРД с учётом параметров газа, геометрии и температурных условий.
 
+    Множители, зависящие только от геометрии и параметров камеры (λ, β, slab_alpha, D_отн),
+    берутся из `q_kon_invariants` и вычисляются один раз; на каждой итерации пересчитываются
+    только члены с температурой и теплоёмкостью стенки — выражениями над массивами NumPy.
+
     Args:
-        number (list of int): Индексы расчётных точек.
-        Y (list of float): Радиальные координаты точек.
+        number (array-like of int): Индексы расчётных точек.
+        Y (array-like of float): Радиальные координаты точек.
         c_p_T_0g (float): Теплоёмкость газа при температуре газа.
-        c_p_T_st (list of float): Теплоёмкость в стенке (по точкам).
-        T_st_g (list of float): Температура стенки газа (по точкам).
+        c_p_T_st (array-like of float): Теплоёмкость в стенке (по точкам).
+        T_st_g (array-like of float): Температура стенки газа (по точкам).
         T_og (float): Температура газа.
         mu_og (float): Динамическая вязкость газа.
         R_og (float): Газовая постоянная для газа.
-        D_otn (list of float): Относительный диаметр в точках.
+        D_otn (array-like of float): Относительный диаметр в точках.
         d_kp (float): Диаметр канала.
-        F_otn (list of float): Относительное сечение.
+        F_otn (array-like of float): Относительное сечение.
         b (float): Ширина щели охлаждения (в мм).
         p_k (float): Давление в камере (в МПа).
         k (float): Показатель адиабаты.
         iter (int): Итерируемая переменная (не используется в логике, возможно зарезервирована).
 
     Returns:
-        tuple: (q, betta, T_st_otn, lambd, S_1)
-            q (list of float): Тепловой поток к стенке.
-            betta (list of float): Коэффициент скорости.
-            T_st_otn (list of float): Относительная температура стенки.
-            lambd (list of float): Коэффициент расширения потока.
-            S_1 (list of float): Вспомогательная характеристика теплоотдачи.
+        tuple: (q, betta, T_st_otn, lambd, S_1) — массивы NumPy по точкам:
+            q (np.ndarray): Тепловой поток к стенке.
+            betta (np.ndarray): Коэффициент скорости.
+            T_st_otn (np.ndarray): Относительная температура стенки.
+            lambd (np.ndarray): Коэффициент расширения потока.
+            S_1 (np.ndarray): Вспомогательная характеристика теплоотдачи.
     """
-    lambd = []
-    betta = []
-
-    for i in number:
-        F_i = F_otn[i]
-
-        if i <= Y.index(min(Y)):  # До критики → дозвук
-            lambd_i = solve_lambda(F_i, k, lower=0.01, upper=1.0)
-        else:  # После критики → сверхзвук
-            lambd_i = solve_lambda(F_i, k, lower=1.0, upper=4.0)
+    if active_backend() != "python":
+        return convective_heat_flux(number, Y, c_p_T_0g, c_p_T_st, T_st_g, T_og, mu_og, R_og, D_otn, d_kp, F_otn,
+                                    b, p_k, k)
+    lambd, betta, factor = q_kon_invariants(number, Y, D_otn, d_kp, F_otn, b, p_k, k)
+    n = len(lambd)
 
-        if lambd_i is None:
-            lambd_i = 0  # или np.nan, или continue
-        lambd.append(lambd_i)
+    c_p_sr = 0.5 * (c_p_T_0g + np.asarray(c_p_T_st, dtype=float)[:n])
+    T_st_g = np.asarray(T_st_g, dtype=float)[:n]
+    T_st_otn = T_st_g / T_og
 
-        betta.append(lambd_i * math.sqrt((k - 1) / (k + 1)))
+    S_1 = (2.065 * c_p_sr * (T_og - T_st_g) * (mu_og ** 0.15)) / (
+        ((R_og * T_og) ** 0.425) *
+        ((1 + T_st_otn) ** 0.595) *
+        ((3 + T_st_otn) ** 0.15))
 
-    c_p_sr = [0.5 * (c_p_T_0g + c_p_st_i) for c_p_st_i in c_p_T_st]
+    denominator = 1 - T_st_otn - 0.1 * betta ** 2
+    slab_zed = 1.769 * ((1 - betta ** 2 + betta ** 2 * (1 - 0.086 * (1 - betta ** 2) / denominator)) /
+                        denominator) ** 0.54
 
-    T_st_otn = [T_st / T_og for T_st in T_st_g]
-
-    S_1 = [
-        (2.065 * c_p_sr[i] * (T_og - T_st_g[i]) * (mu_og ** 0.15)) /
-        (((R_og * T_og) ** 0.425) *
-         ((1 + T_st_otn[i]) ** 0.595) *
-         ((3 + T_st_otn[i]) ** 0.15))
-        for i in range(len(number))
-    ]
-
-    slab_alpha = 1.813 * ((2 / (k + 1)) ** (0.85 / (k - 1))) * ((2 * k / (k + 1)) ** 0.425)
-
-    slab_zed = [
-        1.769 * ((1 - betta[i] ** 2 + betta[i] ** 2 *
-                  (1 - 0.086 * (1 - betta[i] ** 2) /
-                   (1 - T_st_otn[i] - 0.1 * betta[i] ** 2))) /
-                 (1 - T_st_otn[i] - 0.1 * betta[i] ** 2)) ** 0.54
-        for i in range(len(number))
-    ]
-
-    A = 0.01352
-    B = [0.4842 * A * slab_alpha * slab_zed[i] for i in range(len(number))]
-
-    q = [
-        b * 1e-6 * B[i] * (((1 - betta[i] ** 2) * (p_k * 1e6) ** 0.85 * S_1[i]) /
-                          (D_otn[i] ** 1.82 * d_kp ** 0.15 * 0.75 ** 0.58))
-        for i in range(len(number))
-    ]
+    q = factor * slab_zed * S_1
 
     return q, betta, T_st_otn, lambd, S_1
 def find_l_e_D(M_co2, M, p_k, M_h2o, X, Y, R_k, T_k):
@@ -536,17 +591,27 @@ def find_l_e_D(M_co2, M, p_k, M_h2o, X, Y, R_k, T_k):
     eps_h2o = beta_h2o * eps_0_h2o
 
     return eps_h2o
-def find_q_l(eps_g, T_k, phi, D_otn, number, Y):
+@stage_cached
+def find_q_l(eps_g, T_k, phi, D_otn, number, Y, X=None):
     """
     Расчёт лучистого теплового потока (q_l) в разных сечениях канала охлаждения.
 
+    У головки поток линейно растёт от 0.25 до полной мощности на длине `Q_L_RAMP_LENGTH`.
+    Если передан `X`, участок роста определяется по координате (подходит для любой сетки,
+    в том числе адаптивной), иначе — по первым 51 узлам сетки "fixed".
+    Индексы критического сечения и первого сечения с D_отн < 1.2 находятся один раз, пять зон
+    (рост у головки, камера, сужение до критики, критика, сопло) выбираются масками по массивам.
+    Поток не зависит от температуры стенки, поэтому результат хранится по содержимому аргументов.
+
     Args:
         eps_g (float): Эффективная степень чёрнотелости продуктов сгорания.
         T_k (float): Температура стенки (K).
-        phi (float): Коэффициент относительной площади.
+        phi (float or list of float): Коэффициент относительной площади — одно значение или по узлам
+            канала (например, меньше в зонах завесного охлаждения).
         D_otn (list of float): Список относительных диаметров.
         number (list of int): Индексы расчётных сечений.
         Y (list of float): Радиальные координаты.
+        X (list of float, optional): Осевые координаты узлов, м.
 
     Returns:
         list of float: Список лучистых тепловых потоков [МВт/м²].
@@ -555,28 +620,32 @@ def find_q_l(eps_g, T_k, phi, D_otn, number, Y):
     eps_st_ef = 0.5 * (eps_st + 1)
     c_0 = 5.67  # Постоянная Стефана-Больцмана * 10⁻⁸
 
-    q_l_km = eps_st_ef * eps_g * c_0 * ((T_k / 100) ** 4)
+    number = np.asarray(number, dtype=int)
+    D_otn = np.asarray(D_otn, dtype=float)
+    phi = np.broadcast_to(np.asarray(phi, dtype=float), D_otn.shape)[number]
+    D = D_otn[number]
+
+    q_l_km = eps_st_ef * eps_g * c_0 * ((T_k / 100) ** 4) * 1e-6
     q_l_kc = q_l_km * phi
 
     comparison_number = 1.2
-    index_of_element = next((idx for idx, val in enumerate(D_otn) if val < comparison_number), -1)
-
-    q_l = []
-    for i in number:
-        if i <= 51:
-            # Линейный рост между 0.25 и полной мощностью на 51 точках
-            base = q_l_km * 0.25 * 1e-6
-            delta = (q_l_km * phi * 1e-6) - base
-            q_l.append(base + delta * (i / 51))
-        elif i < index_of_element:
-            q_l.append(q_l_km * phi * 1e-6)
-        elif i >= index_of_element and i < Y.index(min(Y)):
-            q_l.append(q_l_kc * 1e-6 * (1 - 12.5 * ((1.2 - D_otn[i]) ** 2)))
-        elif i == Y.index(min(Y)):
-            q_l.append(0.5 * q_l_kc * 1e-6)
-        else:
-            q_l.append((0.5 * q_l_kc * 1e-6) / (D_otn[i] ** 2))
-    return q_l
+    below = np.flatnonzero(D_otn < comparison_number)
+    index_of_element = int(below[0]) if below.size else -1
+    throat = int(np.argmin(Y))  # Индекс критического сечения (первый минимум радиуса)
+
+    ramp = number / 51 if X is None else np.asarray(X, dtype=float)[number] / Q_L_RAMP_LENGTH
+    base = q_l_km * 0.25
+    q_l = np.select(
+        [ramp <= 1,  # Линейный рост между 0.25 и полной мощностью на участке у головки
+         number < index_of_element,
+         number < throat,
+         number == throat],
+        [base + (q_l_kc - base) * ramp,
+         q_l_kc,
+         q_l_kc * (1 - 12.5 * ((1.2 - D) ** 2)),
+         0.5 * q_l_kc],
+        0.5 * q_l_kc / D ** 2)
+    return q_l.tolist()
 def find_q_sum(q_kon, q_l):
     """
     Суммирует конвективный и лучистый тепловые потоки по каждому сечению.
@@ -622,26 +691,13 @@ def find_temp_slozh_2(ind_peret,delta_S,q_sum,a,number,p_ohl,m_ohl,T_nach,name_o
     Примечание:
         Использует вспомогательную функцию `find_temp()` для интегрирования температуры вдоль канала.
     """
-    mid_index = ind_peret
-    # --- 🔹 1. По потоку (от камеры к середине) ---
-    number_part1=number[:mid_index]
-    delta_S_part1 = delta_S[:mid_index]  # Оставляем вторую половину
-    p_ohl_part1 = p_ohl[:mid_index]
-    q_sum_part1 = np.array(q_sum[:mid_index])  # Оставляем вторую половину
-    T_part1, C_p_ohl_part1, C_p_raznitsa_part1 = find_temp(
-        number_part1, delta_S_part1, p_ohl_part1, q_sum_part1, m_ohl, a, T_nach,name_ohl,T_aray,p_aray,C_aray, reverse=False)
-    T_middle = T_part1[-1]
-
-    # --- 🔹 2. Противоток (от середины к выходу сопла) ---
-    number_part2 = number[mid_index:]
-    delta_S_part2 = delta_S[mid_index:]  # Оставляем вторую половину
-    q_sum_part2 = np.array(q_sum[mid_index:])  # Оставляем вторую половину
-    p_ohl_part2=p_ohl[mid_index:]
-    T_part2, C_p_ohl_part2, C_p_raznitsa_part2 = find_temp(
-        number_part2, delta_S_part2, p_ohl_part2, q_sum_part2, m_ohl, a, T_middle,name_ohl,T_aray,p_aray,C_aray, reverse=True)
-    T_final = np.concatenate((T_part1, T_part2))
-    C_p_ohl_final = np.concatenate((C_p_ohl_part1, C_p_ohl_part2))
-    C_p_raznitsa_final = np.concatenate((C_p_raznitsa_part1, C_p_raznitsa_part2))
+    coolant = (name_ohl, T_aray, p_aray, C_aray)
+    network = CoolantNetwork([
+        Segment("к середине", None, ind_peret, m_ohl, T_nach, reverse=False),  # По потоку: от камеры к середине
+        Segment("к соплу", ind_peret, None, m_ohl, "к середине", reverse=True),  # Противоток: от середины к выходу сопла
+    ], coolant)
+    T_final, C_p_ohl_final, C_p_raznitsa_final, _ = solve_network(network, number, delta_S, p_ohl, q_sum, a, find_temp,
+                                                                  method=FIND_TEMP_METHOD, tol=FIND_TEMP_TOL)
     print(f'Максимальная температура охладителя: {max(T_final)} К, подогрев составляет {max(T_final) - min(T_final):.2f}К')
     return T_final, C_p_ohl_final, C_p_raznitsa_final
 def find_temp_slozh_1(ind_peret,delta_S,q_sum,a,number,p_ohl,m_ohl,T_nach,name_ohl,T_aray,p_aray,C_aray):
@@ -677,23 +733,13 @@ def find_temp_slozh_1(ind_peret,delta_S,q_sum,a,number,p_ohl,m_ohl,T_nach,name_o
     Примечание:
         Основана на вызове функции `find_temp`, которая производит численное интегрирование температуры.
     """
-    mid_index = ind_peret
-    # --- 🔹 2. По потоку (от середины к выходу сопла) ---
-    delta_S_fwd = delta_S[mid_index:]  # Оставляем первую половину
-    q_sum_fwd = np.array(q_sum[mid_index:])  # Масштабируем
-
-    T_part2, C_p_ohl_part2, C_p_raznitsa_part2 = find_temp(
-        number[mid_index:], delta_S_fwd, p_ohl[mid_index:], q_sum_fwd, m_ohl, a, T_nach,name_ohl,T_aray,p_aray,C_aray, reverse=False)
-    T_middle = T_part2[-1]
-    # --- 🔹 1. Противоток (от середины к началу сопла) ---
-    T_part1, C_p_ohl_part1, C_p_raznitsa_part1 = find_temp(
-        number[:mid_index], delta_S[:mid_index], p_ohl[:mid_index], q_sum[:mid_index], m_ohl, a, T_middle,name_ohl,T_aray,p_aray,C_aray, reverse=True)
-    # Температура в середине сопла после первой стадии
-    # Объединяем два участка в один массив
-    T_final = np.concatenate((T_part1, T_part2))
-    C_p_ohl_final = np.concatenate((C_p_ohl_part1, C_p_ohl_part2))
-    C_p_raznitsa_final = np.concatenate((C_p_raznitsa_part1, C_p_raznitsa_part2))
-
+    coolant = (name_ohl, T_aray, p_aray, C_aray)
+    network = CoolantNetwork([
+        Segment("к соплу", ind_peret, None, m_ohl, T_nach, reverse=False),  # По потоку: от середины к выходу сопла
+        Segment("к камере", None, ind_peret, m_ohl, "к соплу", reverse=True),  # Противоток: от середины к началу сопла
+    ], coolant)
+    T_final, C_p_ohl_final, C_p_raznitsa_final, _ = solve_network(network, number, delta_S, p_ohl, q_sum, a, find_temp,
+                                                                  method=FIND_TEMP_METHOD, tol=FIND_TEMP_TOL)
     print(f'Максимальная температура охладителя: {max(T_final)} К, подогрев составляет {max(T_final) - min(T_final):.2f}К')
     return T_final, C_p_ohl_final, C_p_raznitsa_final
 def find_temp_slozh_5(m_ohl_1,m_ohl_2,index_peret_1,index_peret_2,delta_S,q_sum,number,p_ohl,a,T_nach,name_ohl,T_aray,p_aray,C_aray):
@@ -729,27 +775,13 @@ def find_temp_slozh_5(m_ohl_1,m_ohl_2,index_peret_1,index_peret_2,delta_S,q_sum,
             - C_p_raznitsa_final (np.ndarray): Изменение теплоёмкости между точками.
             - m_final (np.ndarray): Массив массовых расходов вдоль канала.
     """
-    T_nach_0 = T_nach
-    # --- 🔹 1. Противоток (от index_peret_2 к камере) ---
-    T_part2, C_p_ohl_part2, C_p_raznitsa_part2 = find_temp(number[:index_peret_2],
-                                                           delta_S[:index_peret_2],
-                                                           p_ohl[:index_peret_2],
-                                                           q_sum[:index_peret_2], m_ohl_2, a, T_nach,
-                                                           name_ohl, T_aray, p_aray, C_aray, reverse=True)
-    T_middle_2 = T_part2[0]
-    m_ohl_array_2 = [m_ohl_2] * len(T_part2)
-    # --- 🔹 2. По потоку (от index_peret_2 к концу зеркальной части) --
-    delta_S_fwd = delta_S[index_peret_2:]  # Оставляем первую половину
-    m_ohl_array_1 = [m_ohl_1] * len(delta_S_fwd)
-    q_sum_fwd = np.array(q_sum[index_peret_2:])  # Масштабируем
-    T_part1, C_p_ohl_part1, C_p_raznitsa_part1 = find_temp(number[index_peret_2:], delta_S_fwd, p_ohl[index_peret_2:],
-                                                           q_sum_fwd, m_ohl_1, a, T_nach_0, name_ohl, T_aray, p_aray,
-                                                           C_aray, reverse=False)
-
-    T_final = np.concatenate((T_part2, T_part1))
-    m_final = np.concatenate((m_ohl_array_2, m_ohl_array_1))
-    C_p_ohl_final = np.concatenate((C_p_ohl_part2, C_p_ohl_part1))
-    C_p_raznitsa_final = np.concatenate((C_p_raznitsa_part2, C_p_raznitsa_part1))
+    coolant = (name_ohl, T_aray, p_aray, C_aray)
+    network = CoolantNetwork([
+        Segment("к камере", None, index_peret_2, m_ohl_2, T_nach, reverse=True),  # Противоток: от index_peret_2 к камере
+        Segment("к соплу", index_peret_2, None, m_ohl_1, T_nach, reverse=False),  # По потоку: от index_peret_2 к соплу
+    ], coolant)
+    T_final, C_p_ohl_final, C_p_raznitsa_final, m_final = solve_network(network, number, delta_S, p_ohl, q_sum, a,
+                                                                        find_temp, method=FIND_TEMP_METHOD, tol=FIND_TEMP_TOL)
     print(f'Максимальная температура охладителя: {max(T_final)} К, подогрев составляет {max(T_final) - min(T_final):.2f}К')
     return T_final, C_p_ohl_final, C_p_raznitsa_final,m_final
 def find_temp_slosh_tema(m_ohl_1,m_ohl_2,index_peret_1,index_peret_2,delta_S,q_sum,number,p_ohl,a,T_nach,name_ohl,T_aray,p_aray,C_aray):
@@ -759,8 +791,8 @@ def find_temp_slosh_tema(m_ohl_1,m_ohl_2,index_peret_1,index_peret_2,delta_S,q_s
     ▸ Противоток от разворота 2 к развороту 1,
     ▸ Суммарный противоток от камеры до разворота 2, где два потока объединяются.
 
-    Сначала считается температура в двух потоках независимо, затем рассчитывается
-    результирующий объединённый поток с учётом энтальпийной равновесной температуры.
+    Сначала считается температура в двух потоках независимо (одновременно), затем рассчитывается
+    результирующий объединённый поток с температурой смешения по балансу энтальпии.
 
     Args:
         m_ohl_1 (float): Массовый расход охладителя в первом (прямоточном) потоке [кг/с].
@@ -785,31 +817,15 @@ def find_temp_slosh_tema(m_ohl_1,m_ohl_2,index_peret_1,index_peret_2,delta_S,q_s
             - C_p_raznitsa_final (np.ndarray): Изменение теплоёмкости между точками.
             - m_final (np.ndarray): Распределение массового расхода вдоль длины канала.
     """
-    T_nach_0=T_nach
-    # --- 🔹 1. По потоку (от index_peret_1 к выходу сопла) --
-    delta_S_fwd = delta_S[index_peret_1:]  # Оставляем первую половину
-    m_ohl_array_1=[m_ohl_1]*len(delta_S_fwd)
-    q_sum_fwd = np.array(q_sum[index_peret_1:])  # Масштабируем
-    T_part1, C_p_ohl_part1, C_p_raznitsa_part1 = find_temp(number[index_peret_1:], delta_S_fwd, p_ohl[index_peret_1:], q_sum_fwd, m_ohl_1, a, T_nach,name_ohl,T_aray,p_aray,C_aray, reverse=False)
-    T_middle = T_part1[-1]
-
-    # --- 🔹 2. Противоток (от index_peret_2 к index_peret_1) ---
-    T_part2, C_p_ohl_part2, C_p_raznitsa_part2 = find_temp(number[index_peret_2:index_peret_1], delta_S[index_peret_2:index_peret_1], p_ohl[index_peret_2:index_peret_1], q_sum[index_peret_2:index_peret_1], m_ohl_2, a, T_nach,name_ohl,T_aray,p_aray,C_aray, reverse=True)
-    T_middle_2 = T_part2[0]
-    m_ohl_array_2 = [m_ohl_2] * len(T_part2)
-    # --- 🔹 3. Суммарный противопоток (от камеры к index_peret_2) ---
-    T_nach_1=((m_ohl_1*T_middle)+(m_ohl_2*T_middle_2))/(m_ohl_1+m_ohl_2)
-    T_part3, C_p_ohl_part3, C_p_raznitsa_part3 = find_temp(number[:index_peret_2],
-                                                           delta_S[:index_peret_2], p_ohl[:index_peret_2],
-                                                           q_sum[:index_peret_2], m_ohl_2+m_ohl_1, a, T_nach_1,name_ohl,T_aray,p_aray,C_aray,
-                                                           reverse=True)
-    T_middle_3 = T_part3[-1]
-    m_ohl_array_3 = [m_ohl_1+m_ohl_2] * len(T_part3)
+    coolant = (name_ohl, T_aray, p_aray, C_aray)
+    network = CoolantNetwork([
+        Segment("к соплу", index_peret_1, None, m_ohl_1, T_nach, reverse=False),  # По потоку: от index_peret_1 к соплу
+        Segment("противоток", index_peret_2, index_peret_1, m_ohl_2, T_nach, reverse=True),  # От index_peret_2 к index_peret_1
+        Segment("к камере", None, index_peret_2, m_ohl_1 + m_ohl_2, ("к соплу", "противоток"), reverse=True),  # Смешение
+    ], coolant)
+    T_final, C_p_ohl_final, C_p_raznitsa_final, m_final = solve_network(network, number, delta_S, p_ohl, q_sum, a,
+                                                                        find_temp, method=FIND_TEMP_METHOD, tol=FIND_TEMP_TOL)
     print(f'Расчёт противотока завершён!')
-    T_final = np.concatenate((T_part3, T_part2,T_part1))
-    m_final=np.concatenate((m_ohl_array_3, m_ohl_array_2,m_ohl_array_1))
-    C_p_ohl_final = np.concatenate((C_p_ohl_part3, C_p_ohl_part2,C_p_ohl_part1))
-    C_p_raznitsa_final = np.concatenate((C_p_raznitsa_part3, C_p_raznitsa_part2,C_p_raznitsa_part1))
     print(f'Максимальная температура охладителя: {max(T_final)} К, подогрев составляет {max(T_final) - min(T_final):.2f}К')
     return T_final, C_p_ohl_final, C_p_raznitsa_final,m_final
 def find_temp_slozh_6(m_ohl_1,m_ohl_2,index_peret,delta_S,q_sum,number,p_ohl,a,T_nach_1,T_nach_2,T_aray_1,p_aray_1,C_aray_1,T_aray_2,p_aray_2,C_aray_2):
@@ -845,30 +861,65 @@ def find_temp_slozh_6(m_ohl_1,m_ohl_2,index_peret,delta_S,q_sum,number,p_ohl,a,T
             - C_p_raznitsa_final (np.ndarray): Изменение теплоёмкости между точками.
             - m_final (np.ndarray): Распределение массового расхода вдоль канала.
     """
-    # --- 🔹 1. Противоток (от index_peret к соплу) ---
-    T_part1, C_p_ohl_part1, C_p_raznitsa_part1 = find_temp(number[index_peret:],
-                                                           delta_S[index_peret:],
-                                                           p_ohl[index_peret:],
-                                                           q_sum[index_peret:], m_ohl_1, a, T_nach_1,
-                                                           'АТ', T_aray_1, p_aray_1, C_aray_1, reverse=True)
-    m_ohl_array_1 = [m_ohl_1] * len(T_part1)
-    # --- 🔹 2. Противоток (от камеры к index_peret) ---
-    T_part2, C_p_ohl_part2, C_p_raznitsa_part2 = find_temp(number[:index_peret],
-                                                           delta_S[:index_peret],
-                                                           p_ohl[:index_peret],
-                                                           q_sum[:index_peret], m_ohl_2, a, T_nach_2,
-                                                           'НДМГ', T_aray_2, p_aray_2, C_aray_2, reverse=True)
-    m_ohl_array_2=[m_ohl_2]*len(T_part2)
-    T_final = np.concatenate((T_part2, T_part1))
-    m_final = np.concatenate((m_ohl_array_2, m_ohl_array_1))
-    C_p_ohl_final = np.concatenate((C_p_ohl_part2, C_p_ohl_part1))
-    C_p_raznitsa_final = np.concatenate((C_p_raznitsa_part2, C_p_raznitsa_part1))
+    network = CoolantNetwork([
+        Segment("АТ", index_peret, None, m_ohl_1, T_nach_1, reverse=True,
+                coolant=('АТ', T_aray_1, p_aray_1, C_aray_1)),  # Противоток: от index_peret к соплу
+        Segment("НДМГ", None, index_peret, m_ohl_2, T_nach_2, reverse=True,
+                coolant=('НДМГ', T_aray_2, p_aray_2, C_aray_2)),  # Противоток: от камеры к index_peret
+    ], None)
+    T_final, C_p_ohl_final, C_p_raznitsa_final, m_final = solve_network(network, number, delta_S, p_ohl, q_sum, a,
+                                                                        find_temp, method=FIND_TEMP_METHOD, tol=FIND_TEMP_TOL)
     print(f'Максимальная температура охладителя: {max(T_final)} К, подогрев составляет {max(T_final) - min(T_final):.2f}К')
     return T_final, C_p_ohl_final, C_p_raznitsa_final, m_final
-def find_temp(number, delta_S, p_ohl, q_sum, m_ohl, a, T_nach,name_ohl, T_aray, p_aray, C_aray, reverse=True, max_iter=100, verbose=False):
+def find_temp_variant(variant, source, a):
+    """
+    Рассчитывает температуру охладителя по схеме охлаждения выбранного варианта.
+
+    Общая точка вызова для окон расчёта и пересчёта: параметры берутся из атрибутов `source`
+    (класс `user` или окно пересчёта), так что ветвление по вариантам записано один раз.
+
+    Args:
+        variant (int): Номер варианта схемы охлаждения (1–6).
+        source (object): Объект с параметрами расчёта (number, delta_S, q_sum, p_ohl, T_nach, cooler,
+            T_aray, p_aray, C_aray, m_ohl, X и параметры разветвлений варианта).
+        a (float): Коэффициент к тепловому потоку.
+
+    Returns:
+        tuple: (T_ohl, C_p_ohl, C_p_raznitsa, m_ohl_array).
+    """
+    s = source
+    if variant == 1:
+        return find_temp_slosh_tema(s.m_ohl_1, s.m_ohl_2, s.index_peret_1, s.index_peret_2, s.delta_S, s.q_sum,
+                                    s.number, s.p_ohl, a, s.T_nach, s.cooler, s.T_aray, s.p_aray, s.C_aray)
+    if variant == 5:
+        return find_temp_slozh_5(s.m_ohl_1, s.m_ohl_2, s.index_peret_1, s.index_peret_2, s.delta_S, s.q_sum,
+                                 s.number, s.p_ohl, a, s.T_nach, s.cooler, s.T_aray, s.p_aray, s.C_aray)
+    if variant == 6:
+        return find_temp_slozh_6(s.m_ohl_1, s.m_ohl_2, s.ind_peret, s.delta_S, s.q_sum, s.number, s.p_ohl, a,
+                                 s.T_nach_1, s.T_nach_2, s.T_aray, s.p_aray, s.C_aray,
+                                 s.T_aray_2, s.p_aray_2, s.C_aray_2)
+    m_ohl_array = [s.m_ohl] * len(s.X)
+    if variant == 2:
+        T_ohl, C_p_ohl, C_p_raznitsa = find_temp(s.number, s.delta_S, s.p_ohl, s.q_sum, s.m_ohl, a, s.T_nach,
+                                                 s.cooler, s.T_aray, s.p_aray, s.C_aray)
+    elif variant == 3:
+        T_ohl, C_p_ohl, C_p_raznitsa = find_temp_slozh_2(s.ind_peret, s.delta_S, s.q_sum, a, s.number, s.p_ohl,
+                                                         s.m_ohl, s.T_nach, s.cooler, s.T_aray, s.p_aray, s.C_aray)
+    else:
+        T_ohl, C_p_ohl, C_p_raznitsa = find_temp_slozh_1(s.ind_peret, s.delta_S, s.q_sum, a, s.number, s.p_ohl,
+                                                         s.m_ohl, s.T_nach, s.cooler, s.T_aray, s.p_aray, s.C_aray)
+    return T_ohl, C_p_ohl, C_p_raznitsa, m_ohl_array
+def find_temp(number, delta_S, p_ohl, q_sum, m_ohl, a, T_nach,name_ohl, T_aray, p_aray, C_aray, reverse=True, max_iter=100, verbose=False,
+              method=None, tol=None):
     """
     Численно рассчитывает температурный профиль охладителя вдоль канала с учётом теплообмена и переменной теплоёмкости.
 
+    Приращение температуры на участке находится либо подбором с шагом 1 К до совпадения
+    теплоёмкостей в пределах 5 % ("step"), либо решением баланса энергии m·C·ΔT = q·ΔS
+    методом Ньютона или секущих с заданной точностью (`solve_temp_step`).
+    В режиме "enthalpy" энтальпия охладителя накапливается по всему каналу h[i] = h[i-1] + q·ΔS/m
+    (точный баланс энергии), а температура в узлах находится обратной функцией T(h, p) таблицы энтальпии.
+
     Args:
         number (list of int): Индексы расчётных сечений.
         delta_S (list of float): Площади поперечного сечения (м²).
@@ -884,6 +935,8 @@ def find_temp(number, delta_S, p_ohl, q_sum, m_ohl, a, T_nach,name_ohl, T_aray,
         reverse (bool): Направление расчёта (True — от выхода к камере).
         max_iter (int): Максимальное число итераций на одну точку.
         verbose (bool): Печатать отладочную информацию.
+        method (str, optional): "step", "newton", "secant" или "enthalpy"; по умолчанию `FIND_TEMP_METHOD`.
+        tol (float, optional): Точность ΔT для "newton" и "secant", К; по умолчанию `FIND_TEMP_TOL`.
 
     Returns:
         tuple:
@@ -891,6 +944,8 @@ def find_temp(number, delta_S, p_ohl, q_sum, m_ohl, a, T_nach,name_ohl, T_aray,
             C_p_ohl (list of float): Cp охладителя.
             C_p_raznitsa (list of float): Ошибка между приближениями.
     """
+    method = FIND_TEMP_METHOD if method is None else method
+    tol = FIND_TEMP_TOL if tol is None else tol
     if reverse:
         number = number[::-1]
         delta_S = delta_S[::-1][1:]
@@ -902,27 +957,65 @@ def find_temp(number, delta_S, p_ohl, q_sum, m_ohl, a, T_nach,name_ohl, T_aray,
 
     q_sum = np.array(q_sum) * a
 
-    for i in range(1, len(number)):
-        delta_T_step = 1.0
-        for iteration in range(max_iter):
-            T_sr_1 = T[i - 1] + 0.5 * delta_T_step
-            Cp_1 = interpolate_C(T_sr_1, p_ohl[i - 1], name_ohl, T_aray, p_aray, C_aray)
-
-            delta_T_2 = 0.5 * (q_sum[i - 1] + q_sum[i]) * 1e6 * delta_S[i - 1] / (m_ohl * Cp_1)
-
-            T_sr_2 = T[i - 1] + 0.5 * delta_T_2
-            Cp_2 = interpolate_C(T_sr_2, p_ohl[i - 1], name_ohl, T_aray, p_aray, C_aray)
-
-            diff = abs(Cp_2 - Cp_1) * 100 / Cp_1
-            if diff <= 5:
-                T[i] = T[i - 1] + delta_T_2
-                C_p_ohl[i] = Cp_2
+    if method == "step" and active_backend() == "numba" and (
+            name_ohl not in COMPLEX_COMPONENTS or prometey_properties.PROPERTY_BACKEND == "isobar"):
+        # Тот же подбор в ядре Numba по коэффициентам таблицы теплоёмкости (см. KERNEL_BACKEND); для охладителей
+        # с зависимостью от давления результат совпадает с циклом ниже только внутри таблицы, иначе считается циклом
+        table = get_enthalpy_table(name_ohl, T_aray, p_aray, C_aray)
+        T_k, C_k, diff_k, inside = march_step(q_sum, delta_S, p_ohl, m_ohl, T_nach, table, max_iter)
+        if inside or name_ohl not in COMPLEX_COMPONENTS:
+            T, C_p_ohl, C_p_raznitsa = T_k.tolist(), C_k.tolist(), diff_k.tolist()
+            if reverse:
+                return T[::-1], C_p_ohl[::-1], C_p_raznitsa[::-1]
+            return T, C_p_ohl, C_p_raznitsa
+
+    if method == "enthalpy":
+        n = len(number)
+        table = get_enthalpy_table(name_ohl, T_aray, p_aray, C_aray)
+        p_nodes = np.asarray(p_ohl[:n], dtype=float)
+        Q_m = 0.5 * (q_sum[:n - 1] + q_sum[1:n]) * 1e6 * np.asarray(delta_S[:n - 1], dtype=float) / m_ohl
+        h = table.enthalpy(T_nach, p_nodes[0])[0] + np.concatenate(([0.0], np.cumsum(Q_m)))
+        T_nodes = table.temperature(h, p_nodes)
+        T_nodes[0] = T_nach
+        # C в середине участков и её отличие от средней теплоёмкости участка Q / (m·ΔT)
+        C_mid = table.heat_capacity(0.5 * (T_nodes[1:] + T_nodes[:-1]), p_nodes[:-1])
+        dT = np.diff(T_nodes)
+        C_mean = np.divide(Q_m, dT, out=C_mid.copy(), where=dT != 0)
+        T = T_nodes.tolist()
+        C_p_ohl = [0] + C_mid.tolist()
+        C_p_raznitsa = [0] + (np.abs(C_mid - C_mean) * 100 / C_mid).tolist()
+    else:
+        for i in range(1, len(number)):
+            if method != "step":
+                Q_m = 0.5 * (q_sum[i - 1] + q_sum[i]) * 1e6 * delta_S[i - 1] / m_ohl
+                delta_T, Cp, diff, converged = solve_temp_step(T[i - 1], p_ohl[i - 1], Q_m, name_ohl, T_aray, p_aray,
+                                                               C_aray, method, tol, max_iter)
+                T[i] = T[i - 1] + delta_T
+                C_p_ohl[i] = Cp
                 C_p_raznitsa[i] = diff
-                break
-            delta_T_step += 1
-
-            if iteration == max_iter - 1 and verbose:
-                print(f"[WARN] Невозможно достичь сходимости на i={i}")
+                if not converged and verbose:
+                    print(f"[WARN] Невозможно достичь сходимости на i={i}")
+                continue
+            delta_T_step = 1.0
+            for iteration in range(max_iter):
+                T_sr_1 = T[i - 1] + 0.5 * delta_T_step
+                Cp_1 = interpolate_C(T_sr_1, p_ohl[i - 1], name_ohl, T_aray, p_aray, C_aray)
+
+                delta_T_2 = 0.5 * (q_sum[i - 1] + q_sum[i]) * 1e6 * delta_S[i - 1] / (m_ohl * Cp_1)
+
+                T_sr_2 = T[i - 1] + 0.5 * delta_T_2
+                Cp_2 = interpolate_C(T_sr_2, p_ohl[i - 1], name_ohl, T_aray, p_aray, C_aray)
+
+                diff = abs(Cp_2 - Cp_1) * 100 / Cp_1
+                if diff <= 5:
+                    T[i] = T[i - 1] + delta_T_2
+                    C_p_ohl[i] = Cp_2
+                    C_p_raznitsa[i] = diff
+                    break
+                delta_T_step += 1
+
+                if iteration == max_iter - 1 and verbose:
+                    print(f"[WARN] Невозможно достичь сходимости на i={i}")
 
     # Начальные значения Cp и корректировка направлений
     C_p_ohl[0] = interpolate_C(T_nach, p_ohl[0], name_ohl, T_aray, p_aray, C_aray)
@@ -937,20 +1030,21 @@ def find_temp(number, delta_S, p_ohl, q_sum, m_ohl, a, T_nach,name_ohl, T_aray,
     return T, C_p_ohl, C_p_raznitsa
 def is_inside(points, test_point):
     """
-    Проверяет, принадлежит ли тестовая точка выпуклой области, построенной по заданным точкам с помощью триангуляции Делоне.
+    Проверяет, принадлежит ли тестовая точка выпуклой области, построенной по заданным точкам.
+
+    Уравнения граней выпуклой оболочки вычисляются один раз для одинакового набора точек,
+    поэтому повторные проверки (в том числе массивов точек) не строят триангуляцию заново.
 
     Args:
         points (array-like): Массив точек (n x d), где n — количество точек, d — размерность (2D или 3D и т.д.).
-        test_point (array-like): Точка, которую нужно проверить (в том же числе измерений, что и points).
+        test_point (array-like): Точка (d) или массив точек (m x d), которые нужно проверить.
 
     Returns:
-        bool: True, если точка лежит внутри выпуклой оболочки множества, иначе False.
+        bool or np.ndarray: True, если точка лежит внутри выпуклой оболочки множества, иначе False
+        (для массива точек — маска).
     """
-    points = np.asarray(points)
-    test_point = np.asarray(test_point)
     try:
-        tri = Delaunay(points)
-        return tri.find_simplex(test_point) >= 0
+        return get_hull(points).contains(test_point)
     except Exception as e:
         raise ValueError(f"Ошибка при проверке принадлежности точки: {e}")
 def interpolate_C(T_input, p_input, name_ohl,T_aray, p_aray, C_aray,verbose=False):
@@ -958,7 +1052,7 @@ def interpolate_C(T_input, p_input, name_ohl,T_aray, p_aray, C_aray,verbose=Fals
     Интерполирует или экстраполирует значение теплоёмкости C по температуре и давлению.
 
     Для "сложных" компонентов (с зависимостью от давления) используется 2D-интерполяция по (T, p),
-    в остальных случаях — линейная 1D-интерполяция по температуре.
+    в остальных случаях — линейная интерполяция по температуре по заранее отсортированной таблице.
 
     Args:
         T_input (float): Температура, К.
@@ -972,27 +1066,124 @@ def interpolate_C(T_input, p_input, name_ohl,T_aray, p_aray, C_aray,verbose=Fals
     Returns:
         float: Интерполированное значение C.
     """
-    complex_components = {"Водород", "АТ", "Кислород", "Гелий", "Аммиак", "Метан"}
-    if name_ohl in complex_components:
-        points = np.column_stack((T_aray, p_aray))
-        test_point = np.array([T_input, p_input])
+    if name_ohl in COMPLEX_COMPONENTS:
+        # Сетка, триангуляция и интерполяторы строятся один раз при загрузке таблицы
+        coolant, key = get_coolant(name_ohl, T_aray, p_aray, C_aray)
 
-        if is_inside(points, test_point):
-            C_interp = griddata(points, C_aray, (T_input, p_input), method='cubic')
-            if np.isnan(C_interp):
-                C_interp = griddata(points, C_aray, (T_input, p_input), method='linear')
-        else:
-            if verbose:
-                print(f"⚠️ Экстраполяция по (T={T_input}, p={p_input}) для '{name_ohl}'")
-            rbf = RBFInterpolator(points, C_aray, kernel='thin_plate_spline')
-            C_interp = rbf([[T_input, p_input]])[0]
+        if verbose and not coolant.contains(T_input, p_input):
+            print(f"⚠️ Экстраполяция по (T={T_input}, p={p_input}) для '{name_ohl}'")
+        C_interp = coolant.value(key, T_input, p_input)
     else:
-        f_interp = interp1d(T_aray, C_aray, kind='linear', fill_value='extrapolate')
-        if verbose and (T_input < np.min(T_aray) or T_input > np.max(T_aray)):
+        # Таблица сортируется и проверяется один раз, интерполятор на каждый вызов не создаётся
+        table, key = get_temperature_table(name_ohl, T_aray, C_aray)
+        if verbose and not table.contains(T_input):
             print(f"⚠️ Экстраполяция по температуре T={T_input} для '{name_ohl}'")
-        C_interp = f_interp(T_input)
+        C_interp = table.value(key, T_input)
 
     return float(C_interp)
+def interpolate_dC_dT(T_input, p_input, name_ohl, T_aray, p_aray, C_aray):
+    """
+    Вычисляет производную теплоёмкости по температуре dC/dT.
+
+    Для "сложных" компонентов берётся по коэффициентам сплайнов изобар (в замкнутом виде),
+    для остальных — наклон отрезка таблицы, содержащего температуру.
+
+    Args:
+        T_input (float): Температура, К.
+        p_input (float): Давление, МПа.
+        name_ohl (str): Название охладителя.
+        T_aray (array-like): Массив температур.
+        p_aray (array-like): Массив давлений (для сложных веществ).
+        C_aray (array-like): Таблица значений теплоёмкости.
+
+    Returns:
+        float: dC/dT, Дж/(кг·К²).
+    """
+    if name_ohl in COMPLEX_COMPONENTS:
+        coolant, key = get_coolant(name_ohl, T_aray, p_aray, C_aray)
+        return float(coolant.derivative(key, T_input, p_input))
+    table, key = get_temperature_table(name_ohl, T_aray, C_aray)
+    return float(table.derivative(key, T_input))
+def solve_temp_step(T_prev, p, Q_m, name_ohl, T_aray, p_aray, C_aray, method="newton", tol=1e-3, max_iter=50):
+    """
+    Решает баланс энергии на участке канала m·C(T_ср)·ΔT = Q относительно приращения температуры ΔT.
+
+    Теплоёмкость берётся в середине участка T_ср = T_prev + ΔT/2 (как в пошаговом подборе).
+    Метод Ньютона использует dC/dT из таблицы свойств, метод секущих — только значения C.
+    Шаг ограничивается: приращение не меняет знак и не изменяется более чем вдвое за итерацию,
+    при неудачной производной выполняется шаг простой итерации ΔT = Q / (m·C).
+
+    Args:
+        T_prev (float): Температура в начале участка, К.
+        p (float): Давление охладителя, МПа.
+        Q_m (float): Подведённая теплота, отнесённая к расходу Q / m, Дж/кг.
+        name_ohl (str): Название охладителя.
+        T_aray, p_aray, C_aray (list): Таблицы свойств охладителя.
+        method (str): "newton" или "secant".
+        tol (float): Абсолютная точность ΔT, К.
+        max_iter (int): Максимальное число итераций.
+
+    Returns:
+        tuple: (delta_T, Cp, diff, converged) — приращение температуры, C в середине участка
+        (по последнему приближению),
+        изменение C на последней итерации (%) и признак сходимости.
+    """
+    Cp = interpolate_C(T_prev, p, name_ohl, T_aray, p_aray, C_aray)
+    delta_T = Q_m / Cp
+    if delta_T == 0.0:
+        return 0.0, Cp, 0.0, True
+    prev = None  # (ΔT, F) предыдущей итерации для метода секущих
+    for _ in range(max_iter):
+        Cp_new = interpolate_C(T_prev + 0.5 * delta_T, p, name_ohl, T_aray, p_aray, C_aray)
+        diff = abs(Cp_new - Cp) * 100 / Cp
+        Cp = Cp_new
+        F = Cp * delta_T - Q_m
+        if method == "newton":
+            dF = Cp + 0.5 * delta_T * interpolate_dC_dT(T_prev + 0.5 * delta_T, p, name_ohl, T_aray, p_aray, C_aray)
+        elif prev is not None and delta_T != prev[0]:
+            dF = (F - prev[1]) / (delta_T - prev[0])
+        else:
+            dF = Cp
+        prev = (delta_T, F)
+        step = F / dF if dF * delta_T * Q_m > 0 else delta_T - Q_m / Cp  # Защита от неверного знака производной
+        delta_T_new = min(max(delta_T - step, 0.5 * delta_T), 2.0 * delta_T) if delta_T > 0 else \
+            max(min(delta_T - step, 0.5 * delta_T), 2.0 * delta_T)
+        if abs(delta_T_new - delta_T) <= tol:
+            return delta_T_new, Cp, diff, True  # C взята в середине участка с точностью до tol/2
+        delta_T = delta_T_new
+    return delta_T, Cp, diff, False
+def find_rebro_params(rho_ohl, K_ohl, f, m_ohl, d_g, delta_reb, h, beta_reb, t, lambda_st_vn, n):
+    """
+    Вычисляет скорость, теплоотдачу охладителя и эффективность оребрения сразу для всех узлов.
+
+    Args:
+        rho_ohl (np.ndarray): Плотность охладителя в узлах.
+        K_ohl (np.ndarray): Комплекс K охладителя в узлах.
+        f (list of float): Площадь проходного сечения тракта, м².
+        m_ohl (list of float): Массовый расход в узлах, кг/с.
+        d_g (list of float): Гидравлический диаметр, мм.
+        delta_reb (float): Толщина ребра, м.
+        h (float): Высота ребра, м.
+        beta_reb (float): Угол наклона рёбер, рад.
+        t (np.ndarray): Шаг рёбер, м.
+        lambda_st_vn (list of float): Теплопроводность стенки в узлах.
+        n (int): Число узлов.
+
+    Returns:
+        tuple: (u_ohl, alpha_ohl, E, kpd_r) — списки значений по узлам.
+    """
+    f = np.asarray(f, dtype=float)[:n]
+    m_ohl = np.asarray(m_ohl, dtype=float)[:n]
+    d_g = np.asarray(d_g, dtype=float)[:n]
+    lambda_st_vn = np.asarray(lambda_st_vn, dtype=float)[:n]
+    t = t[:n]
+    u_ohl = m_ohl / (f * rho_ohl)
+    alpha_ohl = (0.023 * K_ohl * ((m_ohl / f) ** 0.8)) / ((d_g * 0.001) ** 0.2)
+    Bio = alpha_ohl / (lambda_st_vn / delta_reb)
+    psi = (h / delta_reb) * ((2 * Bio) ** 0.5)  # МАЗЕРАТТИ
+    E = np.tanh(psi) / psi  # МАЗЕРАТТИ
+    kpd_r = 1 + ((1 / math.cos(beta_reb)) * (2 * (h / t) * E - (delta_reb / t)))
+    return u_ohl.tolist(), alpha_ohl.tolist(), E.tolist(), kpd_r.tolist()
 def find_temp_st_g(T_og, T_st_g, T_ohl, alpha_ohl, kpd_r, q_kon, q_l,delta_st, lambda_st_vn, d, number, ind_smena, lambda_st_vn_1,verbose=False):
     """
     Расчёт температуры горячей и холодной стенки камеры охлаждения ЖРД, с учётом смены материала в определённой точке.
@@ -1033,109 +1224,146 @@ def find_temp_st_g(T_og, T_st_g, T_ohl, alpha_ohl, kpd_r, q_kon, q_l,delta_st, l
     x_s = np.array([373, 423, 473, 523, 573, 623, 673, 723, 773, 823, 873, 923, 973, 1023, 1073, 1123, 1173])
     y_s = np.array([16.5, 16.8, 17.4, 18.1, 19, 19.9, 20.5, 21.6, 22.1, 23, 23.6, 24.1, 25.1, 25.6, 26.6, 27.8, 28.8])
 
-    for t_ohl_i, alpha_i, eta_i, q_k_i, q_l_i, i in zip(
-        T_ohl, alpha_ohl, kpd_r, q_kon, q_l, number
-    ):
-        q_k_i *= 1e6
-        q_l_i *= 1e6
-        q_total = q_k_i + q_l_i
-
-        lambda_list = lambda_st_vn if i <= ind_smena else lambda_st_vn_1
-        lambda_i = lambda_list[i]
-
-        R_cond = delta_st / lambda_i
-        R_conv = 1 / (alpha_i * eta_i)
-        R_total = R_cond + R_conv
-
-        T_ohl_wall = t_ohl_i
-        T_st_g_i = d * (
-            T_og / (T_og - T_st_g[i]) +
-            T_ohl_wall / (R_total * q_total) +
-            q_l_i / q_total
-        ) / (
-            1 / (T_og - T_st_g[i]) + 1 / (R_total * q_total)
-        )
-
-        T_st_g_itog.append(T_st_g_i)
-
-        T_lambda = T_st_g_i
-        if i <= ind_smena:
-            lambda_val = np.interp(T_lambda, x_m, y_m, left=y_m[0], right=y_m[-1])
-        else:
-            lambda_val = np.interp(T_lambda, x_s, y_s, left=y_s[0], right=y_s[-1])
-        lambda_mat.append(lambda_val)
-
-        T_st_ohl.append(T_st_g_i - (delta_st / lambda_val) * q_total)
+    if active_backend() != "python":
+        T_st_g_itog, T_st_ohl, lambda_mat = (values.tolist() for values in wall_temperature(
+            T_og, T_st_g, T_ohl, alpha_ohl, kpd_r, q_kon, q_l, delta_st, lambda_st_vn, d, number, ind_smena,
+            lambda_st_vn_1, x_m, y_m, x_s, y_s))
+    else:
+        for t_ohl_i, alpha_i, eta_i, q_k_i, q_l_i, i in zip(
+            T_ohl, alpha_ohl, kpd_r, q_kon, q_l, number
+        ):
+            q_k_i *= 1e6
+            q_l_i *= 1e6
+            q_total = q_k_i + q_l_i
+
+            lambda_list = lambda_st_vn if i <= ind_smena else lambda_st_vn_1
+            lambda_i = lambda_list[i]
+
+            R_cond = delta_st / lambda_i
+            R_conv = 1 / (alpha_i * eta_i)
+            R_total = R_cond + R_conv
+
+            T_ohl_wall = t_ohl_i
+            T_st_g_i = d * (
+                T_og / (T_og - T_st_g[i]) +
+                T_ohl_wall / (R_total * q_total) +
+                q_l_i / q_total
+            ) / (
+                1 / (T_og - T_st_g[i]) + 1 / (R_total * q_total)
+            )
+
+            T_st_g_itog.append(T_st_g_i)
+
+            T_lambda = T_st_g_i
+            if i <= ind_smena:
+                lambda_val = np.interp(T_lambda, x_m, y_m, left=y_m[0], right=y_m[-1])
+            else:
+                lambda_val = np.interp(T_lambda, x_s, y_s, left=y_s[0], right=y_s[-1])
+            lambda_mat.append(lambda_val)
+
+            T_st_ohl.append(T_st_g_i - (delta_st / lambda_val) * q_total)
 
-        if verbose:
-            print(f"[{i}] T_st_g: {T_st_g_i:.2f} K, λ: {lambda_val:.2f}, T_st_ohl: {T_st_ohl[-1]:.2f} K")
+            if verbose:
+                print(f"[{i}] T_st_g: {T_st_g_i:.2f} K, λ: {lambda_val:.2f}, T_st_ohl: {T_st_ohl[-1]:.2f} K")
 
-        k += 1
+            k += 1
 
     # Экспорт в Excel (опционально)
     df = pd.DataFrame({'T_st_g_itog': T_st_g_itog, 'T_st_ohl': T_st_ohl})
     df.fillna('-').to_excel('table5.xlsx', index=False)
 
     return T_st_g_itog, T_st_ohl, lambda_mat, lambda_mat
-def find_params_ohl(name_ohl):
+def read_property_workbook(file_path, num_columns):
+    """
+    Читает столбцы таблицы свойств охладителя из Excel-файла (до первой пустой ячейки).
+
+    Args:
+        file_path (str): Путь к Excel-файлу.
+        num_columns (int): Количество столбцов.
+
+    Returns:
+        list of list: Значения столбцов без заголовка.
+    """
+    workbook = load_workbook(file_path)
+    sheet = workbook.active
+
+    columns = [[] for _ in range(num_columns)]
+    start_row = 2  # пропускаем заголовок
+
+    for col in range(1, num_columns + 1):
+        row = start_row
+        while True:
+            cell_value = sheet.cell(row=row, column=col).value
+            if cell_value is None:
+                break
+            columns[col - 1].append(cell_value)
+            row += 1
+    return columns
+def compile_coolant_cache():
+    """
+    Создаёт (или обновляет) двоичный кэш для всех таблиц "Properties of components".
+
+    Удобно вызвать один раз перед пакетным расчётом, чтобы процессы не разбирали Excel.
+    """
+    for name_ohl, (file_path, num_columns) in COOLANT_FILES.items():
+        if read_table_cache(file_path) is None:
+            write_table_cache(file_path, read_property_workbook(file_path, num_columns))
+def find_params_ohl(name_ohl, use_cache=True):
     """
     Загружает теплофизические свойства охладителя по его названию из Excel-файла.
 
+    Таблица берётся из двоичного кэша рядом с Excel-файлом, если он актуален,
+    иначе Excel разбирается заново, проверяется (`validate_table`) и кэш перезаписывается.
+    Отчёты о покрытии таблицы и о сетке свойств выводятся только после такой проверки.
+
     Разделение:
     - Сложные охладители (зависят от давления): возвращаются 7 столбцов, включая `p`.
     - Простые охладители: 6 столбцов, без давления.
 
     Args:
         name_ohl (str): Название охладителя (например, "АТ", "Водород", "НДМГ", и т.д.)
+        use_cache (bool): Использовать двоичный кэш таблицы (False — всегда читать Excel).
 
     Returns:
         tuple:
             - Если компонент сложный: (T, p, ρ, C_p, μ, λ, K)
             - Если компонент простой: (T, ρ, C_p, μ, λ, K)
     """
-    file_map = {
-        "Водород": ("data/Properties of components/Hydrogen_Features.xlsx", 7),
-        "АТ": ("data/Properties of components/Nitrogen-tetraoxide-Features.xlsx", 7),
-        "Кислород": ("data/Properties of components/Oxygen-Features.xlsx", 7),
-        "Гелий": ("data/Properties of components/Helium-Features.xlsx", 7),
-        "Аммиак": ("data/Properties of components/Ammonia-Features.xlsx", 7),
-        "Метан": ("data/Properties of components/Methane-Features.xlsx", 7),
-        "НДМГ": ("data/Properties of components/Hydrazine_Features.xlsx", 6),
-        "Аэрозин-50": ("data/Properties of components/Aerosin-50-Features.xlsx", 6),
-        "Вода": ("data/Properties of components/Water_Features.xlsx", 6),
-        "Керосин-Т1": ("data/Properties of components/Kerosene-T-1-Features.xlsx", 6),
-        "Этанол": ("data/Properties of components/Ethanol-Features.xlsx", 6),
-    }
-
-    if name_ohl not in file_map:
+    if name_ohl not in COOLANT_FILES:
         raise ValueError(f"Неизвестный охладитель: {name_ohl}")
 
-    file_path, num_columns = file_map[name_ohl]
+    file_path, num_columns = COOLANT_FILES[name_ohl]
 
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"Файл не найден: {file_path}")
 
-    workbook = load_workbook(file_path)
-    sheet = workbook.active
-
-    columns = [[] for _ in range(num_columns)]
-    start_row = 2  # пропускаем заголовок
-
-    for col in range(1, num_columns + 1):
-        row = start_row
-        while True:
-            cell_value = sheet.cell(row=row, column=col).value
-            if cell_value is None:
-                break
-            columns[col - 1].append(cell_value)
-            row += 1
+    columns = read_table_cache(file_path) if use_cache else None
+    validated = columns is None
+    if validated:
+        columns, issues = validate_table(name_ohl, read_property_workbook(file_path, num_columns), num_columns == 7)
+        for issue in issues:
+            print(f"⚠️ Таблица '{name_ohl}': {issue}")
+        if use_cache:
+            write_table_cache(file_path, columns)  # В кэш попадает уже проверенная таблица
 
     # Распаковка
     if num_columns == 7:
         T, p, rho, Cp, mu, lamb, K = columns
+        register_coolant(name_ohl, T, p, report=validated, **dict(zip(PROPERTY_KEYS, (rho, Cp, mu, lamb, K))))  # Интерполяторы строятся один раз
+        if validated:
+            cov = coverage_report(name_ohl)
+            print(f"Покрытие таблицы '{name_ohl}': T {cov['T_range'][0]:g}–{cov['T_range'][1]:g} К, "
+                  f"p {cov['p_range'][0]:g}–{cov['p_range'][1]:g} МПа, {cov['points']} точек на {cov['isobars']} изобарах, "
+                  f"нет узлов сетки: {cov['missing_nodes']}, наибольший шаг по T {cov['max_T_step']:g} К, "
+                  f"вне оболочки (экстраполяция) {cov['outside_hull'] * 100:.1f} % области")
         return T, p, rho, Cp, mu, lamb, K
     else:
         T, rho, Cp, mu, lamb, K = columns
+        register_temperature_table(name_ohl, T, **dict(zip(PROPERTY_KEYS, (rho, Cp, mu, lamb, K))))
+        if validated:
+            cov = coverage_report(name_ohl)
+            print(f"Покрытие таблицы '{name_ohl}': T {cov['T_range'][0]:g}–{cov['T_range'][1]:g} К, "
+                  f"{cov['points']} точек, наибольший шаг по T {cov['max_T_step']:g} К (вне диапазона — линейная экстраполяция)")
         return T, rho, Cp, mu, lamb, K
 def find_nearest_index(array, value):
     """
@@ -0,0 +1,370 @@
+"""
+Модуль вычислительных ядер для поузловых циклов расчёта.
+
+Здесь реализованы ядра, работающие с массивами float64 (таблица теплоёмкости передаётся массивами
+коэффициентов `EnthalpyTable`: оси T и p и многочлены C(T) на интервалах изобар):
+- Расчёт температуры охладителя подбором с шагом 1 К (`march_step`, режим "step" в `find_temp`),
+- Температура горячей и холодной стенки (`wall_temperature`, `find_temp_st_g`),
+- Конвективный тепловой поток с подбором λ по отношению площадей (`convective_heat_flux`, `find_q_kon`),
+- Коэффициенты трения и местные потери давления (`friction_losses`, `tabl_5`).
+
+Способ вычисления выбирается переменной `KERNEL_BACKEND`:
+- "python" — исходные функции модуля `prometey_functions` (эталон, по умолчанию),
+- "numpy" — ядра на массивах NumPy,
+- "numba" — те же ядра, скомпилированные Numba в режиме nopython; если Numba не установлена,
+  используются ядра "numpy".
+
+Расчёт температуры охладителя последователен (каждый узел зависит от предыдущего) и не векторизуется,
+поэтому `march_step` ускоряется только Numba: при "numpy" `find_temp` выполняет исходный цикл.
+Теплоёмкость в `march_step` берётся по сплайнам изобар `EnthalpyTable`, поэтому для охладителей
+с зависимостью от давления ядро совпадает с исходным циклом только при `PROPERTY_BACKEND = "isobar"`
+и только внутри таблицы (`march_step` сообщает, вышел ли подбор за её границы).
+λ в `convective_heat_flux` находится делением отрезка с точностью 1e-12 вместо метода Брента с точностью 1e-6.
+"""
+import math
+import numpy as np
+try:
+    from numba import njit
+except ImportError:  # Numba не установлена — ядра выполняются средствами NumPy
+    njit = None
+
+KERNEL_BACKEND = "python"  # Поузловые циклы: "python" — исходные функции, "numpy" — ядра NumPy, "numba" — ядра Numba
+LAMBDA_ITERATIONS = 60  # Число делений отрезка при подборе λ (точность ~1e-12 на отрезке длиной 4)
+
+_numba_warned = False  # Предупреждение об отсутствии Numba выводится один раз
+def _jit(func):
+    """Компилирует ядро Numba (nopython), если она установлена, иначе возвращает функцию без изменений."""
+    return njit(cache=True)(func) if njit is not None else func
+def active_backend():
+    """
+    Способ вычисления с учётом установленных библиотек.
+
+    Returns:
+        str: "python", "numpy" или "numba".
+    """
+    global _numba_warned
+    if KERNEL_BACKEND not in ("python", "numpy", "numba"):
+        raise ValueError(f"Неизвестный способ вычисления ядер: {KERNEL_BACKEND}")
+    if KERNEL_BACKEND == "numba" and njit is None:
+        if not _numba_warned:
+            print("⚠️ Numba не установлена, используются ядра NumPy")
+            _numba_warned = True
+        return "numpy"
+    return KERNEL_BACKEND
+def _heat_capacity(T, p, T_axis, p_axis, c, extrapolate):
+    """Теплоёмкость в одной точке по коэффициентам `EnthalpyTable` (как `EnthalpyTable.heat_capacity`)."""
+    if not extrapolate:
+        T = min(max(T, T_axis[0]), T_axis[-1])
+    lo, hi = 0, len(T_axis) - 1
+    while hi - lo > 1:  # Интервал по T делением пополам
+        mid = (lo + hi) // 2
+        if T_axis[mid] <= T:
+            lo = mid
+        else:
+            hi = mid
+    dx = T - T_axis[lo]
+    j0, j1, w = 0, 0, 0.0
+    if len(p_axis) > 1:
+        p = min(max(p, p_axis[0]), p_axis[-1])
+        j0, j1 = 0, len(p_axis) - 1
+        while j1 - j0 > 1:
+            mid = (j0 + j1) // 2
+            if p_axis[mid] <= p:
+                j0 = mid
+            else:
+                j1 = mid
+        w = (p - p_axis[j0]) / (p_axis[j1] - p_axis[j0])
+    lower = ((c[0, lo, j0] * dx + c[1, lo, j0]) * dx + c[2, lo, j0]) * dx + c[3, lo, j0]
+    upper = ((c[0, lo, j1] * dx + c[1, lo, j1]) * dx + c[2, lo, j1]) * dx + c[3, lo, j1]
+    return lower + w * (upper - lower)
+def _make_march_step(heat_capacity):
+    """
+    Цикл режима "step" `find_temp` с заданной функцией теплоёмкости.
+
+    Для Numba передаётся скомпилированная `_heat_capacity`, без Numba — исходная функция Python.
+    Кроме профиля возвращается диапазон температур, в которых бралась теплоёмкость.
+    """
+    def march(q_sum, delta_S, p_ohl, m_ohl, T_nach, T_axis, p_axis, c, extrapolate, max_iter):
+        n = len(q_sum)
+        T = np.zeros(n)
+        C_p_ohl = np.zeros(n)
+        C_p_raznitsa = np.zeros(n)
+        T[0] = T_nach
+        T_min, T_max = T_nach, T_nach  # Диапазон T, в котором бралась теплоёмкость
+        for i in range(1, n):
+            Q_m = 0.5 * (q_sum[i - 1] + q_sum[i]) * 1e6 * delta_S[i - 1] / m_ohl
+            delta_T_step = 1.0
+            for iteration in range(max_iter):
+                T_sr_1 = T[i - 1] + 0.5 * delta_T_step
+                Cp_1 = heat_capacity(T_sr_1, p_ohl[i - 1], T_axis, p_axis, c, extrapolate)
+                delta_T_2 = Q_m / Cp_1
+                T_sr_2 = T[i - 1] + 0.5 * delta_T_2
+                Cp_2 = heat_capacity(T_sr_2, p_ohl[i - 1], T_axis, p_axis, c, extrapolate)
+                T_min = min(T_min, T_sr_1, T_sr_2)
+                T_max = max(T_max, T_sr_1, T_sr_2)
+                diff = abs(Cp_2 - Cp_1) * 100 / Cp_1
+                if diff <= 5:
+                    T[i] = T[i - 1] + delta_T_2
+                    C_p_ohl[i] = Cp_2
+                    C_p_raznitsa[i] = diff
+                    break
+                delta_T_step += 1
+        C_p_ohl[0] = heat_capacity(T_nach, p_ohl[0], T_axis, p_axis, c, extrapolate)
+        Cp_1_1 = heat_capacity(T[1], p_ohl[1], T_axis, p_axis, c, extrapolate)
+        C_p_raznitsa[0] = abs(Cp_1_1 - C_p_ohl[0]) * 100 / C_p_ohl[0]
+        T_min = min(T_min, T[1])
+        T_max = max(T_max, T[1])
+        return T, C_p_ohl, C_p_raznitsa, T_min, T_max
+    return march
+_march_step = _make_march_step(_heat_capacity)
+_march_step_numba = _jit(_make_march_step(_jit(_heat_capacity))) if njit is not None else None
+def march_step(q_sum, delta_S, p_ohl, m_ohl, T_nach, table, max_iter=100):
+    """
+    Температура охладителя вдоль участка подбором с шагом 1 К (режим "step" `find_temp`).
+
+    Цикл по узлам последовательный: при `KERNEL_BACKEND = "numba"` он скомпилирован,
+    иначе выполняется тот же цикл на Python по коэффициентам таблицы.
+
+    Args:
+        q_sum (array-like): Тепловой поток в узлах в порядке течения (с коэффициентом `a`), МВт/м².
+        delta_S (array-like): Площади теплообмена участков в порядке течения, м².
+        p_ohl (array-like): Давление охладителя, МПа (в порядке, который использует `find_temp`).
+        m_ohl (float): Массовый расход охладителя, кг/с.
+        T_nach (float): Температура на входе, К.
+        table (EnthalpyTable): Таблица теплоёмкости охладителя.
+        max_iter (int): Максимальное число подборов на узел.
+
+    Returns:
+        tuple: (T, C_p_ohl, C_p_raznitsa, inside) — массивы в порядке течения и признак того,
+            что теплоёмкость бралась только внутри таблицы по T и p.
+    """
+    kernel = _march_step_numba if active_backend() == "numba" else _march_step
+    p_ohl = np.asarray(p_ohl, dtype=float)
+    T, C_p_ohl, C_p_raznitsa, T_min, T_max = kernel(
+        np.asarray(q_sum, dtype=float), np.asarray(delta_S, dtype=float), p_ohl, float(m_ohl), float(T_nach),
+        table.T_axis, table.p_axis, table.c, table.extrapolate, max_iter)
+    p_used = p_ohl[:max(len(T) - 1, 2)]
+    inside = (table.T_axis[0] <= T_min and T_max <= table.T_axis[-1] and
+              table.p_axis[0] <= p_used.min() and p_used.max() <= table.p_axis[-1])
+    return T, C_p_ohl, C_p_raznitsa, bool(inside)
+@_jit
+def _wall_temperature_loop(T_og, T_st_g, T_ohl, alpha_ohl, kpd_r, q_kon, q_l, delta_st, lambda_1, lambda_2, d,
+                           number, ind_smena, x_m, y_m, x_s, y_s):
+    """Цикл `find_temp_st_g` по узлам."""
+    n = len(number)
+    T_st_g_itog = np.zeros(n)
+    T_st_ohl = np.zeros(n)
+    lambda_mat = np.zeros(n)
+    for k in range(n):
+        i = number[k]
+        q_k = q_kon[k] * 1e6
+        q_l_i = q_l[k] * 1e6
+        q_total = q_k + q_l_i
+        lambda_i = lambda_1[i] if i <= ind_smena else lambda_2[i]
+        R_total = delta_st / lambda_i + 1 / (alpha_ohl[k] * kpd_r[k])
+        T_st_g_i = d * (T_og / (T_og - T_st_g[i]) + T_ohl[k] / (R_total * q_total) + q_l_i / q_total) / (
+            1 / (T_og - T_st_g[i]) + 1 / (R_total * q_total))
+        if i <= ind_smena:
+            lambda_val = np.interp(T_st_g_i, x_m, y_m)
+        else:
+            lambda_val = np.interp(T_st_g_i, x_s, y_s)
+        T_st_g_itog[k] = T_st_g_i
+        lambda_mat[k] = lambda_val
+        T_st_ohl[k] = T_st_g_i - (delta_st / lambda_val) * q_total
+    return T_st_g_itog, T_st_ohl, lambda_mat
+def _wall_temperature_numpy(T_og, T_st_g, T_ohl, alpha_ohl, kpd_r, q_kon, q_l, delta_st, lambda_1, lambda_2, d,
+                            number, ind_smena, x_m, y_m, x_s, y_s):
+    """То же, что `_wall_temperature_loop`, на массивах NumPy."""
+    first = number <= ind_smena
+    q_l = q_l * 1e6
+    q_total = q_kon * 1e6 + q_l
+    R_total = delta_st / np.where(first, lambda_1[number], lambda_2[number]) + 1 / (alpha_ohl * kpd_r)
+    dT_g = T_og - T_st_g[number]
+    T_st_g_itog = d * (T_og / dT_g + T_ohl / (R_total * q_total) + q_l / q_total) / (1 / dT_g + 1 / (R_total * q_total))
+    lambda_mat = np.where(first, np.interp(T_st_g_itog, x_m, y_m), np.interp(T_st_g_itog, x_s, y_s))
+    return T_st_g_itog, T_st_g_itog - (delta_st / lambda_mat) * q_total, lambda_mat
+def wall_temperature(T_og, T_st_g, T_ohl, alpha_ohl, kpd_r, q_kon, q_l, delta_st, lambda_st_vn, d, number, ind_smena,
+                     lambda_st_vn_1, x_m, y_m, x_s, y_s):
+    """
+    Температура горячей и холодной стенки (ядро `find_temp_st_g`).
+
+    Args:
+        x_m, y_m (array-like): Теплопроводность материала до смены λ(T).
+        x_s, y_s (array-like): Теплопроводность материала после смены λ(T).
+        Остальные аргументы — как у `find_temp_st_g`.
+
+    Returns:
+        tuple: (T_st_g, T_st_ohl, lambda_mat) — массивы по узлам.
+    """
+    kernel = _wall_temperature_loop if active_backend() == "numba" else _wall_temperature_numpy
+    as_float = lambda arr: np.asarray(arr, dtype=float)
+    return kernel(float(T_og), as_float(T_st_g), as_float(T_ohl), as_float(alpha_ohl), as_float(kpd_r), as_float(q_kon),
+                  as_float(q_l), float(delta_st), as_float(lambda_st_vn), as_float(lambda_st_vn_1), float(d),
+                  np.asarray(number, dtype=np.int64), int(ind_smena),
+                  as_float(x_m), as_float(y_m), as_float(x_s), as_float(y_s))
+@_jit
+def _lambda_residual(lambda_, k, F_i):
+    """Левая часть минус правая уравнения расхода (см. `solve_lambda_batch`), NaN вне области определения."""
+    base = 1 - lambda_ * lambda_ * ((k - 1) / (k + 1))
+    if lambda_ <= 0 or F_i <= 0 or base <= 0:
+        return np.nan
+    return lambda_ * base ** (1 / (k - 1)) * ((k + 1) / 2) ** (1 / (k - 1)) - 1 / F_i
+@_jit
+def _convective_heat_flux_loop(F_otn, D_otn, subsonic, c_p_T_0g, c_p_T_st, T_st_g, T_og, mu_og, R_og, d_kp, b, p_k,
+                               k, iterations):
+    """Цикл `find_q_kon` по узлам: подбор λ делением отрезка и тепловой поток."""
+    n = len(F_otn)
+    q = np.zeros(n)
+    betta = np.zeros(n)
+    T_st_otn = np.zeros(n)
+    lambd = np.zeros(n)
+    S_1 = np.zeros(n)
+    lambda_max = math.sqrt((k + 1) / (k - 1)) - 1e-6
+    slab_alpha = 1.813 * ((2 / (k + 1)) ** (0.85 / (k - 1))) * ((2 * k / (k + 1)) ** 0.425)
+    for i in range(n):
+        lower, upper = (0.01, min(1.0, lambda_max)) if subsonic[i] else (1.0, min(4.0, lambda_max))
+        f_a = _lambda_residual(lower, k, F_otn[i])
+        f_b = _lambda_residual(upper, k, F_otn[i])
+        if abs(f_a) < 1e-8:
+            lambda_i = lower
+        elif abs(f_b) < 1e-8:
+            lambda_i = upper
+        elif np.isnan(f_a) or np.isnan(f_b) or f_a * f_b > 0:
+            lambda_i = 0.0
+        else:
+            for _ in range(iterations):
+                middle = 0.5 * (lower + upper)
+                f_m = _lambda_residual(middle, k, F_otn[i])
+                if f_m * f_a > 0:
+                    lower, f_a = middle, f_m
+                else:
+                    upper = middle
+            lambda_i = 0.5 * (lower + upper)
+        lambd[i] = lambda_i
+        betta[i] = lambda_i * math.sqrt((k - 1) / (k + 1))
+        T_st_otn[i] = T_st_g[i] / T_og
+        c_p_sr = 0.5 * (c_p_T_0g + c_p_T_st[i])
+        S_1[i] = (2.065 * c_p_sr * (T_og - T_st_g[i]) * (mu_og ** 0.15)) / (
+            ((R_og * T_og) ** 0.425) * ((1 + T_st_otn[i]) ** 0.595) * ((3 + T_st_otn[i]) ** 0.15))
+        b2 = betta[i] ** 2
+        denominator = 1 - T_st_otn[i] - 0.1 * b2
+        slab_zed = 1.769 * ((1 - b2 + b2 * (1 - 0.086 * (1 - b2) / denominator)) / denominator) ** 0.54
+        B = 0.4842 * 0.01352 * slab_alpha * slab_zed
+        q[i] = b * 1e-6 * B * (((1 - b2) * (p_k * 1e6) ** 0.85 * S_1[i]) /
+                               (D_otn[i] ** 1.82 * d_kp ** 0.15 * 0.75 ** 0.58))
+    return q, betta, T_st_otn, lambd, S_1
+def _convective_heat_flux_numpy(F_otn, D_otn, subsonic, c_p_T_0g, c_p_T_st, T_st_g, T_og, mu_og, R_og, d_kp, b, p_k,
+                                k, iterations):
+    """То же, что `_convective_heat_flux_loop`, на массивах NumPy (деление отрезка сразу для всех узлов)."""
+    def residual(lambda_):
+        base = 1 - lambda_ ** 2 * ((k - 1) / (k + 1))
+        valid = (lambda_ > 0) & (F_otn > 0) & (base > 0)
+        value = lambda_ * np.abs(base) ** (1 / (k - 1)) * ((k + 1) / 2) ** (1 / (k - 1)) - 1 / F_otn
+        return np.where(valid, value, np.nan)
+    lambda_max = math.sqrt((k + 1) / (k - 1)) - 1e-6
+    lower = np.where(subsonic, 0.01, 1.0)
+    upper = np.where(subsonic, min(1.0, lambda_max), min(4.0, lambda_max))
+    f_a = residual(lower)
+    f_b = residual(upper)
+    at_lower = np.abs(f_a) < 1e-8
+    at_upper = ~at_lower & (np.abs(f_b) < 1e-8)
+    bracketed = ~at_lower & ~at_upper & (f_a * f_b < 0)
+    a, b_ = lower.copy(), upper.copy()
+    for _ in range(iterations):
+        middle = 0.5 * (a + b_)
+        f_m = residual(middle)
+        left = f_m * f_a > 0
+        a = np.where(left, middle, a)
+        f_a = np.where(left, f_m, f_a)
+        b_ = np.where(left, b_, middle)
+    lambd = np.select([at_lower, at_upper, bracketed], [lower, upper, 0.5 * (a + b_)], 0.0)
+
+    betta = lambd * math.sqrt((k - 1) / (k + 1))
+    T_st_otn = T_st_g / T_og
+    c_p_sr = 0.5 * (c_p_T_0g + c_p_T_st)
+    S_1 = (2.065 * c_p_sr * (T_og - T_st_g) * (mu_og ** 0.15)) / (
+        ((R_og * T_og) ** 0.425) * ((1 + T_st_otn) ** 0.595) * ((3 + T_st_otn) ** 0.15))
+    slab_alpha = 1.813 * ((2 / (k + 1)) ** (0.85 / (k - 1))) * ((2 * k / (k + 1)) ** 0.425)
+    b2 = betta ** 2
+    denominator = 1 - T_st_otn - 0.1 * b2
+    slab_zed = 1.769 * ((1 - b2 + b2 * (1 - 0.086 * (1 - b2) / denominator)) / denominator) ** 0.54
+    B = 0.4842 * 0.01352 * slab_alpha * slab_zed
+    q = b * 1e-6 * B * (((1 - b2) * (p_k * 1e6) ** 0.85 * S_1) / (D_otn ** 1.82 * d_kp ** 0.15 * 0.75 ** 0.58))
+    return q, betta, T_st_otn, lambd, S_1
+def convective_heat_flux(number, Y, c_p_T_0g, c_p_T_st, T_st_g, T_og, mu_og, R_og, D_otn, d_kp, F_otn, b, p_k, k):
+    """
+    Конвективный тепловой поток (ядро `find_q_kon`).
+
+    Аргументы — как у `find_q_kon`.
+
+    Returns:
+        tuple: (q, betta, T_st_otn, lambd, S_1) — массивы по узлам.
+    """
+    kernel = _convective_heat_flux_loop if active_backend() == "numba" else _convective_heat_flux_numpy
+    number = np.asarray(number, dtype=np.int64)
+    as_float = lambda arr: np.asarray(arr, dtype=float)
+    return kernel(as_float(F_otn)[number], as_float(D_otn)[:len(number)], number <= int(np.argmin(Y)),
+                  float(c_p_T_0g), as_float(c_p_T_st)[:len(number)], as_float(T_st_g)[:len(number)], float(T_og),
+                  float(mu_og), float(R_og), float(d_kp), float(b), float(p_k), float(k), LAMBDA_ITERATIONS)
+@_jit
+def _friction_loop(c, delta_sheroh, u_ohl, rho_ohl, d_g, mu_ohl, t_N, delta_reb, h, delta_x_s, beta_reb, x, y):
+    """Цикл `tabl_5` по узлам: коэффициент трения и местные потери давления."""
+    n = len(rho_ohl)
+    Re = np.zeros(n)
+    delta_sheroh_otn = np.zeros(n)
+    Re_gr = np.zeros(n)
+    epsilon = np.zeros(n)
+    l = np.zeros(n)
+    delta_p = np.zeros(n)
+    for i in range(n):
+        Re[i] = rho_ohl[i] * u_ohl[i] * d_g[i] * 0.001 / mu_ohl[i]
+        delta_sheroh_otn[i] = delta_sheroh / (d_g[i] * 0.001)
+        omega = np.interp((t_N[i] * 0.001 - delta_reb) / h, x, y)
+        Re_gr[i] = 560 / delta_sheroh_otn[i]
+        if Re[i] <= 3500:
+            epsilon[i] = 64 * omega / Re[i]
+        elif Re[i] <= Re_gr[i]:
+            if 0.01 <= delta_sheroh_otn[i] <= 0.6001:
+                epsilon[i] = 0.1 * ((1.46 * delta_sheroh_otn[i] + (100 / Re[i])) ** 0.25) * omega
+            else:
+                epsilon[i] = (1.42 * omega) / ((math.log10(Re[i] / delta_sheroh_otn[i])) ** 2)
+        else:
+            epsilon[i] = omega / ((2 * math.log10(3.7 / delta_sheroh_otn[i])) ** 2)
+        l[i] = delta_x_s[i] / math.cos(beta_reb)
+        delta_p[i] = c * epsilon[i] * rho_ohl[i] * u_ohl[i] * u_ohl[i] * 0.5 * l[i] / (d_g[i] * 0.001)
+    return Re, delta_sheroh_otn, Re_gr, epsilon, l, delta_p
+def _friction_numpy(c, delta_sheroh, u_ohl, rho_ohl, d_g, mu_ohl, t_N, delta_reb, h, delta_x_s, beta_reb, x, y):
+    """То же, что `_friction_loop`, на массивах NumPy."""
+    Re = rho_ohl * u_ohl * d_g * 0.001 / mu_ohl
+    delta_sheroh_otn = delta_sheroh / (d_g * 0.001)
+    omega = np.interp((t_N * 0.001 - delta_reb) / h, x, y)
+    Re_gr = 560 / delta_sheroh_otn
+    with np.errstate(all="ignore"):  # Ветви вычисляются для всех узлов, в результат попадает только нужная
+        epsilon = np.select(
+            [Re <= 3500,
+             (Re <= Re_gr) & (delta_sheroh_otn >= 0.01) & (delta_sheroh_otn <= 0.6001),
+             Re <= Re_gr],
+            [64 * omega / Re,
+             0.1 * ((1.46 * delta_sheroh_otn + (100 / Re)) ** 0.25) * omega,
+             (1.42 * omega) / (np.log10(Re / delta_sheroh_otn) ** 2)],
+            omega / ((2 * np.log10(3.7 / delta_sheroh_otn)) ** 2))
+    l = delta_x_s / math.cos(beta_reb)
+    delta_p = c * epsilon * rho_ohl * u_ohl * u_ohl * 0.5 * l / (d_g * 0.001)
+    return Re, delta_sheroh_otn, Re_gr, epsilon, l, delta_p
+def friction_losses(c, delta_sheroh, u_ohl, rho_ohl, d_g, mu_ohl, t_N, delta_reb, h, delta_x_s, beta_reb, x, y):
+    """
+    Коэффициенты трения и местные потери давления (ядро `tabl_5`).
+
+    Args:
+        x, y (array-like): Поправка ω на форму канала по относительной ширине.
+        Остальные аргументы — как у `tabl_5`.
+
+    Returns:
+        tuple: (Re, delta_sheroh_otn, Re_gr, epsilon, l, delta_p) — массивы по узлам.
+    """
+    kernel = _friction_loop if active_backend() == "numba" else _friction_numpy
+    n = len(rho_ohl)
+    as_float = lambda arr: np.asarray(arr, dtype=float)[:n]
+    return kernel(float(c), float(delta_sheroh), as_float(u_ohl), as_float(rho_ohl), as_float(d_g), as_float(mu_ohl),
+                  as_float(t_N), float(delta_reb), float(h), as_float(delta_x_s), float(beta_reb),
+                  np.asarray(x, dtype=float), np.asarray(y, dtype=float))
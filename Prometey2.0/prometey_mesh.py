@@ -0,0 +1,142 @@
+"""
+Модуль адаптивной расчётной сетки вдоль оси камеры и сопла.
+
+Здесь реализованы:
+- Плотность узлов (`mesh_density`) по двум признакам: кривизне контура (погрешность линейной
+  интерполяции радиуса) и градиенту относительной площади F_отн,
+- Построение сетки (`adapt_mesh`) равномерным распределением плотности между опорными
+  сечениями с ограничением минимального и максимального шага и скорости его роста,
+- Опорные сечения: начало и конец контура, критическое сечение и заданные пользователем
+  координаты всегда являются узлами сетки, поэтому результаты выводятся в них без интерполяции
+  (`to_stations`).
+
+Способ построения сетки выбирается переменной `MESH_MODE`:
+- "fixed" — контур из файла Дедал с равномерным дополнением камеры (по умолчанию),
+- "adaptive" — сетка строится заново по плотности узлов: в цилиндрической части камеры узлов
+  становится меньше, у критического сечения — больше.
+
+Используется в `params_tabl_1` (окно выбора схемы охлаждения) перед построением таблицы 1.
+"""
+import numpy as np
+from scipy.interpolate import PchipInterpolator
+
+MESH_MODE = "fixed"  # Сетка вдоль оси: "fixed" — контур Дедала с дополнением камеры, "adaptive" — по плотности узлов
+MESH_TOL = 2e-5  # Допустимая относительная погрешность линейной интерполяции радиуса контура между узлами
+MESH_STEP = 0.02  # Допустимое относительное изменение F_отн между соседними узлами
+MESH_DX_MIN = 0.0005  # Минимальный шаг сетки, м
+MESH_DX_MAX = 0.020  # Максимальный шаг сетки, м
+MESH_GROWTH = 0.2  # Наибольшее изменение шага на единицу длины (|dh/dx|): соседние шаги отличаются не более чем на ~20 %
+MESH_STATIONS = ()  # Координаты X (м), в которых нужны результаты; всегда становятся узлами сетки
+MESH_SAMPLES = 20000  # Число точек вспомогательной сетки для вычисления плотности узлов
+def mesh_density(x, contour, tol=None, step=None, dx_min=None, dx_max=None):
+    """
+    Плотность узлов ρ(x) (узлов на метр) для построения сетки.
+
+    Признаки (берётся наибольший):
+    - кривизна: h²·|r''|/8 ≤ tol·r  →  ρ = √(|r''| / (8·tol·r)),
+    - площадь: h·|d ln F/dx| ≤ step, d ln F/dx = 2·r'/r.
+    Шаг h = 1/ρ ограничивается [dx_min, dx_max], скорость изменения шага — `MESH_GROWTH`.
+
+    Args:
+        x (np.ndarray): Вспомогательная сетка по оси, м (возрастающая).
+        contour (PchipInterpolator): Радиус контура r(x), м.
+        tol (float, optional): Погрешность по кривизне; по умолчанию `MESH_TOL`.
+        step (float, optional): Изменение между узлами; по умолчанию `MESH_STEP`.
+        dx_min (float, optional): Минимальный шаг, м; по умолчанию `MESH_DX_MIN`.
+        dx_max (float, optional): Максимальный шаг, м; по умолчанию `MESH_DX_MAX`.
+
+    Returns:
+        np.ndarray: Плотность узлов в точках `x`, 1/м.
+    """
+    tol = MESH_TOL if tol is None else tol
+    step = MESH_STEP if step is None else step
+    dx_min = MESH_DX_MIN if dx_min is None else dx_min
+    dx_max = MESH_DX_MAX if dx_max is None else dx_max
+
+    r = contour(x)
+    dr = contour(x, 1)
+    d2r = contour(x, 2)
+    rho = np.sqrt(np.abs(d2r) / (8 * tol * r))  # Кривизна контура
+    rho = np.maximum(rho, np.abs(2 * dr / r) / step)  # Градиент относительной площади
+
+    h = np.clip(1 / np.maximum(rho, 1e-300), dx_min, dx_max)
+    dx = np.diff(x)
+    for i in range(1, len(h)):  # Шаг растёт не быстрее MESH_GROWTH на единицу длины
+        h[i] = min(h[i], h[i - 1] + MESH_GROWTH * dx[i - 1])
+    for i in range(len(h) - 2, -1, -1):
+        h[i] = min(h[i], h[i + 1] + MESH_GROWTH * dx[i])
+    return 1 / h
+def adapt_mesh(X, Y, stations=(), tol=None, step=None, dx_min=None, dx_max=None):
+    """
+    Строит адаптивную сетку по контуру камеры и сопла.
+
+    Контур задаётся монотонным кубическим сплайном (PCHIP) по исходным точкам: он не даёт
+    ложных экстремумов, поэтому минимум радиуса остаётся в критическом сечении исходного контура.
+    Между соседними опорными сечениями узлы расставляются так, чтобы на каждый шаг приходилась
+    одинаковая доля ∫ρ dx (не менее одного шага).
+
+    Args:
+        X (list of float): Координаты контура, м (неубывающие; совпадающие точки отбрасываются).
+        Y (list of float): Радиусы контура, м.
+        stations (iterable of float): Координаты, которые должны стать узлами сетки, м.
+        tol, step, dx_min, dx_max (float, optional): Параметры `mesh_density`.
+
+    Returns:
+        tuple: (X, Y) — списки координат и радиусов узлов новой сетки, м.
+    """
+    X = np.asarray(X, dtype=float)
+    Y = np.asarray(Y, dtype=float)
+    keep = np.concatenate(([True], np.diff(X) > 1e-9 * (X[-1] - X[0])))  # Совпадающие точки контура (с точностью округления)
+    X, Y = X[keep], Y[keep]
+    contour = PchipInterpolator(X, Y)
+    x = np.linspace(X[0], X[-1], MESH_SAMPLES)
+    rho = mesh_density(x, contour, tol, step, dx_min, dx_max)
+    count = np.concatenate(([0.0], np.cumsum(0.5 * (rho[1:] + rho[:-1]) * np.diff(x))))  # ∫ρ dx
+
+    anchors = [X[0], X[np.argmin(Y)], X[-1]] + [s for s in stations if X[0] < s < X[-1]]
+    anchors = np.unique(np.asarray(anchors, dtype=float))
+    nodes = [anchors[:1]]
+    for left, right in zip(anchors[:-1], anchors[1:]):
+        c_left, c_right = np.interp([left, right], x, count)
+        n = max(1, int(np.ceil(c_right - c_left)))
+        inner = np.interp(np.linspace(c_left, c_right, n + 1)[1:-1], count, x)
+        nodes.append(inner)
+        nodes.append([right])
+    X_new = np.concatenate(nodes)
+    Y_new = contour(X_new)
+    Y_new[np.isin(X_new, X)] = Y[np.searchsorted(X, X_new[np.isin(X_new, X)])]  # Узлы исходного контура — без округлений сплайна
+    return X_new.tolist(), Y_new.tolist()
+def build_mesh(X, Y, stations=()):
+    """
+    Сетка для расчёта в соответствии с `MESH_MODE`.
+
+    Args:
+        X (list of float): Координаты контура, м.
+        Y (list of float): Радиусы контура, м.
+        stations (iterable of float): Обязательные узлы, м (дополняются `MESH_STATIONS`).
+
+    Returns:
+        tuple: (X, Y) — без изменений для "fixed", адаптивная сетка для "adaptive".
+    """
+    if MESH_MODE == "fixed":
+        return X, Y
+    if MESH_MODE != "adaptive":
+        raise ValueError(f"Неизвестный способ построения сетки: {MESH_MODE}")
+    return adapt_mesh(X, Y, tuple(stations) + tuple(MESH_STATIONS))
+def to_stations(X, stations=None, *profiles):
+    """
+    Значения профилей в заданных сечениях.
+
+    Если сечение совпадает с узлом сетки (так строится адаптивная сетка), берётся значение в узле,
+    иначе — линейная интерполяция между соседними узлами.
+
+    Args:
+        X (list of float): Координаты узлов, м.
+        stations (iterable of float, optional): Сечения, м; по умолчанию `MESH_STATIONS`.
+        *profiles (list of float): Профили в узлах сетки.
+
+    Returns:
+        tuple: (stations, values) — массив сечений и список массивов значений профилей в них.
+    """
+    stations = np.asarray(MESH_STATIONS if stations is None else stations, dtype=float)
+    return stations, [np.interp(stations, X, profile) for profile in profiles]
@@ -0,0 +1,302 @@
+"""
+Модуль сети каналов охлаждения.
+
+Здесь реализованы:
+- Описание схемы охлаждения как набора участков тракта (`Segment`): диапазон узлов канала,
+  направление течения, массовый расход, охладитель и вход участка — заданная температура,
+  выход другого участка (разветвление) или смешение выходов нескольких участков (слияние),
+- Смешение потоков по энтальпии (`mix_streams`),
+- Расчёт участков в порядке зависимостей (`solve_network`): по умолчанию последовательно;
+  по выбору (`NETWORK_EXECUTOR`) независимые ветви (например, прямоток и противоток варианта 1
+  до смешения, потоки АТ и НДМГ варианта 6) считаются в пуле процессов или потоков, результат
+  не зависит от порядка их завершения.
+
+Новая схема коллекторов задаётся списком участков, а не новой функцией.
+Используется функциями `find_temp_slozh_*`, `find_temp_slosh_tema` и `find_temp_variant`.
+"""
+import atexit
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+import os
+import pickle
+import numpy as np
+import prometey_kernels
+import prometey_properties
+from prometey_properties import get_enthalpy_table
+
+NETWORK_EXECUTOR = "serial"  # Расчёт независимых ветвей: "serial" — по очереди, "thread" — пул потоков, "process" — пул процессов (выгоден только для длинных участков)
+NETWORK_MAX_WORKERS = None  # Исполнителей для независимых ветвей: None — по числу ветвей (не более числа ядер), 1 — последовательно
+
+_process_pool = None  # Пул процессов создаётся один раз и используется при всех последующих расчётах
+_process_pool_size = 0
+_process_pool_coolants = {}  # Охладители, зарегистрированные в процессах пула при запуске: ключ содержимого → охладитель
+_SETTINGS = (
+    (prometey_properties, "PROPERTY_BACKEND"),
+    (prometey_properties, "GRID_METHOD"),
+    (prometey_properties, "GRID_SHAPE"),
+    (prometey_properties, "GRID_MAX_ERROR"),
+    (prometey_kernels, "KERNEL_BACKEND"),
+)  # Переключатели модулей, от которых зависит расчёт участка
+class Segment:
+    """
+    Участок тракта охлаждения.
+
+    Args:
+        name (str): Название участка (на него ссылаются входы других участков).
+        start (int): Первый узел канала участка.
+        stop (int or None): Узел после последнего (как в срезе, None — до конца канала).
+        m_ohl (float): Массовый расход охладителя на участке, кг/с.
+        inlet (float, str or tuple of str): Вход участка: температура, К; название участка,
+            выход которого подаётся на вход; или несколько названий — смешение их выходов.
+        reverse (bool): Направление течения (True — от последнего узла участка к первому).
+        coolant (tuple, optional): (name_ohl, T_aray, p_aray, C_aray) — охладитель участка;
+            по умолчанию охладитель сети.
+    """
+    def __init__(self, name, start, stop, m_ohl, inlet, reverse=True, coolant=None):
+        self.name = name
+        self.start = start
+        self.stop = stop
+        self.m_ohl = m_ohl
+        self.inlet = inlet
+        self.reverse = reverse
+        self.coolant = coolant
+    @property
+    def sources(self):
+        """Названия участков, от которых зависит вход."""
+        if isinstance(self.inlet, str):
+            return (self.inlet,)
+        if isinstance(self.inlet, (tuple, list)):
+            return tuple(self.inlet)
+        return ()
+    def nodes(self, n):
+        """Диапазон узлов участка в канале из `n` узлов."""
+        return range(*slice(self.start, self.stop).indices(n))
+    def inlet_node(self, n):
+        """Узел канала, в который входит поток участка."""
+        nodes = self.nodes(n)
+        return nodes[-1] if self.reverse else nodes[0]
+    def outlet(self, T):
+        """Температура на выходе участка по профилю в порядке узлов канала."""
+        return T[0] if self.reverse else T[-1]
+class CoolantNetwork:
+    """
+    Схема охлаждения: набор участков, покрывающих канал без перекрытий.
+
+    Args:
+        segments (list of Segment): Участки тракта.
+        coolant (tuple): (name_ohl, T_aray, p_aray, C_aray) — охладитель по умолчанию.
+    """
+    def __init__(self, segments, coolant):
+        self.segments = list(segments)
+        self.coolant = coolant
+        names = [segment.name for segment in self.segments]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Повторяющиеся названия участков: {names}")
+        for segment in self.segments:
+            for source in segment.sources:
+                if source not in names:
+                    raise ValueError(f"Участок '{segment.name}': неизвестный вход '{source}'")
+        self.order()
+    def coolant_of(self, segment):
+        """Охладитель участка."""
+        return self.coolant if segment.coolant is None else segment.coolant
+    def order(self):
+        """
+        Упорядочивает участки по зависимостям.
+
+        Returns:
+            list of list of Segment: Уровни участков; участки одного уровня независимы.
+        """
+        levels = []
+        done = set()
+        remaining = list(self.segments)
+        while remaining:
+            level = [segment for segment in remaining if all(source in done for source in segment.sources)]
+            if not level:
+                raise ValueError(f"Циклическая зависимость участков: {[segment.name for segment in remaining]}")
+            levels.append(level)
+            done.update(segment.name for segment in level)
+            remaining = [segment for segment in remaining if segment.name not in done]
+        return levels
+    def check_coverage(self, n):
+        """Проверяет, что участки покрывают все `n` узлов канала ровно по одному разу."""
+        count = np.zeros(n, dtype=int)
+        for segment in self.segments:
+            count[list(segment.nodes(n))] += 1
+        if np.any(count != 1):
+            raise ValueError(f"Участки не покрывают канал: узлы без участка или в нескольких участках "
+                             f"{np.flatnonzero(count != 1).tolist()}")
+def mix_streams(coolant, streams, p):
+    """
+    Температура смеси потоков одного охладителя по балансу энтальпии.
+
+    h_смеси = Σ m·h(T, p) / Σ m, температура смеси — обратная функция T(h_смеси, p).
+
+    Args:
+        coolant (tuple): (name_ohl, T_aray, p_aray, C_aray).
+        streams (list of tuple): Потоки (m_ohl, T) — расход, кг/с, и температура, К.
+        p (float): Давление в точке смешения, МПа.
+
+    Returns:
+        float: Температура смеси, К.
+    """
+    table = get_enthalpy_table(*coolant)
+    m = np.array([stream[0] for stream in streams], dtype=float)
+    T = np.array([stream[1] for stream in streams], dtype=float)
+    h_mix = float(np.sum(m * table.enthalpy(T, p)) / np.sum(m))
+    return float(table.temperature(h_mix, p)[0])
+def current_settings():
+    """Значения переключателей `_SETTINGS` в текущем процессе (передаются в процессы пула с каждым участком)."""
+    return tuple(getattr(module, name) for module, name in _SETTINGS)
+def apply_settings(settings):
+    """Устанавливает переключатели `_SETTINGS` в процессе пула."""
+    for (module, name), value in zip(_SETTINGS, settings):
+        setattr(module, name, value)
+def _coolant_key(coolant):
+    """Охладитель и содержимое его таблицы теплоёмкости (для сравнения наборов охладителей пула)."""
+    return (coolant[0],) + tuple(None if column is None else np.asarray(column, dtype=float).tobytes()
+                                 for column in coolant[1:])
+def _init_worker(coolants, settings):
+    """
+    Запуск процесса пула: переключатели как в основном процессе и заранее построенные
+    таблицы теплоёмкости и энтальпии охладителей (при запуске через spawn реестр свойств пуст).
+    """
+    apply_settings(settings)
+    for coolant in coolants:
+        get_enthalpy_table(*coolant)
+def get_process_pool(max_workers, coolants=()):
+    """
+    Возвращает общий пул процессов не менее чем из `max_workers` процессов.
+
+    Запуск процессов, загрузка модулей и регистрация охладителей `coolants` происходят один раз,
+    поэтому повторные расчёты (итерации пересчёта) не платят за создание пула. Пул создаётся
+    заново, если нужны ещё процессы или охладители, которых в нём нет; новый пул регистрирует
+    и прежние охладители, чтобы схемы с разными охладителями не пересоздавали его по очереди.
+    """
+    global _process_pool, _process_pool_size, _process_pool_coolants
+    keys = {_coolant_key(coolant): coolant for coolant in coolants}
+    if _process_pool is None or _process_pool_size < max_workers or not set(keys) <= set(_process_pool_coolants):
+        keys = {**_process_pool_coolants, **keys}
+        max_workers = max(max_workers, _process_pool_size)
+        shutdown_process_pool()
+        _process_pool = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                            initargs=(tuple(keys.values()), current_settings()))
+        _process_pool_size = max_workers
+        _process_pool_coolants = keys
+    return _process_pool
+@atexit.register
+def shutdown_process_pool():
+    """Останавливает общий пул процессов."""
+    global _process_pool, _process_pool_size, _process_pool_coolants
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=True, cancel_futures=True)
+    _process_pool = None
+    _process_pool_size = 0
+    _process_pool_coolants = {}
+def _solve_segment(march, segment, coolant, T_in, number, delta_S, p_ohl, q_sum, a, method, tol, settings=None):
+    """
+    Расчёт одного участка функцией `march` (сигнатура `find_temp`) по данным участка.
+
+    В процессе пула сначала устанавливаются переключатели основного процесса `settings`,
+    метод и точность передаются явно — результат не зависит от того, где считается участок.
+    """
+    if settings is not None:
+        apply_settings(settings)
+    return march(number, delta_S, p_ohl, q_sum, segment.m_ohl, a, T_in,
+                 coolant[0], coolant[1], coolant[2], coolant[3], reverse=segment.reverse, method=method, tol=tol)
+def solve_network(network, number, delta_S, p_ohl, q_sum, a, march, max_workers=None, executor=None, method=None,
+                  tol=None):
+    """
+    Рассчитывает температуру охладителя во всех участках схемы.
+
+    Участок запускается, как только известны температуры на его входе; при `executor` "thread"
+    или "process" готовые независимые участки считаются одновременно. Вход каждого участка зависит
+    только от результатов предыдущих участков, результаты собираются по участкам схемы, а не
+    по порядку завершения, а метод, точность и переключатели свойств и ядер передаются в процессы
+    пула явно, поэтому результат одинаков при любом исполнителе. Пул процессов окупается только
+    на длинных участках: для обычной сетки (сотни узлов) передача данных дороже самого расчёта.
+    Если пул процессов недоступен, расчёт выполняется последовательно.
+
+    Args:
+        network (CoolantNetwork): Схема охлаждения.
+        number (list of int): Индексы расчётных точек.
+        delta_S (list of float): Площади теплообмена участков канала, м².
+        p_ohl (list of float): Давление охладителя в узлах, МПа.
+        q_sum (list of float): Суммарный тепловой поток в узлах.
+        a (float): Коэффициент к тепловому потоку.
+        march (callable): Расчёт одного участка с сигнатурой `find_temp` (для пула процессов —
+            функция уровня модуля).
+        max_workers (int, optional): Число исполнителей; по умолчанию `NETWORK_MAX_WORKERS`.
+        executor (str, optional): "serial", "thread" или "process"; по умолчанию `NETWORK_EXECUTOR`.
+        method (str, optional): Метод `march` (в процессы пула передаётся явно, а не через переменные модуля).
+        tol (float, optional): Точность `march`.
+
+    Returns:
+        tuple: (T, C_p_ohl, C_p_raznitsa, m_ohl) — массивы по всем узлам канала.
+    """
+    n = len(number)
+    network.check_coverage(n)
+    executor = NETWORK_EXECUTOR if executor is None else executor
+    max_workers = NETWORK_MAX_WORKERS if max_workers is None else max_workers
+    if max_workers is None:
+        max_workers = min(max(len(level) for level in network.order()), os.cpu_count() or 1)
+    if executor == "serial":
+        max_workers = 1
+
+    results = {}
+    def inlet_temperature(segment):
+        if not segment.sources:
+            return segment.inlet
+        if len(segment.sources) == 1 and isinstance(segment.inlet, str):
+            return results[segment.inlet][0]
+        coolant = network.coolant_of(segment)
+        if {network.coolant_of(source)[0] for source in network.segments if source.name in segment.sources} != {coolant[0]}:
+            raise ValueError(f"Участок '{segment.name}': смешиваются разные охладители")
+        streams = [(results[name][1], results[name][0]) for name in segment.sources]
+        return mix_streams(coolant, streams, p_ohl[segment.inlet_node(n)])
+    def task(segment, settings=None):
+        """Аргументы `_solve_segment`: в исполнитель передаются только данные участка."""
+        part = slice(*slice(segment.start, segment.stop).indices(n)[:2])
+        return (march, segment, network.coolant_of(segment), inlet_temperature(segment),
+                number[part], delta_S[part], p_ohl[part], q_sum[part], a, method, tol, settings)
+    def store(segment, profile):
+        results[segment.name] = (segment.outlet(profile[0]), segment.m_ohl, profile)
+    def run_pool(pool, settings=None):
+        remaining = [segment for segment in network.segments if segment.name not in results]
+        pending = {}
+        while remaining or pending:
+            ready = [segment for segment in remaining if all(source in results for source in segment.sources)]
+            for segment in ready:
+                remaining.remove(segment)
+                pending[pool.submit(_solve_segment, *task(segment, settings))] = segment
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                store(pending.pop(future), future.result())
+
+    if max_workers > 1 and executor == "process":
+        try:
+            coolants = [network.coolant_of(segment) for segment in network.segments]
+            run_pool(get_process_pool(max_workers, coolants), current_settings())
+        except (BrokenProcessPool, pickle.PicklingError, AttributeError, OSError) as e:
+            print(f"⚠️ Пул процессов недоступен ({e}), участки считаются последовательно")
+            shutdown_process_pool()
+    elif max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            run_pool(pool)
+    for level in network.order():  # Последовательный расчёт (и завершение, если пул оказался недоступен)
+        for segment in level:
+            if segment.name not in results:
+                store(segment, _solve_segment(*task(segment)))
+
+    T = np.zeros(n)
+    C_p_ohl = np.zeros(n)
+    C_p_raznitsa = np.zeros(n)
+    m_ohl = np.zeros(n)
+    for segment in network.segments:
+        nodes = list(segment.nodes(n))
+        profile = results[segment.name][2]
+        T[nodes] = profile[0]
+        C_p_ohl[nodes] = profile[1]
+        C_p_raznitsa[nodes] = profile[2]
+        m_ohl[nodes] = segment.m_ohl
+    return T, C_p_ohl, C_p_raznitsa, m_ohl
@@ -0,0 +1,1195 @@
+"""
+Модуль подготовленных интерполяторов теплофизических свойств охладителей.
+
+Здесь реализованы:
+- Объект `CoolantProperties`, который один раз строит триангуляцию Делоне по точкам (T, p)
+  и кубические интерполяторы для каждого свойства,
+- Реестр загруженных охладителей, позволяющий повторно использовать интерполяторы
+  во всех расчётах и на всех итерациях пересчёта,
+- Кэш экстраполяторов (thin-plate-spline) для точек вне выпуклой оболочки таблицы
+  с ограниченным размером и вытеснением давно неиспользуемых моделей (LRU),
+- Пакетное вычисление нескольких свойств сразу для всего профиля канала (`evaluate_properties`),
+- Пересчёт таблиц охладителей с зависимостью от давления на прямоугольную сетку T × p
+  (`resample_to_grid`) с отчётом о погрешности относительно исходных точек,
+- Двоичный кэш таблиц из "Properties of components" (`.npy` рядом с исходным `.xlsx`),
+  который читается через отображение в память вместо разбора Excel,
+- Проверка принадлежности выпуклой оболочке таблицы (`ConvexHullMask`) по заранее вычисленным
+  уравнениям граней `ConvexHull`: массив точек проверяется одним матричным произведением,
+- Проверка загружаемых таблиц (`validate_table`: пропуски, повторяющиеся точки, порядок T
+  на изобарах) и отчёт о покрытии таблицы (`coverage_report`),
+- Индекс ближайших точек `cKDTree` с обратно-взвешенной по расстоянию интерполяцией (IDW)
+  ограниченной стоимости — запасной вариант, если кубическая интерполяция вернула NaN,
+- Таблица энтальпии h(T, p) = ∫C dT вдоль изобар и обратная функция T(h, p) (`EnthalpyTable`)
+  для расчёта нагрева охладителя по энтальпии,
+- Таблица свойств по одной температуре (`TemperatureProperties`) для охладителей без зависимости
+  от давления: сортировка и проверка выполняются один раз, все свойства используют общий поиск
+  интервала `searchsorted` и линейную экстраполяцию за пределами таблицы,
+- Блокировка `_cache_lock`: реестр, кэши и ленивое построение интерполяторов безопасны
+  при расчёте независимых ветвей охлаждения в нескольких потоках.
+
+Способ интерполяции выбирается переменной `PROPERTY_BACKEND`:
+- "grid" — поиск ячейки прямоугольной сетки и би-линейная/бикубическая интерполяция; если отклонение
+  сетки от интерполяции по таблице больше `GRID_MAX_ERROR`, охладитель считается по разбросанным точкам,
+- "isobar" — монотонные кубические сплайны (PCHIP) по температуре вдоль каждой изобары таблицы
+  и линейная интерполяция по давлению между изобарами; теплоёмкость и её производная dC/dT
+  вычисляются в замкнутом виде по сохранённым коэффициентам (`IsobarProperties`),
+- "scattered" — интерполяция по разбросанным точкам через триангуляцию Делоне (по умолчанию).
+
+Используется функциями `interpolate_C`, `tabl_4` и `tabl_4_AT_NDMG`.
+"""
+from bisect import bisect_right
+from collections import OrderedDict
+import functools
+import hashlib
+import json
+import os
+import threading
+import numpy as np
+from scipy.interpolate import CloughTocher2DInterpolator, PchipInterpolator, RBFInterpolator, RectBivariateSpline
+from scipy.spatial import ConvexHull, Delaunay, cKDTree
+
+COMPLEX_COMPONENTS = {"Водород", "АТ", "Кислород", "Гелий", "Аммиак", "Метан"}  # Свойства зависят от давления
+PROPERTY_KEYS = ("rho", "C", "mu", "lambda", "K")  # Порядок столбцов после T (и p) в таблицах свойств
+
+RBF_CACHE_SIZE = 32  # Максимальное число хранимых экстраполяторов (охладитель × свойство × окрестность)
+HULL_CACHE_SIZE = 32  # Максимальное число хранимых оболочек произвольных наборов точек (is_inside)
+RBF_NEIGHBORS = None  # None — подбор по всей таблице, целое число — по ближайшим точкам
+PROPERTY_BACKEND = "scattered"  # "grid" — прямоугольная сетка T × p, "isobar" — сплайны по изобарам, "scattered" — разбросанные точки
+GRID_METHOD = "cubic"  # Интерполяция на сетке: "linear" (билинейная) или "cubic" (бикубическая)
+GRID_SHAPE = None  # None — оси из исходных значений T и p, (n_T, n_p) — равномерная сетка
+GRID_MAX_ERROR = 0.05  # Наибольшее относительное отклонение сетки, при котором "grid" используется для охладителя
+IDW_NEIGHBORS = 4  # Число ближайших точек таблицы для запасной интерполяции IDW
+
+TABLE_CACHE_SUFFIX = ".cache.npy"  # Двоичный кэш таблицы: <файл>.xlsx.cache.npy (+ .json с описанием источника)
+
+_coolant_cache = {}  # Реестр загруженных охладителей: название → CoolantProperties / TemperatureProperties
+_rbf_cache = OrderedDict()  # Экстраполяторы в порядке последнего использования
+_enthalpy_cache = {}  # Таблицы энтальпии: (охладитель, свойство) → (объект свойств, EnthalpyTable)
+_hull_cache = OrderedDict()  # Оболочки для произвольных наборов точек (is_inside) в порядке последнего использования
+_cache_lock = threading.RLock()  # Защищает реестр, кэши и ленивое построение интерполяторов при расчёте в потоках
+def _locked(func):
+    """Выполняет функцию под блокировкой кэшей `_cache_lock`."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _cache_lock:
+            return func(*args, **kwargs)
+    return wrapper
+class GridProperties:
+    """
+    Свойства охладителя, пересчитанные на прямоугольную сетку T × p.
+
+    Поиск ячейки выполняется по упорядоченным осям, значение внутри ячейки — билинейной
+    или бикубической интерполяцией (`RectBivariateSpline` без сглаживания).
+
+    Args:
+        T_axis (np.ndarray): Возрастающая ось температур, К.
+        p_axis (np.ndarray): Возрастающая ось давлений, МПа.
+        values (dict): Название свойства → массив значений формы (len(T_axis), len(p_axis)).
+        method (str): "linear" или "cubic".
+    """
+    def __init__(self, T_axis, p_axis, values, method="cubic"):
+        self.T_axis = np.asarray(T_axis, dtype=float)
+        self.p_axis = np.asarray(p_axis, dtype=float)
+        self.method = method
+        degree = 1 if method == "linear" else 3
+        kx = min(degree, len(self.T_axis) - 1)
+        ky = min(degree, len(self.p_axis) - 1)
+        self.values = values
+        self.splines = {key: RectBivariateSpline(self.T_axis, self.p_axis, v, kx=kx, ky=ky, s=0)
+                        for key, v in values.items()}
+        self.report = {}  # Расхождение с интерполяцией по таблице (середины ячеек, исходные точки): свойство → (max_abs, max_rel)
+        self.filled_nodes = 0  # Узлы сетки, которых не было в исходной таблице
+        self.warned = False  # Предупреждение об отказе от сетки выводится один раз
+    def worst_error(self):
+        """
+        Свойство с наибольшим относительным отклонением от интерполяции по таблице.
+
+        Returns:
+            tuple: (название свойства, относительное отклонение) или (None, 0.0) без отчёта.
+        """
+        if not self.report:
+            return None, 0.0
+        key = max(self.report, key=lambda k: self.report[k][1])
+        return key, self.report[key][1]
+    def contains(self, T_input, p_input):
+        """Проверяет, лежат ли точки внутри прямоугольника сетки (поддерживает массивы)."""
+        T_input = np.asarray(T_input, dtype=float)
+        p_input = np.asarray(p_input, dtype=float)
+        return ((T_input >= self.T_axis[0]) & (T_input <= self.T_axis[-1]) &
+                (p_input >= self.p_axis[0]) & (p_input <= self.p_axis[-1]))
+    def __call__(self, key, T_input, p_input):
+        """Значение свойства `key` в точках (T, p) внутри сетки."""
+        return self.splines[key].ev(T_input, p_input)
+class IsobarProperties:
+    """
+    Свойства охладителя в виде монотонных кубических сплайнов по температуре вдоль изобар.
+
+    Для каждой изобары таблицы один раз вычисляются коэффициенты PCHIP-сплайна по T
+    (без выбросов между узлами, что важно вблизи псевдокритической линии, где C резко меняется),
+    между соседними изобарами значения интерполируются линейно по давлению.
+    Значение и производная по температуре вычисляются в замкнутом виде по коэффициентам.
+
+    Args:
+        T_axis (np.ndarray): Возрастающая ось температур, К.
+        p_axis (np.ndarray): Возрастающая ось давлений (изобары), МПа.
+        values (dict): Название свойства → массив значений формы (len(T_axis), len(p_axis)).
+    """
+    def __init__(self, T_axis, p_axis, values):
+        self.T_axis = np.asarray(T_axis, dtype=float)
+        self.p_axis = np.asarray(p_axis, dtype=float)
+        # Коэффициенты многочленов на интервалах: свойство → массив (4, len(T_axis) - 1, len(p_axis))
+        self.coefficients = {key: PchipInterpolator(self.T_axis, np.asarray(v, dtype=float), axis=0).c
+                             for key, v in values.items()}
+        # Те же коэффициенты в виде списков [интервал T][изобара] → (c0, c1, c2, c3) для расчёта в одной точке
+        self._T_list = self.T_axis.tolist()
+        self._p_list = self.p_axis.tolist()
+        self._rows = {key: np.moveaxis(c, 0, -1).tolist() for key, c in self.coefficients.items()}
+    def contains(self, T_input, p_input):
+        """Проверяет, лежат ли точки внутри прямоугольника T × p таблицы (поддерживает массивы)."""
+        if isinstance(T_input, (int, float)) and isinstance(p_input, (int, float)):
+            return self._T_list[0] <= T_input <= self._T_list[-1] and self._p_list[0] <= p_input <= self._p_list[-1]
+        T_input = np.asarray(T_input, dtype=float)
+        p_input = np.asarray(p_input, dtype=float)
+        return ((T_input >= self.T_axis[0]) & (T_input <= self.T_axis[-1]) &
+                (p_input >= self.p_axis[0]) & (p_input <= self.p_axis[-1]))
+    def _locate(self, T_input, p_input):
+        """Интервалы по T и p, смещение от левого узла по T и вес по давлению."""
+        T_input = np.asarray(T_input, dtype=float)
+        p_input = np.asarray(p_input, dtype=float)
+        i = np.clip(np.searchsorted(self.T_axis, T_input, side="right") - 1, 0, len(self.T_axis) - 2)
+        if len(self.p_axis) == 1:
+            j = np.zeros(np.shape(p_input), dtype=int)
+            return i, j, j, T_input - self.T_axis[i], np.zeros(np.shape(p_input))
+        j = np.clip(np.searchsorted(self.p_axis, p_input, side="right") - 1, 0, len(self.p_axis) - 2)
+        w = (p_input - self.p_axis[j]) / (self.p_axis[j + 1] - self.p_axis[j])
+        return i, j, j + 1, T_input - self.T_axis[i], w
+    def _locate_point(self, T_input, p_input):
+        """То же, что `_locate`, для одной точки на списках Python."""
+        T, p = self._T_list, self._p_list
+        i = min(max(bisect_right(T, T_input) - 1, 0), len(T) - 2)
+        if len(p) == 1:
+            return i, 0, 0, T_input - T[i], 0.0
+        j = min(max(bisect_right(p, p_input) - 1, 0), len(p) - 2)
+        return i, j, j + 1, T_input - T[i], (p_input - p[j]) / (p[j + 1] - p[j])
+    def __call__(self, key, T_input, p_input):
+        """Значение свойства `key` в точках (T, p)."""
+        if isinstance(T_input, (int, float)) and isinstance(p_input, (int, float)):
+            i, j0, j1, dx, w = self._locate_point(T_input, p_input)
+            a0, a1, a2, a3 = self._rows[key][i][j0]
+            b0, b1, b2, b3 = self._rows[key][i][j1]
+            lower = ((a0 * dx + a1) * dx + a2) * dx + a3
+            upper = ((b0 * dx + b1) * dx + b2) * dx + b3
+            return lower + w * (upper - lower)
+        i, j0, j1, dx, w = self._locate(T_input, p_input)
+        c = self.coefficients[key]
+        lower = ((c[0, i, j0] * dx + c[1, i, j0]) * dx + c[2, i, j0]) * dx + c[3, i, j0]
+        upper = ((c[0, i, j1] * dx + c[1, i, j1]) * dx + c[2, i, j1]) * dx + c[3, i, j1]
+        return lower + w * (upper - lower)
+    def derivative(self, key, T_input, p_input):
+        """Производная свойства `key` по температуре в точках (T, p)."""
+        if isinstance(T_input, (int, float)) and isinstance(p_input, (int, float)):
+            i, j0, j1, dx, w = self._locate_point(T_input, p_input)
+            a0, a1, a2, _ = self._rows[key][i][j0]
+            b0, b1, b2, _ = self._rows[key][i][j1]
+            lower = (3.0 * a0 * dx + 2.0 * a1) * dx + a2
+            upper = (3.0 * b0 * dx + 2.0 * b1) * dx + b2
+            return lower + w * (upper - lower)
+        i, j0, j1, dx, w = self._locate(T_input, p_input)
+        c = self.coefficients[key]
+        lower = (3.0 * c[0, i, j0] * dx + 2.0 * c[1, i, j0]) * dx + c[2, i, j0]
+        upper = (3.0 * c[0, i, j1] * dx + 2.0 * c[1, i, j1]) * dx + c[2, i, j1]
+        return lower + w * (upper - lower)
+class ConvexHullMask:
+    """
+    Проверка принадлежности точек выпуклой оболочке набора точек.
+
+    Уравнения граней оболочки `a·x + b <= 0` вычисляются один раз (`ConvexHull.equations`),
+    после чего любой массив точек проверяется одним матричным произведением без триангуляции.
+
+    Args:
+        points (array-like): Массив точек (n x d).
+        rel_tol (float): Допуск на границе оболочки относительно масштаба координат.
+    """
+    def __init__(self, points, rel_tol=1e-9):
+        points = np.asarray(points, dtype=float)
+        equations = ConvexHull(points).equations
+        self.normals = equations[:, :-1]
+        self.offsets = equations[:, -1]
+        self.tol = rel_tol * max(float(np.max(np.abs(points))), 1.0)
+        self._rows = equations.tolist()  # Для проверки одной точки без накладных расходов numpy
+    def contains(self, xi):
+        """
+        Проверяет точки `xi` (массив n x d или одна точка длины d).
+
+        Returns:
+            np.ndarray or bool: Маска точек внутри оболочки (для одной точки — bool).
+        """
+        if len(xi) == len(self._rows[0]) - 1 and all(isinstance(x, (int, float)) for x in xi):
+            return all(sum(a * x for a, x in zip(row, xi)) + row[-1] <= self.tol for row in self._rows)
+        xi = np.asarray(xi, dtype=float)
+        inside = np.all(xi @ self.normals.T + self.offsets <= self.tol, axis=-1)
+        return bool(inside) if xi.ndim == 1 else inside
+@_locked
+def get_hull(points):
+    """
+    Возвращает оболочку для набора точек, построенную один раз на одинаковые данные.
+
+    При превышении `HULL_CACHE_SIZE` вытесняется оболочка, которая дольше всех не использовалась.
+
+    Args:
+        points (array-like): Массив точек (n x d).
+
+    Returns:
+        ConvexHullMask: Оболочка набора точек.
+    """
+    points = np.ascontiguousarray(points, dtype=float)
+    cache_key = (points.shape, hashlib.sha1(points.tobytes()).hexdigest())
+    hull = _hull_cache.get(cache_key)
+    if hull is not None:
+        _hull_cache.move_to_end(cache_key)
+        return hull
+    hull = _hull_cache[cache_key] = ConvexHullMask(points)
+    while len(_hull_cache) > HULL_CACHE_SIZE:
+        _hull_cache.popitem(last=False)
+    return hull
+class CoolantProperties:
+    """
+    Теплофизические свойства охладителя, заданные разбросанными точками (T, p).
+
+    Триангуляция Делоне строится один раз и разделяется всеми свойствами,
+    кубические (Clough-Tocher) и линейные интерполяторы строятся по этой же триангуляции.
+    Результат совпадает с `griddata(..., method='cubic')`, но без повторной триангуляции на каждый вызов.
+
+    Args:
+        name_ohl (str): Название охладителя.
+        T_aray (list of float): Температуры точек таблицы, К.
+        p_aray (list of float): Давления точек таблицы, МПа.
+        **properties (list of float): Столбцы свойств (например, C=C_aray, rho=rho_aray).
+    """
+    def __init__(self, name_ohl, T_aray, p_aray, **properties):
+        self.name_ohl = name_ohl
+        self.T_source = T_aray
+        self.p_source = p_aray
+        self.points = np.column_stack((np.asarray(T_aray, dtype=float), np.asarray(p_aray, dtype=float)))
+        self._tri = None
+        self._hull = None
+        self.sources = {}
+        self.values = {}
+        self._cubic = {}
+        self._kdtree = None
+        self._batch = {}
+        self._grid = None
+        self._isobars = None
+        for key, arr in properties.items():
+            self.add_property(key, arr)
+    def add_property(self, key, arr):
+        """Добавляет столбец свойства (интерполяторы для него строятся один раз при первом использовании)."""
+        self.sources[key] = arr
+        self.values[key] = np.asarray(arr, dtype=float)
+        self._cubic.pop(key, None)
+        self._batch = {keys: interp for keys, interp in self._batch.items() if key not in keys}
+        self._grid = None  # Сетка будет пересчитана с учётом нового свойства
+        self._isobars = None
+        return key
+    @property
+    def tri(self):
+        """Триангуляция Делоне по точкам таблицы (строится при первом обращении)."""
+        if self._tri is None:
+            with _cache_lock:  # Объект может использоваться из нескольких потоков
+                if self._tri is None:
+                    self._tri = Delaunay(self.points)
+        return self._tri
+    @property
+    def kdtree(self):
+        """Индекс ближайших точек по (T, p), приведённым к диапазонам таблицы (строится при первом обращении)."""
+        if self._kdtree is None:
+            with _cache_lock:
+                if self._kdtree is None:
+                    span = np.ptp(self.points, axis=0)
+                    self._scale = np.where(span > 0, span, 1.0)
+                    self._kdtree = cKDTree(self.points / self._scale)
+        return self._kdtree
+    @property
+    def hull(self):
+        """Уравнения граней выпуклой оболочки таблицы (строятся при первом обращении)."""
+        if self._hull is None:
+            with _cache_lock:
+                if self._hull is None:
+                    self._hull = ConvexHullMask(self.points)
+        return self._hull
+    @property
+    def grid(self):
+        """Свойства, пересчитанные на прямоугольную сетку (строятся при первом обращении)."""
+        if self._grid is None:
+            with _cache_lock:
+                if self._grid is None:
+                    self._grid = resample_to_grid(self)
+        return self._grid
+    @property
+    def isobars(self):
+        """
+        Сплайны по изобарам таблицы (строятся при первом обращении).
+
+        Узлы берутся из сетки с исходными осями T и p, поэтому недостающие в таблице точки
+        изобар достраиваются так же, как для сетки.
+        """
+        if self._isobars is None:
+            with _cache_lock:
+                if self._isobars is None:
+                    grid = self.grid if GRID_SHAPE is None else resample_to_grid(self, shape=None)
+                    self._isobars = IsobarProperties(grid.T_axis, grid.p_axis, grid.values)
+        return self._isobars
+    @property
+    def structured(self):
+        """
+        Структурированная таблица выбранного способа интерполяции.
+
+        None для "scattered", а также для "grid", если отклонение сетки больше `GRID_MAX_ERROR`.
+        """
+        if PROPERTY_BACKEND == "grid":
+            grid = self.grid
+            key, error = grid.worst_error()
+            if error <= GRID_MAX_ERROR:
+                return grid
+            if not grid.warned:
+                print(f"⚠️ Сетка свойств '{self.name_ohl}' отклоняется от интерполяции по таблице на "
+                      f"{error * 100:.3f} % ({key}), используется интерполяция по разбросанным точкам")
+                grid.warned = True
+            return None
+        if PROPERTY_BACKEND == "isobar":
+            return self.isobars
+        return None
+    def key_of(self, arr):
+        """
+        Находит название свойства по исходному массиву.
+
+        Сначала проверяется совпадение объекта, затем — совпадение значений.
+
+        Returns:
+            str or None: Название свойства либо None, если такого столбца нет.
+        """
+        for key, src in self.sources.items():
+            if src is arr:
+                return key
+        values = np.asarray(arr, dtype=float)
+        for key, known in self.values.items():
+            if known.shape == values.shape and np.array_equal(known, values):
+                return key
+        return None
+    def same_grid(self, T_aray, p_aray):
+        """Проверяет, построен ли объект по тем же точкам (T, p)."""
+        if T_aray is self.T_source and p_aray is self.p_source:
+            return True
+        points = np.column_stack((np.asarray(T_aray, dtype=float), np.asarray(p_aray, dtype=float)))
+        return points.shape == self.points.shape and np.array_equal(points, self.points)
+    def contains(self, T_input, p_input):
+        """
+        Проверяет, лежат ли точки (T, p) внутри выпуклой оболочки таблицы.
+
+        Returns:
+            bool or np.ndarray: Для одной точки — bool, для массивов — маска.
+        """
+        if isinstance(T_input, (int, float)) and isinstance(p_input, (int, float)):
+            return self.hull.contains((T_input, p_input))
+        T_input = np.asarray(T_input, dtype=float)
+        p_input = np.asarray(p_input, dtype=float)
+        return self.hull.contains(np.stack(np.broadcast_arrays(T_input, p_input), axis=-1))
+    def interpolate(self, key, T_input, p_input):
+        """
+        Кубическая интерполяция свойства внутри выпуклой оболочки.
+
+        Если кубическая интерполяция вернула NaN, значение берётся по ближайшим точкам таблицы (`nearest`).
+
+        Returns:
+            float: Значение свойства в точке (T, p).
+        """
+        if key not in self._cubic:
+            self._cubic[key] = CloughTocher2DInterpolator(self.tri, self.values[key])
+        value = float(self._cubic[key](T_input, p_input))
+        if np.isnan(value):
+            value = float(self.nearest((key,), [T_input], [p_input])[0, 0])
+        return value
+    def nearest(self, keys, T_input, p_input, k=None, power=2.0):
+        """
+        Интерполяция с весами, обратными расстоянию до `k` ближайших точек таблицы (IDW).
+
+        Стоимость ограничена поиском по `cKDTree` (O(k log N)), совпадающие с узлами точки
+        получают значение узла.
+
+        Args:
+            keys (tuple of str): Названия свойств.
+            T_input (array-like): Температуры, К.
+            p_input (array-like): Давления, МПа.
+            k (int, optional): Число соседей; по умолчанию `IDW_NEIGHBORS`.
+            power (float): Показатель степени весов.
+
+        Returns:
+            np.ndarray: Массив формы (len(T_input), len(keys)).
+        """
+        tree = self.kdtree
+        k = min(IDW_NEIGHBORS if k is None else int(k), len(self.points))
+        xi = np.column_stack((np.asarray(T_input, dtype=float).ravel(), np.asarray(p_input, dtype=float).ravel()))
+        dist, idx = tree.query(xi / self._scale, k=k)
+        dist = dist.reshape(len(xi), k)
+        idx = idx.reshape(len(xi), k)
+        with np.errstate(divide='ignore'):
+            weights = 1.0 / dist ** power
+        exact = dist[:, 0] == 0.0
+        weights[exact] = 0.0
+        weights[exact, 0] = 1.0
+        weights /= weights.sum(axis=1, keepdims=True)
+        table = np.column_stack([self.values[key] for key in keys])
+        return np.einsum('nk,nkj->nj', weights, table[idx])
+    def extrapolate(self, key, T_input, p_input, neighbors=None):
+        """
+        Экстраполяция свойства thin-plate-сплайном для точек вне выпуклой оболочки.
+
+        Модель подбирается один раз на (охладитель, свойство, окрестность) и хранится в кэше.
+
+        Args:
+            key (str): Название свойства.
+            T_input (float): Температура, К.
+            p_input (float): Давление, МПа.
+            neighbors (int, optional): Число ближайших точек таблицы для локального подбора.
+                По умолчанию берётся `RBF_NEIGHBORS`.
+
+        Returns:
+            float: Экстраполированное значение свойства.
+        """
+        rbf = get_extrapolator(self, key, RBF_NEIGHBORS if neighbors is None else neighbors)
+        return float(rbf([[T_input, p_input]])[0])
+    def value(self, key, T_input, p_input):
+        """
+        Значение свойства в точке (T, p) выбранным способом интерполяции.
+
+        При `PROPERTY_BACKEND == "grid"` точка ищется на прямоугольной сетке, при `"isobar"` —
+        по сплайнам изобар; вне их границ (и при `"scattered"`) используется интерполяция
+        по разбросанным точкам и экстраполяция.
+
+        Returns:
+            float: Значение свойства.
+        """
+        table = self.structured
+        if table is not None and table.contains(T_input, p_input):
+            return float(table(key, T_input, p_input))
+        if self.contains(T_input, p_input):
+            return self.interpolate(key, T_input, p_input)
+        return self.extrapolate(key, T_input, p_input)
+    def derivative(self, key, T_input, p_input, dT=0.5):
+        """
+        Производная свойства по температуре dX/dT в точке (T, p).
+
+        В пределах изобар таблицы вычисляется в замкнутом виде по коэффициентам сплайнов,
+        за их пределами — центральной разностью с шагом `dT`.
+
+        Returns:
+            float: Производная свойства, [X]/К.
+        """
+        if self.isobars.contains(T_input, p_input):
+            return float(self.isobars.derivative(key, T_input, p_input))
+        return (self.value(key, T_input + dT, p_input) - self.value(key, T_input - dT, p_input)) / (2.0 * dT)
+    def evaluate(self, keys, T_input, p_input):
+        """
+        Вычисляет сразу несколько свойств для массивов температур и давлений.
+
+        При `PROPERTY_BACKEND == "grid"` (или `"isobar"`) точки внутри таблицы вычисляются по сетке
+        (сплайнам изобар), остальные — по разбросанным точкам (см. `evaluate_scattered`).
+
+        Args:
+            keys (tuple of str): Названия свойств.
+            T_input (array-like): Температуры узлов, К.
+            p_input (array-like): Давления узлов, МПа.
+
+        Returns:
+            np.ndarray: Массив формы (len(T_input), len(keys)).
+        """
+        keys = tuple(keys)
+        T_input = np.asarray(T_input, dtype=float).ravel()
+        p_input = np.asarray(p_input, dtype=float).ravel()
+        table = self.structured
+        if table is None:
+            return self.evaluate_scattered(keys, T_input, p_input)
+        result = np.empty((len(T_input), len(keys)))
+        in_grid = table.contains(T_input, p_input)
+        for j, key in enumerate(keys):
+            result[in_grid, j] = table(key, T_input[in_grid], p_input[in_grid])
+        if not in_grid.all():
+            result[~in_grid] = self.evaluate_scattered(keys, T_input[~in_grid], p_input[~in_grid])
+        return result
+    def evaluate_scattered(self, keys, T_input, p_input):
+        """
+        Пакетная интерполяция по разбросанным точкам таблицы.
+
+        Все свойства интерполируются одним общим кубическим интерполятором за один проход
+        по триангуляции (NaN заменяются значениями `nearest`), точки вне выпуклой оболочки
+        обрабатываются кэшированными экстраполяторами.
+
+        Args:
+            keys (tuple of str): Названия свойств.
+            T_input (array-like): Температуры узлов, К.
+            p_input (array-like): Давления узлов, МПа.
+
+        Returns:
+            np.ndarray: Массив формы (len(T_input), len(keys)).
+        """
+        keys = tuple(keys)
+        xi = np.column_stack((np.asarray(T_input, dtype=float).ravel(), np.asarray(p_input, dtype=float).ravel()))
+        result = np.empty((len(xi), len(keys)))
+        inside = self.hull.contains(xi)
+
+        if inside.any():
+            if keys not in self._batch:
+                stacked = np.column_stack([self.values[key] for key in keys])
+                self._batch[keys] = CloughTocher2DInterpolator(self.tri, stacked)
+            result[inside] = self._batch[keys](xi[inside])
+            bad = inside & np.isnan(result).any(axis=1)
+            if bad.any():
+                result[bad] = np.where(np.isnan(result[bad]), self.nearest(keys, xi[bad, 0], xi[bad, 1]), result[bad])
+
+        if not inside.all():
+            for j, key in enumerate(keys):
+                rbf = get_extrapolator(self, key, RBF_NEIGHBORS)
+                result[~inside, j] = rbf(xi[~inside])
+        return result
+class TemperatureProperties:
+    """
+    Свойства охладителя, зависящие только от температуры.
+
+    Таблица сортируется по температуре и проверяется один раз при создании объекта.
+    Для набора температур интервал таблицы ищется одним `searchsorted`, после чего все свойства
+    вычисляются линейной интерполяцией с общими весами; за пределами таблицы значения линейно
+    экстраполируются по крайним отрезкам (как `interp1d(..., fill_value='extrapolate')`).
+
+    Args:
+        name_ohl (str): Название охладителя.
+        T_aray (list of float): Температуры точек таблицы, К.
+        **properties (list of float): Столбцы свойств (например, C=C_aray, rho=rho_aray).
+    """
+    def __init__(self, name_ohl, T_aray, **properties):
+        T = np.asarray(T_aray, dtype=float)
+        if T.ndim != 1 or len(T) < 2:
+            raise ValueError(f"Таблица '{name_ohl}': нужно не менее двух значений температуры")
+        if not np.all(np.isfinite(T)):
+            raise ValueError(f"Таблица '{name_ohl}': в столбце температур есть пропуски")
+        self.name_ohl = name_ohl
+        self.T_source = T_aray
+        self.order = np.argsort(T, kind="stable")
+        self.T = T[self.order]
+        if np.any(np.diff(self.T) <= 0):
+            raise ValueError(f"Таблица '{name_ohl}': повторяющиеся значения температуры")
+        self._T_list = self.T.tolist()  # Для быстрого поиска одной температуры без накладных расходов numpy
+        self.sources = {}
+        self.values = {}
+        self._lists = {}
+        for key, arr in properties.items():
+            self.add_property(key, arr)
+    def add_property(self, key, arr):
+        """Добавляет столбец свойства (значения переупорядочиваются по возрастанию температуры)."""
+        values = np.asarray(arr, dtype=float)
+        if values.shape != self.order.shape:
+            raise ValueError(f"Таблица '{self.name_ohl}': длина столбца '{key}' не совпадает с числом температур")
+        if not np.all(np.isfinite(values)):
+            raise ValueError(f"Таблица '{self.name_ohl}': в столбце '{key}' есть пропуски")
+        self.sources[key] = arr
+        self.values[key] = values[self.order]
+        self._lists[key] = self.values[key].tolist()
+        return key
+    def key_of(self, arr):
+        """
+        Находит название свойства по исходному массиву.
+
+        Сначала проверяется совпадение объекта, затем — совпадение значений.
+
+        Returns:
+            str or None: Название свойства либо None, если такого столбца нет.
+        """
+        for key, src in self.sources.items():
+            if src is arr:
+                return key
+        values = np.asarray(arr, dtype=float)
+        for key, known in self.values.items():
+            if values.shape == self.order.shape and np.array_equal(known, values[self.order]):
+                return key
+        return None
+    def same_grid(self, T_aray):
+        """Проверяет, построен ли объект по тем же температурам."""
+        if T_aray is self.T_source:
+            return True
+        T = np.asarray(T_aray, dtype=float)
+        return T.shape == self.order.shape and np.array_equal(T[self.order], self.T)
+    def contains(self, T_input):
+        """Проверяет, лежит ли температура в пределах таблицы (без экстраполяции)."""
+        if isinstance(T_input, (int, float)):
+            return self._T_list[0] <= T_input <= self._T_list[-1]
+        T_input = np.asarray(T_input, dtype=float)
+        return (T_input >= self.T[0]) & (T_input <= self.T[-1])
+    def locate(self, T_input):
+        """
+        Находит интервалы таблицы и веса линейной интерполяции.
+
+        Returns:
+            tuple: (i, w) — индекс левого узла интервала и доля расстояния до правого узла;
+            вне таблицы используется крайний интервал, а w выходит за пределы [0, 1].
+        """
+        T_input = np.asarray(T_input, dtype=float)
+        i = np.clip(np.searchsorted(self.T, T_input, side="right") - 1, 0, len(self.T) - 2)
+        w = (T_input - self.T[i]) / (self.T[i + 1] - self.T[i])
+        return i, w
+    def value(self, key, T_input):
+        """Значение свойства в одной точке (float) или в массиве точек."""
+        if isinstance(T_input, (int, float)):
+            T, values = self._T_list, self._lists[key]
+            i = min(max(bisect_right(T, T_input) - 1, 0), len(T) - 2)
+            w = (T_input - T[i]) / (T[i + 1] - T[i])
+            return values[i] + w * (values[i + 1] - values[i])
+        i, w = self.locate(T_input)
+        values = self.values[key]
+        result = values[i] + w * (values[i + 1] - values[i])
+        return float(result) if np.ndim(result) == 0 else result
+    def derivative(self, key, T_input):
+        """Производная свойства по температуре (наклон отрезка таблицы, содержащего точку)."""
+        if isinstance(T_input, (int, float)):
+            T, values = self._T_list, self._lists[key]
+            i = min(max(bisect_right(T, T_input) - 1, 0), len(T) - 2)
+            return (values[i + 1] - values[i]) / (T[i + 1] - T[i])
+        i, _ = self.locate(T_input)
+        values = self.values[key]
+        return (values[i + 1] - values[i]) / (self.T[i + 1] - self.T[i])
+    def evaluate(self, keys, T_input):
+        """
+        Вычисляет несколько свойств в массиве точек с общим поиском интервалов.
+
+        Returns:
+            np.ndarray: Массив формы (len(T_input), len(keys)).
+        """
+        i, w = self.locate(np.atleast_1d(np.asarray(T_input, dtype=float)))
+        table = np.column_stack([self.values[key] for key in keys])
+        return table[i] + w[:, None] * (table[i + 1] - table[i])
+class EnthalpyTable:
+    """
+    Удельная энтальпия охладителя h(T, p) = ∫ C dT вдоль изобар и обратная функция T(h, p).
+
+    Теплоёмкость на каждом интервале таблицы задана многочленом по T (сплайн изобары
+    или линейная интерполяция), поэтому интеграл по интервалу и накопленные значения в узлах
+    вычисляются точно один раз. Между изобарами энтальпия интерполируется линейно по давлению,
+    давление вне таблицы ограничивается крайними изобарами. За пределами диапазона температур
+    теплоёмкость либо продолжается многочленом крайнего интервала (`extrapolate=True`, как линейная
+    экстраполяция простых охладителей), либо принимается равной значению на границе таблицы.
+    Если продолженная теплоёмкость в запрошенной точке неположительна, вызывается ValueError.
+    Отсчёт h = 0 — при наименьшей T таблицы.
+
+    Args:
+        T_axis (np.ndarray): Возрастающая ось температур, К.
+        p_axis (np.ndarray): Возрастающая ось давлений, МПа (одно значение — без зависимости от давления).
+        coefficients (np.ndarray): Коэффициенты C(T) на интервалах, форма (4, len(T_axis) - 1, len(p_axis)),
+            C = c0·dx³ + c1·dx² + c2·dx + c3, dx = T - T_i.
+        extrapolate (bool): Продолжать многочлены крайних интервалов за пределы таблицы.
+    """
+    def __init__(self, T_axis, p_axis, coefficients, extrapolate=False):
+        self.extrapolate = extrapolate
+        self.T_axis = np.asarray(T_axis, dtype=float)
+        self.p_axis = np.asarray(p_axis, dtype=float)
+        self.c = np.asarray(coefficients, dtype=float)
+        width = np.diff(self.T_axis)[:, None]
+        segment = self._integral(self.c, width)
+        self.H = np.vstack((np.zeros((1, len(self.p_axis))), np.cumsum(segment, axis=0)))  # h в узлах (n_T, n_p)
+        self.C_start = self.c[3, 0]
+        self.C_end = ((self.c[0, -1] * width[-1] + self.c[1, -1]) * width[-1] + self.c[2, -1]) * width[-1] + self.c[3, -1]
+    @staticmethod
+    def _integral(c, dx):
+        """∫ от 0 до dx многочлена с коэффициентами c."""
+        return (((c[0] / 4.0 * dx + c[1] / 3.0) * dx + c[2] / 2.0) * dx + c[3]) * dx
+    def _pressure_weights(self, p_input, n):
+        """Индексы соседних изобар и вес по давлению (давление ограничивается таблицей)."""
+        if len(self.p_axis) == 1:
+            j = np.zeros(n, dtype=int)
+            return j, j, np.zeros(n)
+        p_input = np.clip(np.broadcast_to(np.asarray(p_input, dtype=float), (n,)), self.p_axis[0], self.p_axis[-1])
+        j = np.clip(np.searchsorted(self.p_axis, p_input, side="right") - 1, 0, len(self.p_axis) - 2)
+        return j, j + 1, (p_input - self.p_axis[j]) / (self.p_axis[j + 1] - self.p_axis[j])
+    def _check_extrapolation(self, T_input, p_input):
+        """Проверяет, что продолженная за пределы таблицы теплоёмкость положительна."""
+        outside = (T_input < self.T_axis[0]) | (T_input > self.T_axis[-1])
+        if not (self.extrapolate and np.any(outside)):
+            return
+        p_input = np.broadcast_to(np.asarray(p_input, dtype=float), T_input.shape)
+        C = self._heat_capacity(T_input[outside], p_input[outside])
+        if np.any(C <= 0):
+            raise ValueError(f"Теплоёмкость, продолженная за пределы таблицы ({self.T_axis[0]:g}–{self.T_axis[-1]:g} К), "
+                             f"неположительна при T = {T_input[outside][C <= 0][0]:g} К")
+    def enthalpy(self, T_input, p_input):
+        """Энтальпия в точках (T, p), Дж/кг."""
+        T_input = np.atleast_1d(np.asarray(T_input, dtype=float))
+        self._check_extrapolation(T_input, p_input)
+        j0, j1, w = self._pressure_weights(p_input, len(T_input))
+        T0, T1 = self.T_axis[0], self.T_axis[-1]
+        T_in = T_input if self.extrapolate else np.clip(T_input, T0, T1)
+        i = np.clip(np.searchsorted(self.T_axis, T_in, side="right") - 1, 0, len(self.T_axis) - 2)
+        dx = T_in - self.T_axis[i]
+        lower = self.H[i, j0] + self._integral(self.c[:, i, j0], dx)
+        upper = self.H[i, j1] + self._integral(self.c[:, i, j1], dx)
+        h = lower + w * (upper - lower)
+        if self.extrapolate:
+            return h
+        C_start = self.C_start[j0] + w * (self.C_start[j1] - self.C_start[j0])
+        C_end = self.C_end[j0] + w * (self.C_end[j1] - self.C_end[j0])
+        return h + np.minimum(T_input - T0, 0.0) * C_start + np.maximum(T_input - T1, 0.0) * C_end
+    def heat_capacity(self, T_input, p_input):
+        """Теплоёмкость dh/dT в точках (T, p), согласованная с `enthalpy`, Дж/(кг·К)."""
+        T_input = np.atleast_1d(np.asarray(T_input, dtype=float))
+        self._check_extrapolation(T_input, p_input)
+        return self._heat_capacity(T_input, p_input)
+    def _heat_capacity(self, T_input, p_input):
+        j0, j1, w = self._pressure_weights(p_input, len(T_input))
+        T_in = T_input if self.extrapolate else np.clip(T_input, self.T_axis[0], self.T_axis[-1])
+        i = np.clip(np.searchsorted(self.T_axis, T_in, side="right") - 1, 0, len(self.T_axis) - 2)
+        dx = T_in - self.T_axis[i]
+        lower = ((self.c[0, i, j0] * dx + self.c[1, i, j0]) * dx + self.c[2, i, j0]) * dx + self.c[3, i, j0]
+        upper = ((self.c[0, i, j1] * dx + self.c[1, i, j1]) * dx + self.c[2, i, j1]) * dx + self.c[3, i, j1]
+        return lower + w * (upper - lower)
+    def temperature(self, h_input, p_input, iterations=8):
+        """
+        Обратная функция: температура по энтальпии и давлению.
+
+        Интервал таблицы находится по накопленным значениям h в узлах, внутри интервала
+        уравнение h(T) = h_input решается несколькими шагами Ньютона с ограничением интервалом.
+
+        Returns:
+            np.ndarray: Температуры, К.
+        """
+        h_input = np.atleast_1d(np.asarray(h_input, dtype=float))
+        n = len(h_input)
+        j0, j1, w = self._pressure_weights(p_input, n)
+        H = self.H[:, j0].T + w[:, None] * (self.H[:, j1].T - self.H[:, j0].T)  # (n, n_T)
+        i = np.clip((H <= h_input[:, None]).sum(axis=1) - 1, 0, len(self.T_axis) - 2)
+        rows = np.arange(n)
+        H_i, H_next = H[rows, i], H[rows, i + 1]
+        width = self.T_axis[i + 1] - self.T_axis[i]
+        target = h_input - H_i
+        below = h_input < H[:, 0]
+        above = h_input > H[:, -1]
+        C_start = self.C_start[j0] + w * (self.C_start[j1] - self.C_start[j0])
+        C_end = self.C_end[j0] + w * (self.C_end[j1] - self.C_end[j0])
+        # Границы поиска внутри интервала; при продолжении многочленов — и за пределами таблицы
+        dx_min = np.where(below, -np.inf, 0.0) if self.extrapolate else np.zeros(n)
+        dx_max = np.where(above, np.inf, width) if self.extrapolate else width
+        dx = np.clip(target / np.where(H_next > H_i, H_next - H_i, 1.0) * width, 0.0, width)  # Начальное приближение по хорде
+        if self.extrapolate:
+            dx = np.where(below, target / C_start, dx)
+            dx = np.where(above, width + (h_input - H[:, -1]) / C_end, dx)
+        c0, c1 = self.c[:, i, j0], self.c[:, i, j1]
+        for _ in range(iterations):
+            g = self._integral(c0, dx) + w * (self._integral(c1, dx) - self._integral(c0, dx)) - target
+            C0 = ((c0[0] * dx + c0[1]) * dx + c0[2]) * dx + c0[3]
+            C1 = ((c1[0] * dx + c1[1]) * dx + c1[2]) * dx + c1[3]
+            dg = C0 + w * (C1 - C0)
+            dx = np.clip(dx - g / np.where(dg > 0, dg, np.inf), dx_min, dx_max)
+        T = self.T_axis[i] + dx
+        if self.extrapolate:
+            self._check_extrapolation(T, p_input)
+            return T
+
+        # За пределами таблицы — постоянная теплоёмкость граничного узла
+        T = np.where(below, self.T_axis[0] + (h_input - H[:, 0]) / C_start, T)
+        T = np.where(above, self.T_axis[-1] + (h_input - H[:, -1]) / C_end, T)
+        return T
+def validate_table(name_ohl, columns, pressure_dependent):
+    """
+    Проверяет и исправляет таблицу свойств охладителя перед построением интерполяторов.
+
+    Проверяется:
+    - одинаковая длина столбцов (лишние строки отбрасываются),
+    - нечисловые и пустые значения (строки с ними отбрасываются),
+    - повторяющиеся точки (T, p) или T (остаётся первая; разные значения свойств отмечаются),
+    - возрастание T вдоль каждой изобары (иначе строки сортируются по p и T; для простых — по T).
+
+    Args:
+        name_ohl (str): Название охладителя.
+        columns (sequence of list): Столбцы таблицы (T, [p,] свойства...).
+        pressure_dependent (bool): Есть ли в таблице столбец давления.
+
+    Returns:
+        tuple: (columns, issues) — исправленные столбцы (списки) и список замечаний.
+    """
+    issues = []
+    n = min(len(column) for column in columns)
+    if any(len(column) != n for column in columns):
+        issues.append(f"столбцы разной длины, используются первые {n} строк")
+    data = np.empty((len(columns), n))
+    for j, column in enumerate(columns):
+        data[j] = [_to_float(x) for x in column[:n]]
+
+    bad = np.isnan(data).any(axis=0)
+    if bad.any():
+        issues.append(f"отброшено строк с пропусками или нечисловыми значениями: {int(bad.sum())}")
+        data = data[:, ~bad]
+
+    n_key = 2 if pressure_dependent else 1
+    _, first = np.unique(data[:n_key].T, axis=0, return_index=True)
+    if len(first) < data.shape[1]:
+        keep = np.zeros(data.shape[1], dtype=bool)
+        keep[first] = True
+        conflicts = 0
+        for i in np.flatnonzero(~keep):
+            same = np.all(data[:n_key, :i] == data[:n_key, i:i + 1], axis=0)
+            conflicts += not np.array_equal(data[n_key:, np.flatnonzero(same)[0]], data[n_key:, i])
+        issues.append(f"отброшено повторяющихся точек: {int((~keep).sum())}"
+                      + (f" (с другими значениями свойств: {conflicts})" if conflicts else ""))
+        data = data[:, keep]
+
+    if pressure_dependent:
+        monotonic = all(np.all(np.diff(data[0, data[1] == p]) > 0) for p in np.unique(data[1]))
+        order = np.lexsort((data[0], data[1]))
+    else:
+        monotonic = bool(np.all(np.diff(data[0]) > 0))
+        order = np.argsort(data[0], kind="stable")
+    if not monotonic:
+        issues.append("температуры не возрастают вдоль изобар, строки отсортированы" if pressure_dependent
+                      else "температуры не возрастают, строки отсортированы")
+        data = data[:, order]
+
+    if not issues:
+        return columns, issues
+    return [row.tolist() for row in data], issues
+def _to_float(value):
+    """Приводит значение ячейки к float (нечисловые значения — NaN)."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+def coverage_report(name_ohl):
+    """
+    Отчёт о покрытии таблицы зарегистрированного охладителя.
+
+    Показывает заранее, какие рабочие точки уйдут на медленные пути (экстраполяцию):
+    диапазоны T и p, число изобар, недостающие узлы сетки T × p, наибольший шаг по T
+    и долю прямоугольника T × p вне выпуклой оболочки точек.
+
+    Args:
+        name_ohl (str): Название охладителя.
+
+    Returns:
+        dict: Показатели покрытия таблицы.
+    """
+    table = _coolant_cache[name_ohl]
+    if isinstance(table, TemperatureProperties):
+        return {"points": len(table.T), "T_range": (float(table.T[0]), float(table.T[-1])),
+                "max_T_step": float(np.max(np.diff(table.T)))}
+    T, p = table.points[:, 0], table.points[:, 1]
+    T_axis, p_axis = np.unique(T), np.unique(p)
+    box_area = np.ptp(T) * np.ptp(p)
+    hull_area = ConvexHull(table.points).volume if box_area > 0 else 0.0
+    return {
+        "points": len(T),
+        "isobars": len(p_axis),
+        "T_range": (float(T_axis[0]), float(T_axis[-1])),
+        "p_range": (float(p_axis[0]), float(p_axis[-1])),
+        "missing_nodes": len(T_axis) * len(p_axis) - len(T),
+        "max_T_step": float(max((np.max(np.diff(T[p == p_i])) for p_i in p_axis if np.sum(p == p_i) > 1), default=0.0)),
+        "outside_hull": float(1.0 - hull_area / box_area) if box_area > 0 else 0.0,
+    }
+@_locked
+def register_coolant(name_ohl, T_aray, p_aray, report=True, **properties):
+    """
+    Создаёт объект свойств охладителя и сохраняет его в реестре.
+
+    Вызывается при загрузке таблицы в `find_params_ohl`, поэтому триангуляция и интерполяторы
+    строятся один раз за запуск программы. При `report=True` сразу строится сетка свойств
+    и выводится отчёт о её погрешности.
+
+    Returns:
+        CoolantProperties: Зарегистрированный объект свойств.
+    """
+    coolant = CoolantProperties(name_ohl, T_aray, p_aray, **properties)
+    _coolant_cache[name_ohl] = coolant
+    for cache_key in [k for k in _rbf_cache if k[0] == name_ohl]:
+        del _rbf_cache[cache_key]  # Модели, подобранные по прежней таблице, больше не нужны
+    if report and PROPERTY_BACKEND in ("grid", "isobar") and properties:
+        grid = coolant.grid
+        worst, error = grid.worst_error()
+        print(f"Сетка свойств '{name_ohl}': {len(grid.T_axis)}×{len(grid.p_axis)} узлов, "
+              f"достроено {grid.filled_nodes}, макс. отклонение от интерполяции по таблице "
+              f"{error * 100:.3f} % ({worst})")
+    return coolant
+@_locked
+def get_coolant(name_ohl, T_aray, p_aray, values):
+    """
+    Возвращает готовый объект свойств охладителя и название столбца `values`.
+
+    Если охладитель ещё не загружен или таблица отличается от зарегистрированной,
+    объект строится заново и заменяет прежний.
+
+    Args:
+        name_ohl (str): Название охладителя.
+        T_aray (list of float): Температуры таблицы.
+        p_aray (list of float): Давления таблицы.
+        values (list of float): Столбец интерполируемого свойства.
+
+    Returns:
+        tuple: (coolant, key) — объект `CoolantProperties` и название свойства в нём.
+    """
+    coolant = _coolant_cache.get(name_ohl)
+    if coolant is None or not coolant.same_grid(T_aray, p_aray):
+        coolant = register_coolant(name_ohl, T_aray, p_aray)
+    key = coolant.key_of(values)
+    if key is None:
+        key = coolant.add_property(f"column_{len(coolant.values)}", values)
+    return coolant, key
+@_locked
+def register_temperature_table(name_ohl, T_aray, **properties):
+    """
+    Создаёт таблицу свойств охладителя без зависимости от давления и сохраняет её в реестре.
+
+    Returns:
+        TemperatureProperties: Зарегистрированная таблица свойств.
+    """
+    table = TemperatureProperties(name_ohl, T_aray, **properties)
+    _coolant_cache[name_ohl] = table
+    return table
+@_locked
+def get_temperature_table(name_ohl, T_aray, values):
+    """
+    Возвращает готовую таблицу свойств охладителя без зависимости от давления и название столбца `values`.
+
+    Args:
+        name_ohl (str): Название охладителя.
+        T_aray (list of float): Температуры таблицы.
+        values (list of float): Столбец интерполируемого свойства.
+
+    Returns:
+        tuple: (table, key) — объект `TemperatureProperties` и название свойства в нём.
+    """
+    table = _coolant_cache.get(name_ohl)
+    if not isinstance(table, TemperatureProperties) or not table.same_grid(T_aray):
+        table = register_temperature_table(name_ohl, T_aray)
+    key = table.key_of(values)
+    if key is None:
+        key = table.add_property(f"column_{len(table.values)}", values)
+    return table, key
+@_locked
+def get_enthalpy_table(name_ohl, T_aray, p_aray, C_aray):
+    """
+    Возвращает таблицу энтальпии охладителя, построенную один раз по столбцу теплоёмкости.
+
+    Для охладителей с зависимостью от давления интеграл берётся от сплайнов изобар
+    (`IsobarProperties`), для остальных — от линейной интерполяции таблицы по температуре
+    (с той же линейной экстраполяцией, что и в `interpolate_C`).
+
+    Args:
+        name_ohl (str): Название охладителя.
+        T_aray (list of float): Температуры таблицы.
+        p_aray (list of float): Давления таблицы (для простых охладителей не используются).
+        C_aray (list of float): Столбец теплоёмкости.
+
+    Returns:
+        EnthalpyTable: Таблица энтальпии и обратной функции.
+    """
+    if name_ohl in COMPLEX_COMPONENTS:
+        coolant, key = get_coolant(name_ohl, T_aray, p_aray, C_aray)
+    else:
+        coolant, key = get_temperature_table(name_ohl, T_aray, C_aray)
+    entry = _enthalpy_cache.get((name_ohl, key))
+    if entry is not None and entry[0] is coolant:
+        return entry[1]
+    if name_ohl in COMPLEX_COMPONENTS:
+        isobars = coolant.isobars
+        table = EnthalpyTable(isobars.T_axis, isobars.p_axis, isobars.coefficients[key])
+    else:
+        values = coolant.values[key]
+        slope = np.diff(values) / np.diff(coolant.T)
+        zeros = np.zeros_like(slope)
+        table = EnthalpyTable(coolant.T, [0.0], np.stack((zeros, zeros, slope, values[:-1]))[:, :, None],
+                              extrapolate=True)
+    _enthalpy_cache[(name_ohl, key)] = (coolant, table)
+    return table
+def resample_to_grid(coolant, shape=None, method=None):
+    """
+    Пересчитывает таблицу охладителя с разбросанными точками (T, p) на прямоугольную сетку.
+
+    По умолчанию осями сетки служат все различные значения T и p из таблицы, так что исходные
+    точки становятся её узлами, а недостающие узлы достраиваются интерполяцией по разбросанным
+    точкам (экстраполяцией — вне выпуклой оболочки). Затем считается отклонение сетки от
+    кубической интерполяции по разбросанным точкам в серединах ячеек внутри выпуклой оболочки
+    (в узлах сетка совпадает с ней по построению) и от исходных значений таблицы (не равно нулю
+    только для равномерной сетки `shape`).
+
+    Args:
+        coolant (CoolantProperties): Объект свойств охладителя.
+        shape (tuple of int, optional): (n_T, n_p) для равномерной сетки; по умолчанию `GRID_SHAPE`.
+        method (str, optional): "linear" или "cubic"; по умолчанию `GRID_METHOD`.
+
+    Returns:
+        GridProperties: Свойства на сетке с заполненными `report` и `filled_nodes`.
+    """
+    shape = GRID_SHAPE if shape is None else shape
+    method = GRID_METHOD if method is None else method
+    T_src = coolant.points[:, 0]
+    p_src = coolant.points[:, 1]
+    if shape is None:
+        T_axis = np.unique(T_src)
+        p_axis = np.unique(p_src)
+    else:
+        T_axis = np.linspace(T_src.min(), T_src.max(), shape[0])
+        p_axis = np.linspace(p_src.min(), p_src.max(), shape[1])
+
+    TT, PP = np.meshgrid(T_axis, p_axis, indexing='ij')
+    keys = tuple(coolant.values)
+    nodes = coolant.evaluate_scattered(keys, TT.ravel(), PP.ravel())
+    grid = GridProperties(T_axis, p_axis, {key: nodes[:, j].reshape(TT.shape) for j, key in enumerate(keys)}, method)
+
+    # Отчёт о погрешности: середины ячеек внутри оболочки и исходные точки таблицы
+    T_mid, p_mid = np.meshgrid(0.5 * (T_axis[1:] + T_axis[:-1]), 0.5 * (p_axis[1:] + p_axis[:-1]), indexing='ij')
+    middles = np.column_stack((T_mid.ravel(), p_mid.ravel()))
+    middles = middles[coolant.hull.contains(middles)]
+    reference = coolant.evaluate_scattered(keys, middles[:, 0], middles[:, 1])
+    for j, key in enumerate(keys):
+        exact = np.concatenate((reference[:, j], coolant.values[key]))
+        error = np.abs(np.concatenate((grid(key, middles[:, 0], middles[:, 1]), grid(key, T_src, p_src))) - exact)
+        grid.report[key] = (float(error.max()), float(np.max(error / np.maximum(np.abs(exact), 1e-300))))
+    source_nodes = set(map(tuple, coolant.points))
+    grid.filled_nodes = sum((T_i, p_i) not in source_nodes for T_i, p_i in zip(TT.ravel(), PP.ravel()))
+    return grid
+@_locked
+def get_extrapolator(coolant, key, neighbors=None):
+    """
+    Возвращает подобранный `RBFInterpolator` для свойства охладителя.
+
+    Полный подбор по таблице — плотная система O(N³), поэтому модель строится один раз
+    и хранится в кэше. При превышении `RBF_CACHE_SIZE` вытесняется модель,
+    которая дольше всех не использовалась.
+
+    Args:
+        coolant (CoolantProperties): Объект свойств охладителя.
+        key (str): Название свойства.
+        neighbors (int, optional): Число ближайших точек для локального подбора
+            (None — подбор по всей таблице).
+
+    Returns:
+        RBFInterpolator: Экстраполятор свойства.
+    """
+    if neighbors is not None:
+        neighbors = min(int(neighbors), len(coolant.points))
+    cache_key = (coolant.name_ohl, key, neighbors)
+    entry = _rbf_cache.get(cache_key)
+    if entry is not None and entry[0] is coolant:
+        _rbf_cache.move_to_end(cache_key)
+        return entry[1]
+    rbf = RBFInterpolator(coolant.points, coolant.values[key], kernel='thin_plate_spline', neighbors=neighbors)
+    _rbf_cache[cache_key] = (coolant, rbf)
+    while len(_rbf_cache) > RBF_CACHE_SIZE:
+        _rbf_cache.popitem(last=False)
+    return rbf
+def evaluate_properties(name_ohl, T_input, p_input, T_aray, p_aray, columns):
+    """
+    Пакетно вычисляет свойства охладителя во всех узлах канала.
+
+    Для охладителей с зависимостью от давления используется общий интерполятор `CoolantProperties`,
+    для остальных — `TemperatureProperties` с одним поиском интервалов для всех столбцов.
+
+    Args:
+        name_ohl (str): Название охладителя.
+        T_input (array-like): Температуры узлов, К.
+        p_input (array-like): Давления узлов, МПа (для простых охладителей не используются).
+        T_aray (list of float): Температуры таблицы.
+        p_aray (list of float): Давления таблицы.
+        columns (tuple of list): Столбцы свойств таблицы.
+
+    Returns:
+        list of np.ndarray: Значения каждого свойства во всех узлах, в порядке `columns`.
+    """
+    T_input = np.asarray(T_input, dtype=float)
+    if name_ohl in COMPLEX_COMPONENTS:
+        keys = []
+        for arr in columns:
+            coolant, key = get_coolant(name_ohl, T_aray, p_aray, arr)
+            keys.append(key)
+        p_input = np.asarray(p_input, dtype=float)[:len(T_input)]
+        values = coolant.evaluate(keys, T_input, p_input)
+        return [values[:, j] for j in range(len(columns))]
+    keys = []
+    for arr in columns:
+        table, key = get_temperature_table(name_ohl, T_aray, arr)
+        keys.append(key)
+    values = table.evaluate(keys, T_input)
+    return [values[:, j] for j in range(len(columns))]
+def file_sha256(file_path):
+    """Возвращает SHA-256 содержимого файла."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+def read_table_cache(file_path):
+    """
+    Читает столбцы таблицы свойств из двоичного кэша, если он соответствует исходному файлу.
+
+    Кэш считается действительным, если совпадают время изменения и размер исходного `.xlsx`;
+    при расхождении времени сверяется хэш содержимого (после копирования файла кэш не теряется).
+
+    Args:
+        file_path (str): Путь к исходному `.xlsx`.
+
+    Returns:
+        list of list or None: Столбцы таблицы либо None, если кэша нет или он устарел.
+    """
+    cache_path = file_path + TABLE_CACHE_SUFFIX
+    meta_path = cache_path + ".json"
+    try:
+        with open(meta_path, encoding='utf-8') as file:
+            meta = json.load(file)
+        stat = os.stat(file_path)
+        if meta["size"] != stat.st_size:
+            return None
+        if meta["mtime_ns"] != stat.st_mtime_ns:
+            if meta["sha256"] != file_sha256(file_path):
+                return None
+            meta["mtime_ns"] = stat.st_mtime_ns
+            _write_json_atomic(meta_path, meta)
+        data = np.load(cache_path, mmap_mode='r')  # Отображение в память, без разбора Excel
+    except (OSError, ValueError, KeyError):
+        return None
+    return [column[~np.isnan(column)].tolist() for column in data]
+def write_table_cache(file_path, columns):
+    """
+    Сохраняет столбцы таблицы свойств в двоичный кэш рядом с исходным файлом.
+
+    Столбцы хранятся одним массивом float64 (столбец × строка), короткие столбцы дополняются NaN.
+    Запись выполняется через временный файл, поэтому параллельные процессы не видят недописанный кэш.
+    Ошибки записи (например, каталог только для чтения) не прерывают расчёт.
+
+    Args:
+        file_path (str): Путь к исходному `.xlsx`.
+        columns (list of list): Столбцы таблицы.
+    """
+    cache_path = file_path + TABLE_CACHE_SUFFIX
+    data = np.full((len(columns), max(len(column) for column in columns)), np.nan)
+    for i, column in enumerate(columns):
+        data[i, :len(column)] = column
+    stat = os.stat(file_path)
+    meta = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": file_sha256(file_path)}
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as file:
+            np.save(file, data)
+        os.replace(tmp_path, cache_path)
+        _write_json_atomic(cache_path + ".json", meta)
+    except OSError as e:
+        print(f"⚠️ Не удалось сохранить кэш таблицы {file_path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+def _write_json_atomic(path, data):
+    """Записывает JSON через временный файл и атомарную замену."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        json.dump(data, file)
+    os.replace(tmp_path, path)
+@_locked
+def clear_extrapolator_cache():
+    """Очищает кэш экстраполяторов."""
+    _rbf_cache.clear()
+@_locked
+def clear_coolant_cache():
+    """Очищает реестр загруженных охладителей (и таблиц по температуре) и кэш экстраполяторов."""
+    _coolant_cache.clear()
+    _rbf_cache.clear()
+    _enthalpy_cache.clear()
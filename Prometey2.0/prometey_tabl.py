@@ -9,7 +9,8 @@
 Модуль используется для документирования результатов и визуального контроля.
 """
 from prometey_functions import *
-from scipy.interpolate import griddata, RBFInterpolator, interp1d
+from prometey_properties import evaluate_properties
+from prometey_kernels import friction_losses
 from itertools import islice
 def tabl_1(X, Y):
     print('')
@@ -124,60 +125,14 @@ def tabl_3(q_kon,q_l,q_sum,X,betta,T_st_otn,lambd,S_1):
 def tabl_4(T_ohl,C_p_raznitsa,C_p_ohl,p_ohl,f,m_ohl,d_g,delta_reb,h,beta_reb,t,lambda_st_vn,T_aray, p_aray, rho_aray, C_aray, mu_aray, lambda_aray, K_aray,name_ohl):
     print('')
     print('-----------------------------------Таблица 4-------------------------------------')
-    lambda_ohl=[]
-    mu_ohl=[]
-    K_ohl=[]
-    rho_ohl=[]
-    u_ohl=[]
-    alpha_ohl=[]
-    k=0
-    Bio=[]
-    psi=[]
-    E=[]
-    kpd_r=[]
+    n = len(T_ohl)
     t = np.array(t)
     t = t *0.001
-    complex_components = {"Водород", "АТ", "Кислород", "Гелий", "Аммиак", "Метан"}
-
-    if name_ohl in complex_components:
-        # p_aray обязателен!
-        points = np.column_stack((T_aray, p_aray))
-
-        for i, p_i in zip(T_ohl, p_ohl):
-            test_point = np.array([i, p_i])
-
-            def safe_interp(arr):
-                if is_inside(points, test_point):
-                    val = griddata(points, arr, (i, p_i), method='cubic')
-                else:
-                    rbf = RBFInterpolator(points, arr, kernel='thin_plate_spline')
-                    val = rbf([[i, p_i]])[0]
-                return float(val)
-            lambda_ohl.append(safe_interp(lambda_aray))
-            mu_ohl.append(safe_interp(mu_aray))
-            K_ohl.append(safe_interp(K_aray))
-            rho_ohl.append(safe_interp(rho_aray))
-
-    else:
-        # Только T_aray, никаких p_aray
-        def interp_1d(arr):
-            f = interp1d(T_aray, arr, kind='linear', fill_value='extrapolate')
-            return float(f(i))
-
-        for i in T_ohl:
-            lambda_ohl.append(interp_1d(lambda_aray))
-            mu_ohl.append(interp_1d(mu_aray))
-            K_ohl.append(interp_1d(K_aray))
-            rho_ohl.append(interp_1d(rho_aray))
-    k=0
-    for i in T_ohl:
-        u_ohl.append(m_ohl[k]/(f[k]*rho_ohl[k]))
-        alpha_ohl.append((0.023*K_ohl[k]*((m_ohl[k]/f[k])**0.8))/((d_g[k]*0.001)**0.2))
-        Bio.append(alpha_ohl[k]/(lambda_st_vn[k]/delta_reb))
-        psi.append((h/delta_reb)*((2*Bio[k])**(0.5)))# МАЗЕРАТТИ# МАЗЕРАТТИ# МАЗЕРАТТИ# МАЗЕРАТТИ# МАЗЕРАТТИ
-        E.append(math.tanh(psi[k]) / psi[k])  # МАЗЕРАТТИ
-        kpd_r.append(1 + ((1 / math.cos(beta_reb)) * (2 * (h / t[k]) * E[k] - (delta_reb / t[k]))))
-        k+=1
+    # Все четыре свойства вычисляются одним пакетным проходом по профилю канала
+    lambda_ohl, mu_ohl, K_ohl, rho_ohl = evaluate_properties(name_ohl, T_ohl, p_ohl, T_aray, p_aray,
+                                                             (lambda_aray, mu_aray, K_aray, rho_aray))
+    u_ohl, alpha_ohl, E, kpd_r = find_rebro_params(rho_ohl, K_ohl, f, m_ohl, d_g, delta_reb, h, beta_reb, t,
+                                                   lambda_st_vn, n)
     print("u_ohl:", len(u_ohl))
     print("T_ohl:", len(T_ohl))
     print("C_p_ohl:", len(C_p_ohl))
@@ -211,62 +166,23 @@ def tabl_4(T_ohl,C_p_raznitsa,C_p_ohl,p_ohl,f,m_ohl,d_g,delta_reb,h,beta_reb,t,l
     print(df_filled)
     print('---------------------------------------------------------------------------------')
     print('')
-    return u_ohl,T_ohl,C_p_raznitsa ,C_p_ohl,lambda_ohl,mu_ohl,K_ohl,rho_ohl,alpha_ohl,E,kpd_r
+    return u_ohl,T_ohl,C_p_raznitsa ,C_p_ohl,lambda_ohl.tolist(),mu_ohl.tolist(),K_ohl.tolist(),rho_ohl.tolist(),alpha_ohl,E,kpd_r
 def tabl_4_AT_NDMG(ind_peret,T_ohl,C_p_raznitsa,C_p_ohl,p_ohl,f,m_ohl,d_g,delta_reb,h,beta_reb,t,lambda_st_vn,T_aray_1, p_aray_1, rho_aray_1, C_aray_1, mu_aray_1, lambda_aray_1, K_aray_1,T_aray_2, p_aray_2, rho_aray_2, C_aray_2, mu_aray_2, lambda_aray_2, K_aray_2,name_ohl):
     print('')
     print('-----------------------------------Таблица 4-------------------------------------')
-    lambda_ohl = []
-    mu_ohl = []
-    K_ohl = []
-    rho_ohl = []
-    u_ohl = []
-    alpha_ohl = []
-    k = 0
-    Bio = []
-    psi = []
-    E = []
-    kpd_r = []
+    n = len(T_ohl)
     t = np.array(t)
     t = t * 0.001
 
     # Только T_aray, никаких p_aray
-    def interp_1d(arr):
-        f = interp1d(T_aray_2, arr, kind='linear', fill_value='extrapolate')
-        return float(f(i))
-
-    for i in T_ohl[:ind_peret]:
-        lambda_ohl.append(interp_1d(lambda_aray_2))
-        mu_ohl.append(interp_1d(mu_aray_2))
-        K_ohl.append(interp_1d(K_aray_2))
-        rho_ohl.append(interp_1d(rho_aray_2))
-
+    props_2 = evaluate_properties('НДМГ', T_ohl[:ind_peret], None, T_aray_2, p_aray_2,
+                                  (lambda_aray_2, mu_aray_2, K_aray_2, rho_aray_2))
     # p_aray обязателен!
-    points = np.column_stack((T_aray_1, p_aray_1))
-
-    for i, p_i in zip(T_ohl[ind_peret:], p_ohl[ind_peret:]):
-        test_point = np.array([i, p_i])
-
-        def safe_interp(arr):
-            if is_inside(points, test_point):
-                val = griddata(points, arr, (i, p_i), method='cubic')
-            else:
-                rbf = RBFInterpolator(points, arr, kernel='thin_plate_spline')
-                val = rbf([[i, p_i]])[0]
-            return float(val)
-
-        lambda_ohl.append(safe_interp(lambda_aray_1))
-        mu_ohl.append(safe_interp(mu_aray_1))
-        K_ohl.append(safe_interp(K_aray_1))
-        rho_ohl.append(safe_interp(rho_aray_1))
-    k = 0
-    for i in T_ohl:
-        u_ohl.append(m_ohl[k] / (f[k] * rho_ohl[k]))
-        alpha_ohl.append((0.023 * K_ohl[k] * ((m_ohl[k] / f[k]) ** 0.8)) / ((d_g[k] * 0.001) ** 0.2))
-        Bio.append(alpha_ohl[k] / (lambda_st_vn[k] / delta_reb))
-        psi.append((h / delta_reb) * ((2 * Bio[k]) ** (0.5)))  # МАЗЕРАТТИ# МАЗЕРАТТИ# МАЗЕРАТТИ# МАЗЕРАТТИ# МАЗЕРАТТИ
-        E.append(math.tanh(psi[k]) / psi[k])  # МАЗЕРАТТИ
-        kpd_r.append(1 + ((1 / math.cos(beta_reb)) * (2 * (h / t[k]) * E[k] - (delta_reb / t[k]))))
-        k += 1
+    props_1 = evaluate_properties('АТ', T_ohl[ind_peret:], p_ohl[ind_peret:], T_aray_1, p_aray_1,
+                                  (lambda_aray_1, mu_aray_1, K_aray_1, rho_aray_1))
+    lambda_ohl, mu_ohl, K_ohl, rho_ohl = [np.concatenate((a_2, a_1)) for a_2, a_1 in zip(props_2, props_1)]
+    u_ohl, alpha_ohl, E, kpd_r = find_rebro_params(rho_ohl, K_ohl, f, m_ohl, d_g, delta_reb, h, beta_reb, t,
+                                                   lambda_st_vn, n)
     # Создание DataFrame
     df = pd.DataFrame({
         'T_охл': T_ohl,
@@ -289,7 +205,7 @@ def tabl_4_AT_NDMG(ind_peret,T_ohl,C_p_raznitsa,C_p_ohl,p_ohl,f,m_ohl,d_g,delta_
     print(df_filled)
     print('---------------------------------------------------------------------------------')
     print('')
-    return u_ohl,T_ohl,C_p_raznitsa ,C_p_ohl,lambda_ohl,mu_ohl,K_ohl,rho_ohl,alpha_ohl,E,kpd_r
+    return u_ohl,T_ohl,C_p_raznitsa ,C_p_ohl,lambda_ohl.tolist(),mu_ohl.tolist(),K_ohl.tolist(),rho_ohl.tolist(),alpha_ohl,E,kpd_r
 def tabl_5(c,delta_sheroh,u_ohl,rho_ohl,d_g,mu_ohl,t_N,delta_reb,h,delta_x_s,beta_reb,p_ohl,variant_ohl,ind_peret=0,p_ohl_2=0):
     p_ohl=p_ohl*1000000
     p_ohl_2 = p_ohl_2 * 1000000
@@ -306,25 +222,29 @@ def tabl_5(c,delta_sheroh,u_ohl,rho_ohl,d_g,mu_ohl,t_N,delta_reb,h,delta_x_s,bet
     p_itog=[]
     l=[]
     i=0
-    for rho,u,d,mu,t,x_s in zip(rho_ohl,u_ohl,d_g,mu_ohl,t_N,delta_x_s):
-        Re.append(rho*u*d*0.001/mu)
-        delta_sheroh_otn.append(delta_sheroh/(d*0.001))
-        omega.append((np.interp(((t*0.001-delta_reb)/h), x, y, left=y[0], right=y[-1])))
-        Re_gr.append(560/delta_sheroh_otn[i])
-        if Re[i]<=3500:
-            epsilon.append(64*omega[i]/Re[i])
-        elif 3500<Re[i]<=Re_gr[i]:
-            if 0.01<=delta_sheroh_otn[i]<=0.6001:
-                epsilon.append(0.1*((1.46*delta_sheroh_otn[i]+(100/Re[i]))**0.25)*omega[i])
+    if active_backend() != "python":
+        Re, delta_sheroh_otn, Re_gr, epsilon, l, delta_p = (values.tolist() for values in friction_losses(
+            c, delta_sheroh, u_ohl, rho_ohl, d_g, mu_ohl, t_N, delta_reb, h, delta_x_s, beta_reb, x, y))
+    else:
+        for rho,u,d,mu,t,x_s in zip(rho_ohl,u_ohl,d_g,mu_ohl,t_N,delta_x_s):
+            Re.append(rho*u*d*0.001/mu)
+            delta_sheroh_otn.append(delta_sheroh/(d*0.001))
+            omega.append((np.interp(((t*0.001-delta_reb)/h), x, y, left=y[0], right=y[-1])))
+            Re_gr.append(560/delta_sheroh_otn[i])
+            if Re[i]<=3500:
+                epsilon.append(64*omega[i]/Re[i])
+            elif 3500<Re[i]<=Re_gr[i]:
+                if 0.01<=delta_sheroh_otn[i]<=0.6001:
+                    epsilon.append(0.1*((1.46*delta_sheroh_otn[i]+(100/Re[i]))**0.25)*omega[i])
+                else:
+                    epsilon.append((1.42*omega[i])/((math.log10(Re[i]/delta_sheroh_otn[i]))**2))
             else:
-                epsilon.append((1.42*omega[i])/((math.log10(Re[i]/delta_sheroh_otn[i]))**2))
-        else:
-            epsilon.append(omega[i]/((2*math.log10(3.7/delta_sheroh_otn[i]))**2))
-        l.append(x_s/(math.cos(beta_reb)))
-        delta_p.append(c*epsilon[i]*rho*u*u*0.5*l[i]/(d*0.001))
-        if i!=len(rho_ohl)-1:
-            delta_p_sum+=delta_p[i]
-        i += 1
+                epsilon.append(omega[i]/((2*math.log10(3.7/delta_sheroh_otn[i]))**2))
+            l.append(x_s/(math.cos(beta_reb)))
+            delta_p.append(c*epsilon[i]*rho*u*u*0.5*l[i]/(d*0.001))
+            if i!=len(rho_ohl)-1:
+                delta_p_sum+=delta_p[i]
+            i += 1
 
     if variant_ohl==1 or variant_ohl==5:
         q=0